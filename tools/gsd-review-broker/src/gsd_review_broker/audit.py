@@ -3,9 +3,17 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable
 
 import aiosqlite
 
+# Compact separators keep stored metadata small; readers json.loads() it either way.
+_METADATA_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+_INSERT_EVENT_SQL = """INSERT INTO audit_events
+           (review_id, event_type, actor, old_status, new_status, metadata, created_at)
+           VALUES (?, ?, ?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))"""
+
 
 async def record_event(
     db: aiosqlite.Connection,
@@ -21,10 +29,32 @@ async def record_event(
     Must be called INSIDE an existing BEGIN IMMEDIATE...COMMIT block.
     The caller is responsible for transaction management.
     """
-    metadata_json = json.dumps(metadata) if metadata else None
+    metadata_json = _METADATA_ENCODER.encode(metadata) if metadata else None
     await db.execute(
-        """INSERT INTO audit_events
-           (review_id, event_type, actor, old_status, new_status, metadata, created_at)
-           VALUES (?, ?, ?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))""",
+        _INSERT_EVENT_SQL,
         (review_id, event_type, actor, old_status, new_status, metadata_json),
     )
+
+
+async def record_events_batch(
+    db: aiosqlite.Connection,
+    review_ids: Iterable[str | None],
+    event_type: str,
+    actor: str | None = None,
+    old_status: str | None = None,
+    new_status: str | None = None,
+    metadata: dict | None = None,
+) -> None:
+    """Record the same audit event for several reviews with one executemany.
+
+    The metadata is encoded once and shared by every row. Same transaction
+    rules as record_event: call INSIDE an existing BEGIN IMMEDIATE...COMMIT block.
+    """
+    metadata_json = _METADATA_ENCODER.encode(metadata) if metadata else None
+    await db.executemany(
+        _INSERT_EVENT_SQL,
+        [
+            (review_id, event_type, actor, old_status, new_status, metadata_json)
+            for review_id in review_ids
+        ],
+    )
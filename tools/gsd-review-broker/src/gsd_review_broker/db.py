@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import os
 import secrets
+import sqlite3
 import sys
-from collections.abc import AsyncIterator, Callable
+from collections.abc import AsyncIterator, Callable, Coroutine
 from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -16,10 +18,11 @@ from typing import Any
 import aiosqlite
 from fastmcp import FastMCP
 
-from gsd_review_broker.audit import record_event
+from gsd_review_broker.audit import record_event, record_events_batch
 from gsd_review_broker.config_schema import load_spawn_config
 from gsd_review_broker.notifications import QUEUE_TOPIC, NotificationBus
 from gsd_review_broker.pool import ReviewerPool
+from gsd_review_broker.write_batcher import WriteBatcher
 
 DB_FILENAME = "codex_review_broker.sqlite3"
 DB_CONFIG_DIRNAME = "gsd-review-broker"
@@ -28,6 +31,8 @@ CONFIG_PATH_ENV_VAR = "BROKER_CONFIG_PATH"
 REPO_ROOT_ENV_VAR = "BROKER_REPO_ROOT"
 logger = logging.getLogger("gsd_review_broker")
 _PROACTOR_CONNECTION_LOST_CALLBACK = "_ProactorBasePipeTransport._call_connection_lost"
+# UPDATE ... RETURNING needs SQLite 3.35+; older builds fall back to SELECT + UPDATE.
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
 
 SCHEMA_SQL = """\
 CREATE TABLE IF NOT EXISTS reviews (
@@ -67,56 +72,116 @@ CREATE TABLE IF NOT EXISTS messages (
 CREATE INDEX IF NOT EXISTS idx_messages_review ON messages(review_id, round);
 """
 
-SCHEMA_MIGRATIONS: list[str] = [
+SCHEMA_MIGRATIONS_TABLE_SQL = """\
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version     INTEGER PRIMARY KEY,
+    applied_at  TEXT NOT NULL DEFAULT (datetime('now'))
+)"""
+
+# Versions are append-only: never renumber or reuse an entry once shipped.
+SCHEMA_MIGRATIONS: list[tuple[int, str]] = [
     # Phase 2 migrations
-    "ALTER TABLE reviews ADD COLUMN description TEXT",
-    "ALTER TABLE reviews ADD COLUMN diff TEXT",
-    "ALTER TABLE reviews ADD COLUMN affected_files TEXT",
+    (1, "ALTER TABLE reviews ADD COLUMN description TEXT"),
+    (2, "ALTER TABLE reviews ADD COLUMN diff TEXT"),
+    (3, "ALTER TABLE reviews ADD COLUMN affected_files TEXT"),
     # Phase 3 migrations
-    "ALTER TABLE reviews ADD COLUMN priority TEXT NOT NULL DEFAULT 'normal'",
-    "ALTER TABLE reviews ADD COLUMN current_round INTEGER NOT NULL DEFAULT 1",
-    "ALTER TABLE reviews ADD COLUMN counter_patch TEXT",
-    "ALTER TABLE reviews ADD COLUMN counter_patch_affected_files TEXT",
-    "ALTER TABLE reviews ADD COLUMN counter_patch_status TEXT",
+    (4, "ALTER TABLE reviews ADD COLUMN priority TEXT NOT NULL DEFAULT 'normal'"),
+    (5, "ALTER TABLE reviews ADD COLUMN current_round INTEGER NOT NULL DEFAULT 1"),
+    (6, "ALTER TABLE reviews ADD COLUMN counter_patch TEXT"),
+    (7, "ALTER TABLE reviews ADD COLUMN counter_patch_affected_files TEXT"),
+    (8, "ALTER TABLE reviews ADD COLUMN counter_patch_status TEXT"),
     # Phase 4 migrations
-    "ALTER TABLE reviews ADD COLUMN category TEXT",
+    (9, "ALTER TABLE reviews ADD COLUMN category TEXT"),
     # Phase 6 migrations
-    "ALTER TABLE reviews ADD COLUMN skip_diff_validation INTEGER NOT NULL DEFAULT 0",
+    (10, "ALTER TABLE reviews ADD COLUMN skip_diff_validation INTEGER NOT NULL DEFAULT 0"),
     # Phase 7 migrations
-    "ALTER TABLE reviews ADD COLUMN project TEXT",
+    (11, "ALTER TABLE reviews ADD COLUMN project TEXT"),
     # Phase 5 migrations -- audit_events table
-    """CREATE TABLE IF NOT EXISTS audit_events (
-        id          INTEGER PRIMARY KEY AUTOINCREMENT,
-        review_id   TEXT,
-        event_type  TEXT NOT NULL,
-        actor       TEXT,
-        old_status  TEXT,
-        new_status  TEXT,
-        metadata    TEXT,
-        created_at  TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
-    )""",
-    "CREATE INDEX IF NOT EXISTS idx_audit_review ON audit_events(review_id)",
-    "CREATE INDEX IF NOT EXISTS idx_audit_type ON audit_events(event_type)",
+    (
+        12,
+        """CREATE TABLE IF NOT EXISTS audit_events (
+            id          INTEGER PRIMARY KEY AUTOINCREMENT,
+            review_id   TEXT,
+            event_type  TEXT NOT NULL,
+            actor       TEXT,
+            old_status  TEXT,
+            new_status  TEXT,
+            metadata    TEXT,
+            created_at  TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
+        )""",
+    ),
+    (13, "CREATE INDEX IF NOT EXISTS idx_audit_review ON audit_events(review_id)"),
+    (14, "CREATE INDEX IF NOT EXISTS idx_audit_type ON audit_events(event_type)"),
     # Phase 7 migrations -- reviewer pool
-    """CREATE TABLE IF NOT EXISTS reviewers (
-        id                  TEXT PRIMARY KEY,
-        display_name        TEXT NOT NULL,
-        session_token       TEXT NOT NULL,
-        status              TEXT NOT NULL DEFAULT 'active'
-                            CHECK(status IN ('active', 'draining', 'terminated')),
-        pid                 INTEGER,
-        spawned_at          TEXT NOT NULL DEFAULT (datetime('now')),
-        last_active_at      TEXT NOT NULL DEFAULT (datetime('now')),
-        terminated_at       TEXT,
-        reviews_completed   INTEGER NOT NULL DEFAULT 0,
-        total_review_seconds REAL NOT NULL DEFAULT 0.0,
-        approvals           INTEGER NOT NULL DEFAULT 0,
-        rejections          INTEGER NOT NULL DEFAULT 0
-    )""",
-    "CREATE INDEX IF NOT EXISTS idx_reviewers_session ON reviewers(session_token)",
-    "CREATE INDEX IF NOT EXISTS idx_reviewers_status ON reviewers(status)",
-    "ALTER TABLE reviews ADD COLUMN claim_generation INTEGER NOT NULL DEFAULT 0",
-    "ALTER TABLE reviews ADD COLUMN claimed_at TEXT",
+    (
+        15,
+        """CREATE TABLE IF NOT EXISTS reviewers (
+            id                  TEXT PRIMARY KEY,
+            display_name        TEXT NOT NULL,
+            session_token       TEXT NOT NULL,
+            status              TEXT NOT NULL DEFAULT 'active'
+                                CHECK(status IN ('active', 'draining', 'terminated')),
+            pid                 INTEGER,
+            spawned_at          TEXT NOT NULL DEFAULT (datetime('now')),
+            last_active_at      TEXT NOT NULL DEFAULT (datetime('now')),
+            terminated_at       TEXT,
+            reviews_completed   INTEGER NOT NULL DEFAULT 0,
+            total_review_seconds REAL NOT NULL DEFAULT 0.0,
+            approvals           INTEGER NOT NULL DEFAULT 0,
+            rejections          INTEGER NOT NULL DEFAULT 0
+        )""",
+    ),
+    (16, "CREATE INDEX IF NOT EXISTS idx_reviewers_session ON reviewers(session_token)"),
+    (17, "CREATE INDEX IF NOT EXISTS idx_reviewers_status ON reviewers(status)"),
+    (18, "ALTER TABLE reviews ADD COLUMN claim_generation INTEGER NOT NULL DEFAULT 0"),
+    (19, "ALTER TABLE reviews ADD COLUMN claimed_at TEXT"),
+    # Per-file rows mirroring reviews.affected_files for indexed path lookups
+    (
+        20,
+        """CREATE TABLE IF NOT EXISTS review_files (
+            review_id   TEXT NOT NULL REFERENCES reviews(id),
+            path        TEXT NOT NULL,
+            operation   TEXT NOT NULL,
+            added       INTEGER NOT NULL DEFAULT 0,
+            removed     INTEGER NOT NULL DEFAULT 0
+        )""",
+    ),
+    (21, "CREATE INDEX IF NOT EXISTS idx_review_files_path ON review_files(path)"),
+    (22, "CREATE INDEX IF NOT EXISTS idx_review_files_review ON review_files(review_id)"),
+    (
+        23,
+        """INSERT INTO review_files (review_id, path, operation, added, removed)
+           SELECT reviews.id,
+                  json_extract(file.value, '$.path'),
+                  json_extract(file.value, '$.operation'),
+                  json_extract(file.value, '$.added'),
+                  json_extract(file.value, '$.removed')
+           FROM reviews, json_each(reviews.affected_files) AS file
+           WHERE json_valid(reviews.affected_files)
+             AND NOT EXISTS (
+                 SELECT 1 FROM review_files WHERE review_files.review_id = reviews.id
+             )""",
+    ),
+    (24, "CREATE INDEX IF NOT EXISTS idx_reviews_claimed_by ON reviews(claimed_by)"),
+    # Queue ordering: a virtual column lets list_reviews sort straight off an index
+    (
+        25,
+        """ALTER TABLE reviews ADD COLUMN priority_rank INTEGER GENERATED ALWAYS AS (
+            CASE COALESCE(priority, 'normal')
+                WHEN 'critical' THEN 0 WHEN 'normal' THEN 1 WHEN 'low' THEN 2
+            END
+        ) VIRTUAL""",
+    ),
+    (
+        26,
+        """CREATE INDEX IF NOT EXISTS idx_reviews_queue
+           ON reviews(status, priority_rank, created_at)""",
+    ),
+    (
+        27,
+        """CREATE INDEX IF NOT EXISTS idx_reviews_project_queue
+           ON reviews(status, project, priority_rank, created_at)""",
+    ),
 ]
 
 
@@ -125,22 +190,59 @@ class AppContext:
     """Application context holding the database connection."""
 
     db: aiosqlite.Connection
-    write_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    write_lock: WriteBatcher = field(init=False)
     repo_root: str | None = None
     notifications: NotificationBus = field(default_factory=NotificationBus)
     pool: ReviewerPool | None = None
+    read_db: aiosqlite.Connection | None = None
+    background_tasks: set[asyncio.Task] = field(default_factory=set)
+
+    def __post_init__(self) -> None:
+        self.write_lock = WriteBatcher(self.db)
+
+    def spawn_background(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        """Run follow-up work after a tool has replied, keeping a reference until it ends."""
+        task = asyncio.create_task(coro)
+        self.background_tasks.add(task)
+        task.add_done_callback(self.background_tasks.discard)
+        return task
+
+    @property
+    def reader(self) -> aiosqlite.Connection:
+        """Connection for read-only queries that must not queue behind writes."""
+        return self.read_db if self.read_db is not None else self.db
 
 
 async def ensure_schema(db: aiosqlite.Connection) -> None:
-    """Create tables and indexes if they don't exist, then apply migrations."""
+    """Create tables and indexes if they don't exist, then apply pending migrations.
+
+    Applied migration versions are recorded in ``schema_migrations`` so warm
+    starts only read that table instead of re-running every ALTER TABLE.
+    """
     await db.executescript(SCHEMA_SQL)
-    for migration in SCHEMA_MIGRATIONS:
+    await db.execute(SCHEMA_MIGRATIONS_TABLE_SQL)
+    cursor = await db.execute("SELECT version FROM schema_migrations")
+    applied = {row[0] for row in await cursor.fetchall()}
+    pending = [(version, sql) for version, sql in SCHEMA_MIGRATIONS if version not in applied]
+    if pending:
         try:
-            await db.execute(migration)
-        except aiosqlite.OperationalError as exc:
-            # Idempotent migration: ignore only duplicate-column errors.
-            if "duplicate column name" not in str(exc).lower():
-                raise
+            await db.execute("BEGIN IMMEDIATE")
+            for version, migration in pending:
+                try:
+                    await db.execute(migration)
+                except aiosqlite.OperationalError as exc:
+                    # Legacy databases predate schema_migrations and may already
+                    # carry the column; ignore only duplicate-column errors.
+                    if "duplicate column name" not in str(exc).lower():
+                        raise
+                await db.execute(
+                    "INSERT INTO schema_migrations (version) VALUES (?)",
+                    (version,),
+                )
+            await db.execute("COMMIT")
+        except Exception:
+            await _rollback_quietly(db)
+            raise
     if await _audit_events_review_id_not_null(db):
         await _migrate_audit_events_review_id_nullable(db)
 
@@ -198,8 +300,30 @@ async def _migrate_audit_events_review_id_nullable(db: aiosqlite.Connection) ->
         raise
 
 
+def _find_repo_root(start: str) -> str | None:
+    """Walk upward from ``start`` to the first directory containing ``.git``.
+
+    ``.git`` may be a directory or, for worktrees and submodules, a file.
+    """
+    current = os.path.abspath(start)
+    while True:
+        if os.path.exists(os.path.join(current, ".git")):
+            return current
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
 async def discover_repo_root() -> str | None:
-    """Discover the git repository root directory."""
+    """Discover the git repository root directory.
+
+    Walks up from the working directory first and only spawns
+    ``git rev-parse --show-toplevel`` when no ``.git`` entry is found.
+    """
+    repo_root = _find_repo_root(os.getcwd())
+    if repo_root is not None:
+        return repo_root
     try:
         proc = await asyncio.create_subprocess_exec(
             "git", "rev-parse", "--show-toplevel",
@@ -232,6 +356,12 @@ def _is_windows_proactor_reset_noise(context: dict[str, Any]) -> bool:
     if handle is None:
         return False
 
+    # Inspect the scheduled callback directly instead of formatting the handle repr.
+    callback = getattr(handle, "_callback", None)
+    if callback is not None:
+        return getattr(callback, "__qualname__", "") == _PROACTOR_CONNECTION_LOST_CALLBACK
+    if not type(handle).__name__.endswith("Handle"):
+        return False
     return _PROACTOR_CONNECTION_LOST_CALLBACK in repr(handle)
 
 
@@ -266,22 +396,29 @@ def install_windows_proactor_noise_filter(
     return restore
 
 
-def _default_user_config_dir() -> Path:
-    """Resolve a cross-platform user config directory for broker state."""
+def _user_config_dir_str() -> str:
+    """String form of the user config directory; joined without Path allocations."""
     xdg_config_home = os.environ.get("XDG_CONFIG_HOME")
     if xdg_config_home:
-        return Path(xdg_config_home).expanduser() / DB_CONFIG_DIRNAME
+        return os.path.join(os.path.expanduser(xdg_config_home), DB_CONFIG_DIRNAME)
 
     if os.name == "nt":
         appdata = os.environ.get("APPDATA")
         if appdata:
-            return Path(appdata).expanduser() / DB_CONFIG_DIRNAME
-        return Path.home() / "AppData" / "Roaming" / DB_CONFIG_DIRNAME
+            return os.path.join(os.path.expanduser(appdata), DB_CONFIG_DIRNAME)
+        return os.path.join(os.path.expanduser("~"), "AppData", "Roaming", DB_CONFIG_DIRNAME)
 
     if sys.platform == "darwin":
-        return Path.home() / "Library" / "Application Support" / DB_CONFIG_DIRNAME
+        return os.path.join(
+            os.path.expanduser("~"), "Library", "Application Support", DB_CONFIG_DIRNAME
+        )
+
+    return os.path.join(os.path.expanduser("~"), ".config", DB_CONFIG_DIRNAME)
 
-    return Path.home() / ".config" / DB_CONFIG_DIRNAME
+
+def _default_user_config_dir() -> Path:
+    """Resolve a cross-platform user config directory for broker state."""
+    return Path(_user_config_dir_str())
 
 
 def resolve_db_path(repo_root: str | None) -> Path:
@@ -295,9 +432,9 @@ def resolve_db_path(repo_root: str | None) -> Path:
 
     configured_path = os.environ.get(DB_PATH_ENV_VAR)
     if configured_path:
-        return Path(configured_path).expanduser()
+        return Path(os.path.expanduser(configured_path))
 
-    return _default_user_config_dir() / DB_FILENAME
+    return Path(os.path.join(_user_config_dir_str(), DB_FILENAME))
 
 
 async def _rollback_quietly(db: aiosqlite.Connection) -> None:
@@ -308,10 +445,10 @@ async def _rollback_quietly(db: aiosqlite.Connection) -> None:
 def _repo_config_path(repo_root: str | None) -> Path:
     configured_path = os.environ.get(CONFIG_PATH_ENV_VAR)
     if configured_path:
-        return Path(configured_path).expanduser()
+        return Path(os.path.expanduser(configured_path))
 
-    base = Path(repo_root) if repo_root is not None else Path.cwd()
-    return base / ".planning" / "config.json"
+    base = repo_root if repo_root is not None else os.getcwd()
+    return Path(os.path.join(base, ".planning", "config.json"))
 
 
 async def _check_idle_timeouts(ctx: AppContext) -> None:
@@ -378,68 +515,89 @@ async def _check_claim_timeouts(ctx: AppContext) -> None:
         await reclaim_review(row["id"], ctx, reason="claim_timeout")
 
 
+async def _detach_reviews(
+    db: aiosqlite.Connection,
+    *,
+    reviewer_id: str,
+) -> list[tuple[str, str]]:
+    """Release non-claimed open reviews still attached to an exited reviewer.
+
+    Returns ``(review_id, status)`` for each detached review.
+    """
+    if _SQLITE_HAS_RETURNING:
+        cursor = await db.execute(
+            """UPDATE reviews
+               SET claimed_by = NULL,
+                   claimed_at = NULL,
+                   updated_at = datetime('now')
+               WHERE claimed_by = ? AND status NOT IN ('claimed', 'closed')
+               RETURNING id, status""",
+            (reviewer_id,),
+        )
+        detached = [(row["id"], row["status"]) for row in await cursor.fetchall()]
+    else:
+        cursor = await db.execute(
+            """SELECT id, status FROM reviews
+               WHERE claimed_by = ? AND status NOT IN ('claimed', 'closed')""",
+            (reviewer_id,),
+        )
+        detached = [(row["id"], row["status"]) for row in await cursor.fetchall()]
+        if detached:
+            await db.execute(
+                """UPDATE reviews
+                   SET claimed_by = NULL,
+                       claimed_at = NULL,
+                       updated_at = datetime('now')
+                   WHERE claimed_by = ? AND status NOT IN ('claimed', 'closed')""",
+                (reviewer_id,),
+            )
+    if detached:
+        await record_events_batch(
+            db,
+            (review_id for review_id, _status in detached),
+            "review_detached",
+            actor="pool-manager",
+            metadata={
+                "reason": "reviewer_process_exit",
+                "reviewer_id": reviewer_id,
+            },
+        )
+    return detached
+
+
 async def _check_dead_processes(ctx: AppContext) -> None:
     pool = ctx.pool
     if pool is None:
         return
+    exited = [
+        (reviewer_id, proc)
+        for reviewer_id, proc in pool._processes.items()
+        if proc.returncode is not None
+    ]
+    if not exited:
+        return
     from gsd_review_broker.tools import reclaim_review  # local import avoids cycle
 
-    for reviewer_id, proc in list(pool._processes.items()):
-        if proc.returncode is None:
-            continue
-
+    for reviewer_id, proc in exited:
         # If a reviewer process exits while it still owns open reviews, preserve
         # lifecycle semantics and recover claimed work immediately.
         cursor = await ctx.db.execute(
-            """SELECT id, status
+            """SELECT id
                FROM reviews
                WHERE claimed_by = ?
-                 AND status != 'closed'""",
+                 AND status = 'claimed'""",
             (reviewer_id,),
         )
-        attached_rows = await cursor.fetchall()
-
-        detached_review_ids: list[str] = []
-        detached_pending = False
-        for row in attached_rows:
-            if row["status"] == "claimed":
-                await reclaim_review(row["id"], ctx, reason="reviewer_process_exit")
-                continue
-            detached_review_ids.append(row["id"])
-            if row["status"] == "pending":
-                detached_pending = True
-
-        if detached_review_ids:
-            async with ctx.write_lock:
-                await ctx.db.execute("BEGIN IMMEDIATE")
-                try:
-                    for review_id in detached_review_ids:
-                        await ctx.db.execute(
-                            """UPDATE reviews
-                               SET claimed_by = NULL,
-                                   claimed_at = NULL,
-                                   updated_at = datetime('now')
-                               WHERE id = ? AND claimed_by = ?""",
-                            (review_id, reviewer_id),
-                        )
-                        await record_event(
-                            ctx.db,
-                            review_id,
-                            "review_detached",
-                            actor="pool-manager",
-                            metadata={
-                                "reason": "reviewer_process_exit",
-                                "reviewer_id": reviewer_id,
-                            },
-                        )
-                    await ctx.db.execute("COMMIT")
-                except Exception:
-                    await _rollback_quietly(ctx.db)
-                    raise
-            for review_id in detached_review_ids:
-                ctx.notifications.notify(review_id)
-            if detached_pending:
-                ctx.notifications.notify(QUEUE_TOPIC)
+        for row in await cursor.fetchall():
+            await reclaim_review(row["id"], ctx, reason="reviewer_process_exit")
+
+        detached = await ctx.write_lock.submit(
+            functools.partial(_detach_reviews, reviewer_id=reviewer_id)
+        )
+        topics = [review_id for review_id, _status in detached]
+        if any(status == "pending" for _review_id, status in detached):
+            topics.append(QUEUE_TOPIC)
+        ctx.notifications.notify_many(topics)
 
         cursor = await ctx.db.execute(
             """SELECT COUNT(*) AS n
@@ -495,43 +653,35 @@ async def _periodic_check(ctx: AppContext, name: str = "scaling") -> None:
                 logger.exception("background check failed: %s", label)
 
 
-async def _startup_terminate_stale_reviewers(ctx: AppContext) -> int:
-    pool = ctx.pool
-    if pool is None:
-        return 0
-    stale_ids: list[str] = []
-    async with ctx.write_lock:
-        try:
-            await ctx.db.execute("BEGIN IMMEDIATE")
-            cursor = await ctx.db.execute(
-                """SELECT id FROM reviewers
-                   WHERE status IN ('active', 'draining')
-                     AND session_token != ?""",
-                (pool.session_token,),
-            )
-            rows = await cursor.fetchall()
-            stale_ids = [row["id"] for row in rows]
-            if stale_ids:
-                placeholders = ", ".join("?" for _ in stale_ids)
-                await ctx.db.execute(
-                    f"""UPDATE reviewers
-                        SET status = 'terminated', terminated_at = datetime('now')
-                        WHERE id IN ({placeholders})""",
-                    stale_ids,
-                )
-            await ctx.db.execute("COMMIT")
-        except Exception:
-            await _rollback_quietly(ctx.db)
-            raise
-    return len(stale_ids)
+async def _terminate_stale_reviewers(db: aiosqlite.Connection, *, session_token: str) -> int:
+    """Mark reviewers left over from previous broker sessions as terminated."""
+    cursor = await db.execute(
+        """SELECT id FROM reviewers
+           WHERE status IN ('active', 'draining')
+             AND session_token != ?""",
+        (session_token,),
+    )
+    stale = [row["id"] for row in await cursor.fetchall()]
+    if stale:
+        placeholders = ", ".join("?" for _ in stale)
+        await db.execute(
+            f"""UPDATE reviewers
+                SET status = 'terminated', terminated_at = datetime('now')
+                WHERE id IN ({placeholders})""",
+            stale,
+        )
+    return len(stale)
 
 
-async def _startup_ownership_sweep(ctx: AppContext) -> int:
-    pool = ctx.pool
-    if pool is None:
-        return 0
-    cursor = await ctx.db.execute(
-        """SELECT id, claimed_by FROM reviews
+async def _reclaim_orphaned_claims(db: aiosqlite.Connection, *, session_token: str) -> list[str]:
+    """Return claimed reviews not owned by a live current-session reviewer to pending.
+
+    Bulk equivalent of ``reclaim_review(reason="stale_session")`` for use inside
+    one startup transaction. Orphaned owners belong to earlier sessions, so none
+    of them can be a draining reviewer that needs finalizing.
+    """
+    cursor = await db.execute(
+        """SELECT id, claimed_by, claim_generation FROM reviews
            WHERE status = 'claimed'
              AND (
                  claimed_by IS NULL
@@ -540,19 +690,64 @@ async def _startup_ownership_sweep(ctx: AppContext) -> int:
                      WHERE session_token = ? AND status IN ('active', 'draining')
                  )
              )""",
-        (pool.session_token,),
+        (session_token,),
     )
     rows = await cursor.fetchall()
     if not rows:
-        return 0
-    from gsd_review_broker.tools import reclaim_review  # local import avoids cycle
-
-    reclaimed = 0
+        return []
+    review_ids = [row["id"] for row in rows]
+    placeholders = ", ".join("?" for _ in review_ids)
+    await db.execute(
+        f"""UPDATE reviews
+            SET status = 'pending',
+                claimed_by = NULL,
+                claimed_at = NULL,
+                claim_generation = claim_generation + 1,
+                updated_at = datetime('now')
+            WHERE id IN ({placeholders})""",
+        review_ids,
+    )
     for row in rows:
-        result = await reclaim_review(row["id"], ctx, reason="stale_session")
-        if "error" not in result:
-            reclaimed += 1
-    return reclaimed
+        await record_event(
+            db,
+            row["id"],
+            "review_reclaimed",
+            actor="pool-manager",
+            old_status="claimed",
+            new_status="pending",
+            metadata={
+                "old_reviewer": row["claimed_by"],
+                "reason": "stale_session",
+                "claim_generation": int(row["claim_generation"] or 0) + 1,
+            },
+        )
+    return review_ids
+
+
+def _notify_reclaimed(ctx: AppContext, review_ids: list[str]) -> None:
+    if not review_ids:
+        return
+    ctx.notifications.notify_many([*review_ids, QUEUE_TOPIC])
+
+
+async def _startup_recover_stale_session(ctx: AppContext) -> tuple[int, int]:
+    """Terminate stale reviewers and reclaim their reviews in one transaction.
+
+    Returns ``(stale_terminated, reclaimed)``.
+    """
+    pool = ctx.pool
+    if pool is None:
+        return (0, 0)
+    session_token = pool.session_token
+
+    async def _recover(db: aiosqlite.Connection) -> tuple[int, list[str]]:
+        terminated = await _terminate_stale_reviewers(db, session_token=session_token)
+        review_ids = await _reclaim_orphaned_claims(db, session_token=session_token)
+        return terminated, review_ids
+
+    terminated, review_ids = await ctx.write_lock.submit(_recover)
+    _notify_reclaimed(ctx, review_ids)
+    return (terminated, len(review_ids))
 
 
 async def _startup_reactive_scale_check(ctx: AppContext) -> None:
@@ -586,14 +781,28 @@ async def broker_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     db = await aiosqlite.connect(
         str(db_path),
         isolation_level=None,  # CRITICAL: enables manual BEGIN IMMEDIATE
+        # sqlite3 reuses prepared statements by SQL text; the tools' fixed statements
+        # plus list_reviews' filter variants outgrow the default 128-entry cache.
+        cached_statements=512,
     )
     db.row_factory = aiosqlite.Row
     await db.execute("PRAGMA journal_mode=WAL")
     await db.execute("PRAGMA busy_timeout=5000")
     await db.execute("PRAGMA synchronous=NORMAL")
     await db.execute("PRAGMA foreign_keys=ON")
+    await db.execute("PRAGMA temp_store=MEMORY")
+    await db.execute("PRAGMA cache_size=-65536")
     await ensure_schema(db)
 
+    # list_reviews long-polls get their own connection (and aiosqlite thread) so
+    # they don't queue behind the writer's statements; WAL lets them read every
+    # committed write without blocking it.
+    read_db = await aiosqlite.connect(str(db_path), isolation_level=None)
+    read_db.row_factory = aiosqlite.Row
+    await read_db.execute("PRAGMA busy_timeout=5000")
+    await read_db.execute("PRAGMA query_only=ON")
+    await read_db.execute("PRAGMA cache_size=-65536")
+
     pool: ReviewerPool | None = None
     try:
         spawn_config = load_spawn_config(config_path, repo_root=repo_root)
@@ -611,15 +820,14 @@ async def broker_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
                 repo_root=repo_root,
             )
 
-    ctx = AppContext(db=db, repo_root=repo_root, pool=pool)
+    ctx = AppContext(db=db, repo_root=repo_root, pool=pool, read_db=read_db)
 
     from gsd_review_broker.dashboard import set_app_context
     set_app_context(ctx)
 
     background_task: asyncio.Task | None = None
     if pool is not None:
-        stale_terminated = await _startup_terminate_stale_reviewers(ctx)
-        reclaimed = await _startup_ownership_sweep(ctx)
+        stale_terminated, reclaimed = await _startup_recover_stale_session(ctx)
         await _startup_reactive_scale_check(ctx)
         logger.info(
             "Reviewer pool enabled: session=%s stale_terminated=%s reclaimed=%s",
@@ -638,8 +846,14 @@ async def broker_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
                 background_task.cancel()
                 with suppress(asyncio.CancelledError):
                     await background_task
+            if ctx.background_tasks:
+                await asyncio.gather(*ctx.background_tasks, return_exceptions=True)
             if ctx.pool is not None:
                 await ctx.pool.shutdown_all(db, ctx.write_lock)
+            await ctx.write_lock.aclose()
+            await read_db.close()
+            # Refresh planner statistics for the queue indexes; cheap when nothing changed.
+            await db.execute("PRAGMA optimize")
             await db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
             await db.close()
         finally:
@@ -4,15 +4,26 @@ from __future__ import annotations
 
 import asyncio
 import json
+import re
 
 from unidiff import PatchSet
 
+# Compact separators keep the stored affected_files column small.
+_AFFECTED_FILES_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+# git apply needs at least one of these lines to find a patch; text without
+# any of them is rejected here instead of paying for a subprocess.
+_PATCH_HEADER_RE = re.compile(r"^(?:diff --git |--- |\+\+\+ |@@ )", re.MULTILINE)
+_NO_PATCH_ERROR = 'error: No valid patches in input (allow with "--allow-empty")'
+
 
 async def validate_diff(diff_text: str, cwd: str | None = None) -> tuple[bool, str]:
     """Validate a unified diff against the working tree using git apply --check.
 
     Returns (True, "") if the diff applies cleanly, or (False, error_message) otherwise.
     """
+    if _PATCH_HEADER_RE.search(diff_text) is None:
+        return (False, _NO_PATCH_ERROR)
     proc = await asyncio.create_subprocess_exec(
         "git", "apply", "--check",
         stdin=asyncio.subprocess.PIPE,
@@ -26,16 +37,18 @@ async def validate_diff(diff_text: str, cwd: str | None = None) -> tuple[bool, s
     return (False, stderr.decode("utf-8", errors="replace").strip())
 
 
-def extract_affected_files(diff_text: str) -> str:
-    """Parse a unified diff and return JSON describing affected files.
+def parse_affected_files(diff_text: str) -> tuple[str, list[dict[str, str | int]]]:
+    """Parse a unified diff into affected-file entries.
 
-    Each entry contains: path, operation (create/delete/modify), added, removed.
-    Returns "[]" on parse failure.
+    Returns the JSON blob stored on the review alongside the parsed entries, so
+    callers can persist per-file rows without decoding the JSON again. Each entry
+    contains: path, operation (create/delete/modify), added, removed.
+    Returns ("[]", []) on parse failure.
     """
     try:
         patch = PatchSet(diff_text)
     except Exception:
-        return "[]"
+        return ("[]", [])
 
     files: list[dict[str, str | int]] = []
     for patched_file in patch:
@@ -53,4 +66,13 @@ def extract_affected_files(diff_text: str) -> str:
             "removed": patched_file.removed,
         })
 
-    return json.dumps(files)
+    return (_AFFECTED_FILES_ENCODER.encode(files), files)
+
+
+def extract_affected_files(diff_text: str) -> str:
+    """Parse a unified diff and return JSON describing affected files.
+
+    Each entry contains: path, operation (create/delete/modify), added, removed.
+    Returns "[]" on parse failure.
+    """
+    return parse_affected_files(diff_text)[0]
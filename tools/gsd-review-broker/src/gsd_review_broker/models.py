@@ -84,7 +84,7 @@ class AgentIdentity(BaseModel):
 class Review(BaseModel):
     """A review record tracking the lifecycle of a proposed change."""
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     status: ReviewStatus = ReviewStatus.PENDING
     intent: str
     description: str | None = None
@@ -8,17 +8,56 @@ can be notified without polling the database.
 from __future__ import annotations
 
 import asyncio
-import time
+from collections import OrderedDict
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 
+MAX_SLOTS = 4096
+"""Cap on tracked reviews; idle least-recently-used slots are evicted beyond it.
+
+Eviction is safe for callers holding a baseline: a recreated slot starts at the
+bus-wide version clock, so a change made while the slot was gone still reads as
+a change. The remaining cost is a possible spurious wake-up for that caller.
+"""
 
 QUEUE_TOPIC = "__queue__"
 """Reserved topic fired whenever a review enters the pending state (new or revised)."""
 
 
-@dataclass
+@dataclass(slots=True)
+class _ReviewSlot:
+    """Version counter and parked waiters for one review, kept in one dict entry.
+
+    The waiter list only exists while at least one waiter is parked on the review.
+    """
+
+    version: int = 0
+    waiters: list[asyncio.Future[bool]] | None = None
+
+
+def _wake(waiters: list[asyncio.Future[bool]]) -> None:
+    for waiter in waiters:
+        if not waiter.done():
+            waiter.set_result(True)
+
+
+def _expire(waiter: asyncio.Future[bool]) -> None:
+    if not waiter.done():
+        waiter.set_result(False)
+
+
+@dataclass(slots=True)
 class NotificationBus:
-    """Per-review asyncio.Event bus for internal change signaling.
+    """Per-review change bus for internal signaling.
+
+    Waiters park a Future on the review's slot; ``notify`` resolves them directly.
+
+    Versions are drawn from one bus-wide counter that every ``notify`` advances,
+    even for reviews without a slot. A slot created later starts at the current
+    counter, so a waiter holding an older baseline still observes the change.
+    Versions are therefore monotonic per review but do not count its changes,
+    and a fresh slot may report a change that belonged to another review; callers
+    re-check state after waking, so that costs one extra query at most.
 
     Usage:
         bus = NotificationBus()
@@ -33,27 +72,69 @@ class NotificationBus:
         bus.cleanup("review-123")
     """
 
-    _events: dict[str, asyncio.Event] = field(default_factory=dict)
-    _versions: dict[str, int] = field(default_factory=dict)
-
-    def _get_event(self, review_id: str) -> asyncio.Event:
-        """Get or create the event for a review_id."""
-        if review_id not in self._events:
-            self._events[review_id] = asyncio.Event()
-        return self._events[review_id]
+    max_slots: int = MAX_SLOTS
+    _slots: OrderedDict[str, _ReviewSlot] = field(default_factory=OrderedDict)
+    _clock: int = 0
+
+    def _slot(self, review_id: str) -> _ReviewSlot:
+        """Get or create the slot for a review_id, marking it most recently used."""
+        slots = self._slots
+        slot = slots.get(review_id)
+        if slot is not None:
+            slots.move_to_end(review_id)
+            return slot
+        slot = slots[review_id] = _ReviewSlot(self._clock)
+        if len(slots) > self.max_slots:
+            self._evict_idle(keep=review_id)
+        return slot
+
+    def _evict_idle(self, keep: str) -> None:
+        """Drop the least recently used slot, other than ``keep``, with no parked waiters."""
+        for review_id, slot in self._slots.items():
+            if slot.waiters is None and review_id != keep:
+                del self._slots[review_id]
+                return
 
     def current_version(self, review_id: str) -> int:
-        """Return the current notification version for a review."""
-        return self._versions.get(review_id, 0)
+        """Return the current notification version for a review.
+
+        Registers the review's slot, since a caller capturing a baseline is about
+        to wait on it and must not miss a notify that lands in between.
+        """
+        return self._slot(review_id).version
 
     def notify(self, review_id: str) -> None:
         """Signal that a review has changed.
 
-        Increments the review version and sets the event so waiters can wake.
+        Advances the version clock and resolves every parked waiter. Reviews
+        nobody has waited on or taken a baseline for only advance the clock.
         """
-        self._versions[review_id] = self.current_version(review_id) + 1
-        event = self._get_event(review_id)
-        event.set()
+        self._clock += 1
+        slots = self._slots
+        slot = slots.get(review_id)
+        if slot is None:
+            return
+        slots.move_to_end(review_id)
+        slot.version = self._clock
+        waiters = slot.waiters
+        if waiters is not None:
+            slot.waiters = None
+            _wake(waiters)
+
+    def notify_many(self, review_ids: Iterable[str]) -> None:
+        """Signal several reviews in one pass; same semantics as calling notify() for each."""
+        self._clock += 1
+        version = self._clock
+        slots = self._slots
+        for review_id in review_ids:
+            slot = slots.get(review_id)
+            if slot is not None:
+                slots.move_to_end(review_id)
+                slot.version = version
+                waiters = slot.waiters
+                if waiters is not None:
+                    slot.waiters = None
+                    _wake(waiters)
 
     async def wait_for_change(
         self,
@@ -68,27 +149,29 @@ class NotificationBus:
         from that value. Without since_version, it waits for the next change
         from the current point-in-time.
         """
-        event = self._get_event(review_id)
-        baseline = self.current_version(review_id) if since_version is None else since_version
-        deadline = time.monotonic() + timeout
-
-        while True:
-            if self.current_version(review_id) != baseline:
-                return True
-
-            remaining = deadline - time.monotonic()
-            if remaining <= 0:
-                return False
-
-            try:
-                await asyncio.wait_for(event.wait(), timeout=remaining)
-            except TimeoutError:
-                return False
-
-            # Consume this wake and re-check version in loop.
-            event.clear()
+        slot = self._slot(review_id)
+        if since_version is not None and slot.version != since_version:
+            return True
+        if timeout <= 0:
+            return False
+
+        loop = asyncio.get_running_loop()
+        waiter: asyncio.Future[bool] = loop.create_future()
+        if slot.waiters is None:
+            slot.waiters = [waiter]
+        else:
+            slot.waiters.append(waiter)
+        handle = loop.call_later(timeout, _expire, waiter)
+        try:
+            return await waiter
+        finally:
+            handle.cancel()
+            waiters = slot.waiters
+            if waiters is not None and waiter in waiters:
+                waiters.remove(waiter)
+                if not waiters:
+                    slot.waiters = None
 
     def cleanup(self, review_id: str) -> None:
-        """Remove the event for a closed review."""
-        self._events.pop(review_id, None)
-        self._versions.pop(review_id, None)
+        """Remove the slot for a closed review."""
+        self._slots.pop(review_id, None)
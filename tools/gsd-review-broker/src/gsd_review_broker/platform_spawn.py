@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import re
 import shlex
@@ -13,10 +14,29 @@ CLAIM_GENERATION_NOTE = (
     "IMPORTANT: When submitting a verdict, always pass the claim_generation value "
     "you received from claim_review. This prevents stale verdict submissions after reclaim."
 )
+_CODEX_ARGV_HEAD = (
+    "codex",
+    "exec",
+    "--sandbox",
+    "read-only",
+    "--ephemeral",
+    # Reviewer workspace roots can be multi-project directories without .git.
+    # Allow execution there and rely on explicit project scoping in broker tools.
+    "--skip-git-repo-check",
+    "--model",
+)
+_REASONING_EFFORT_PREFIX = "model_reasoning_effort="
+_CODEX_CMD_HEAD_QUOTED = " ".join(shlex.quote(arg) for arg in _CODEX_ARGV_HEAD)
+# Match the manual reviewer launcher behavior: initialize nvm when present,
+# then exec codex in the same shell so Node-backed installs resolve.
+_WSL_BASH_PREFIX = "if [ -s ~/.nvm/nvm.sh ]; then . ~/.nvm/nvm.sh; fi; exec "
+_KNOWN_PLACEHOLDER = re.compile(r"\{(reviewer_id|claim_generation_note)\}")
+_UNRESOLVED_PLACEHOLDER = re.compile(r"\{[a-z_]+\}")
 
 
+@functools.cache
 def detect_platform() -> str:
-    """Return normalized platform label used for spawn strategy."""
+    """Return normalized platform label used for spawn strategy (cached per process)."""
     return "windows" if os.name == "nt" else "native"
 
 
@@ -44,40 +64,50 @@ def build_codex_argv(config: SpawnConfig) -> list[str]:
     """Build shell-free argv for reviewer subprocess invocation."""
     workspace_for_spawn = _workspace_path_for_spawn(config.workspace_path)
     codex_args = [
-        "codex",
-        "exec",
-        "--sandbox",
-        "read-only",
-        "--ephemeral",
-        # Reviewer workspace roots can be multi-project directories without .git.
-        # Allow execution there and rely on explicit project scoping in broker tools.
-        "--skip-git-repo-check",
-        "--model",
+        *_CODEX_ARGV_HEAD,
         config.model,
         "-c",
-        f"model_reasoning_effort={config.reasoning_effort}",
+        _REASONING_EFFORT_PREFIX + config.reasoning_effort,
         "-C",
         workspace_for_spawn,
         "-",
     ]
     if detect_platform() == "windows":
-        codex_cmd = " ".join(shlex.quote(arg) for arg in codex_args)
-        # Match the manual reviewer launcher behavior: initialize nvm when present,
-        # then exec codex in the same shell so Node-backed installs resolve.
-        bash_cmd = (
-            "if [ -s ~/.nvm/nvm.sh ]; then . ~/.nvm/nvm.sh; fi; "
-            f"exec {codex_cmd}"
+        quote = shlex.quote
+        codex_cmd = " ".join(
+            [_CODEX_CMD_HEAD_QUOTED]
+            + [quote(arg) for arg in codex_args[len(_CODEX_ARGV_HEAD):]]
         )
-        return ["wsl", "-d", config.wsl_distro, "--", "bash", "-lc", bash_cmd]
+        return ["wsl", "-d", config.wsl_distro, "--", "bash", "-lc", _WSL_BASH_PREFIX + codex_cmd]
     return codex_args
 
 
+@functools.lru_cache(maxsize=8)
+def _read_prompt_template(path: str, mtime_ns: int, size: int) -> str:
+    """Read a template once per (mtime, size); the stat args are only cache keys."""
+    del mtime_ns, size
+    raw = Path(path).read_bytes().decode("utf-8")
+    if "\r" in raw:
+        # Match read_text()'s universal newlines; CRLF checkouts are common on Windows.
+        raw = raw.replace("\r\n", "\n").replace("\r", "\n")
+    return raw
+
+
 def load_prompt_template(template_path: str | Path, reviewer_id: str) -> str:
-    """Load reviewer prompt template and substitute all known placeholders."""
-    raw = Path(template_path).read_text(encoding="utf-8")
-    rendered = raw.replace("{reviewer_id}", reviewer_id)
-    rendered = rendered.replace("{claim_generation_note}", CLAIM_GENERATION_NOTE)
-    unresolved = re.search(r"\{[a-z_]+\}", rendered)
-    if unresolved is not None:
-        raise ValueError(f"Unresolved template placeholder: {unresolved.group(0)}")
+    """Load reviewer prompt template and substitute all known placeholders.
+
+    The file is only re-read when its mtime or size changes, so repeated spawns
+    cost one stat() instead of an open and read.
+    """
+    stat = os.stat(template_path)
+    raw = _read_prompt_template(os.fspath(template_path), stat.st_mtime_ns, stat.st_size)
+    substitutions = {
+        "reviewer_id": reviewer_id,
+        "claim_generation_note": CLAIM_GENERATION_NOTE,
+    }
+    rendered = _KNOWN_PLACEHOLDER.sub(lambda match: substitutions[match.group(1)], raw)
+    if "{" in rendered:
+        unresolved = _UNRESOLVED_PLACEHOLDER.search(rendered)
+        if unresolved is not None:
+            raise ValueError(f"Unresolved template placeholder: {unresolved.group(0)}")
     return rendered
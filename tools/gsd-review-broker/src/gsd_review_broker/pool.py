@@ -8,17 +8,25 @@ import json
 import logging
 import os
 import re
+import signal
 import sys
 import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 import aiosqlite
 
 from gsd_review_broker.audit import record_event
 from gsd_review_broker.config_schema import SpawnConfig
 from gsd_review_broker.platform_spawn import build_codex_argv, load_prompt_template
+from gsd_review_broker.write_batcher import WriteBatcher
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
 
 logger = logging.getLogger("gsd_review_broker")
 USER_CONFIG_DIRNAME = "gsd-review-broker"
@@ -28,6 +36,27 @@ REVIEWER_LOG_MAX_BYTES_ENV_VAR = "BROKER_REVIEWER_LOG_MAX_BYTES"
 REVIEWER_LOG_BACKUPS_ENV_VAR = "BROKER_REVIEWER_LOG_BACKUPS"
 DEFAULT_REVIEWER_LOG_MAX_BYTES = 5 * 1024 * 1024
 DEFAULT_REVIEWER_LOG_BACKUPS = 5
+_STREAM_READ_SIZE = 64 * 1024
+# Reviewer stdout/stderr: StreamReader buffer limit and (Linux) kernel pipe size.
+_PIPE_BUFFER_SIZE = 1024 * 1024
+_UNSAFE_LOG_NAME_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+_NON_ALNUM_RUN = re.compile(r"[^a-z0-9]+")
+_WINDOWS_DRIVE_PATH = re.compile(r"^[A-Za-z]:[\\/]")
+# On POSIX each reviewer leads its own session, so signals reach whatever codex spawned.
+_USE_PROCESS_GROUPS = os.name == "posix"
+
+# Same row record_event("reviewer_terminated", ...) would write, with
+# reviews_completed looked up in the INSERT itself.
+_TERMINATED_EVENT_SQL = """INSERT INTO audit_events
+       (review_id, event_type, actor, old_status, new_status, metadata, created_at)
+       VALUES (NULL, 'reviewer_terminated', 'pool-manager', 'draining', 'terminated',
+               json_object(
+                   'reviewer_id', ?,
+                   'exit_code', ?,
+                   'reviews_completed',
+                   COALESCE((SELECT reviews_completed FROM reviewers WHERE id = ?), 0)
+               ),
+               strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))"""
 
 
 async def _rollback_quietly(db: aiosqlite.Connection) -> None:
@@ -35,6 +64,53 @@ async def _rollback_quietly(db: aiosqlite.Connection) -> None:
         await db.execute("ROLLBACK")
 
 
+def _widen_pipe_buffers(process: asyncio.subprocess.Process) -> None:
+    """Best-effort: grow the kernel buffers of a reviewer's stdout/stderr pipes.
+
+    A bursty reviewer otherwise blocks in write() once the default 64 KiB pipe
+    fills. Only Linux exposes F_SETPIPE_SZ; the kernel may also refuse sizes above
+    /proc/sys/fs/pipe-max-size, in which case the default stays in place.
+    """
+    set_pipe_size = getattr(fcntl, "F_SETPIPE_SZ", None)
+    transport = getattr(process, "_transport", None)
+    if set_pipe_size is None or not isinstance(transport, asyncio.SubprocessTransport):
+        return
+    for fd in (1, 2):
+        pipe_transport = transport.get_pipe_transport(fd)
+        pipe = pipe_transport.get_extra_info("pipe") if pipe_transport is not None else None
+        if pipe is None:
+            continue
+        with contextlib.suppress(OSError):
+            fcntl.fcntl(pipe.fileno(), set_pipe_size, _PIPE_BUFFER_SIZE)
+
+
+def _stop_reviewer_process(process: asyncio.subprocess.Process, *, kill: bool = False) -> None:
+    """Send SIGTERM (or SIGKILL) to a reviewer and, on POSIX, its whole process group."""
+    with contextlib.suppress(ProcessLookupError):
+        # Only subprocesses created by spawn are known to lead their own group.
+        if _USE_PROCESS_GROUPS and isinstance(process, asyncio.subprocess.Process):
+            os.killpg(process.pid, signal.SIGKILL if kill else signal.SIGTERM)
+        elif kill:
+            process.kill()
+        else:
+            process.terminate()
+
+
+async def _pipelined(*statements: Awaitable[Any]) -> list[Any]:
+    """Run statements back to back on the aiosqlite thread, returning their results.
+
+    aiosqlite runs queued calls in submission order, so gathering them saves one
+    event-loop round trip per statement. The caller must already be inside its
+    transaction: every statement runs even if an earlier one fails, and the first
+    error is re-raised afterwards so the caller can roll back.
+    """
+    results = await asyncio.gather(*statements, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
 def _default_user_config_dir() -> Path:
     """Resolve a cross-platform user config directory for global prompt templates."""
     xdg_config_home = os.environ.get("XDG_CONFIG_HOME")
@@ -53,17 +129,48 @@ def _default_user_config_dir() -> Path:
     return Path.home() / ".config" / USER_CONFIG_DIRNAME
 
 
+# (epoch second, "YYYY-MM-DDTHH:MM:SS.") for the most recent _utc_timestamp call.
+_timestamp_prefix_cache: tuple[int, str] = (-1, "")
+
+
 def _utc_timestamp() -> str:
-    return datetime.now(UTC).isoformat(timespec="milliseconds").replace(
-        "+00:00",
-        "Z",
-    )
+    """Return the current UTC time as ``YYYY-MM-DDTHH:MM:SS.mmmZ``.
+
+    Called once per reviewer output line, so the second-resolution prefix is
+    formatted once per second and reused.
+    """
+    global _timestamp_prefix_cache
+    now_ms = time.time_ns() // 1_000_000
+    second, millis = divmod(now_ms, 1000)
+    cached_second, prefix = _timestamp_prefix_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S.", time.gmtime(second))
+        _timestamp_prefix_cache = (second, prefix)
+    return f"{prefix}{millis:03d}Z"
+
+
+def _output_record_prefix(
+    reviewer_id: str, session_token: str, stream_name: str, pid: int | None
+) -> bytes:
+    """Encode the fields shared by every reviewer_output line of one stream, up to ``"ts":"``."""
+    fields = [
+        b'{"event":"reviewer_output","reviewer_id":',
+        json.dumps(reviewer_id).encode("utf-8"),
+        b',"session_token":',
+        json.dumps(session_token).encode("utf-8"),
+        b',"stream":',
+        json.dumps(stream_name).encode("utf-8"),
+    ]
+    if pid is not None:
+        fields += [b',"pid":', str(pid).encode("ascii")]
+    fields.append(b',"ts":"')
+    return b"".join(fields)
 
 
 def _normalize_project_key(project: str | None) -> str:
     if project is None:
         return ""
-    normalized = re.sub(r"[^a-z0-9]+", "", project.strip().lower())
+    normalized = _NON_ALNUM_RUN.sub("", project.strip().lower())
     return normalized
 
 
@@ -71,7 +178,7 @@ def _looks_like_absolute_path(value: str) -> bool:
     if Path(value).is_absolute():
         return True
     # Cross-platform support: Windows drive paths from Linux-hosted broker.
-    return re.match(r"^[A-Za-z]:[\\/]", value) is not None
+    return _WINDOWS_DRIVE_PATH.match(value) is not None
 
 
 def _read_positive_int_env(name: str, default: int, minimum: int) -> int:
@@ -96,58 +203,173 @@ def _read_positive_int_env(name: str, default: int, minimum: int) -> int:
 
 
 class _JsonlRotatingWriter:
-    """Append-only JSONL writer with size-based rotation."""
-
-    def __init__(self, path: Path, *, max_bytes: int, backups: int) -> None:
+    """Append-only JSONL writer with size-based rotation.
+
+    ``write_record`` only encodes the record and puts it on a bounded queue; one
+    consumer task drains whatever has accumulated (up to ``max_batch`` lines) into
+    a single write()+flush(). A quiet reviewer's lines go out immediately, while a
+    chatty one batches naturally behind the in-flight write. The consumer exits
+    once the queue is empty and is restarted by the next record. Blocking
+    write/rotate/close calls run in the default thread executor so disk latency
+    never stalls the event loop.
+
+    The consumer is the only code that touches the file, so there is no lock:
+    ``close`` enqueues a ``None`` sentinel and the consumer closes the file once
+    everything queued before it has been written.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_bytes: int,
+        backups: int,
+        max_batch: int = 256,
+        max_queue: int = 4096,
+    ) -> None:
         self.path = path
         self.max_bytes = max_bytes
         self.backups = backups
-        self._file = None
-        self._lock = asyncio.Lock()
+        self.max_batch = max_batch
+        # Index 0 is the live file; index N is the Nth backup.
+        self._rotated_paths = [str(path)] + [f"{path}.{i}" for i in range(1, backups + 1)]
+        self._fd: int | None = None
+        self._size = 0
+        self._queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=max_queue)
+        self._consumer: asyncio.Task[None] | None = None
+        # Worker-thread job of the current (or a cancelled) consumer.
+        self._in_flight: asyncio.Future[None] | None = None
 
     def _ensure_open(self) -> None:
-        if self._file is not None and not self._file.closed:
+        if self._fd is not None:
             return
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self._file = self.path.open("a", encoding="utf-8")
-
-    def _rotated_path(self, index: int) -> Path:
-        if index == 0:
-            return self.path
-        return Path(f"{self.path}.{index}")
+        # Raw O_APPEND fd: each os.write lands at the end of file with no Python
+        # buffering layer and nothing to flush.
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._size = os.fstat(self._fd).st_size
 
     def _rotate(self) -> None:
-        if self._file is not None and not self._file.closed:
-            self._file.close()
-        oldest = self._rotated_path(self.backups)
-        if oldest.exists():
-            oldest.unlink()
+        self._close_file()
+        paths = self._rotated_paths
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(paths[-1])
         for index in range(self.backups - 1, -1, -1):
-            src = self._rotated_path(index)
-            if not src.exists():
-                continue
-            dst = self._rotated_path(index + 1)
-            src.replace(dst)
-        self._file = None
+            with contextlib.suppress(FileNotFoundError):
+                os.replace(paths[index], paths[index + 1])
         self._ensure_open()
 
-    async def write_record(self, payload: dict[str, object]) -> None:
-        line = json.dumps(payload, separators=(",", ":")) + "\n"
-        encoded_len = len(line.encode("utf-8"))
-        async with self._lock:
-            self._ensure_open()
-            assert self._file is not None
-            self._file.seek(0, os.SEEK_END)
-            if self._file.tell() + encoded_len > self.max_bytes:
+    def _write_lines(self, lines: list[bytes]) -> None:
+        """Write lines, rotating at the same line boundaries as unbuffered writes.
+
+        Runs in a worker thread; the consumer keeps at most one job in flight.
+        """
+        if not lines:
+            return
+        self._ensure_open()
+        chunk: list[bytes] = []
+        for line in lines:
+            if self._size + len(line) > self.max_bytes:
+                if chunk:
+                    self._write_all(b"".join(chunk))
+                    chunk = []
                 self._rotate()
-            self._file.write(line)
-            self._file.flush()
+            chunk.append(line)
+            self._size += len(line)
+        if chunk:
+            self._write_all(b"".join(chunk))
+
+    def _write_all(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._fd, view):]
+
+    def _close_file(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+        self._fd = None
+
+    async def _run_in_worker(self, func: Callable[..., None], *args: object) -> None:
+        previous = self._in_flight
+        if previous is not None and not previous.done():
+            # Left behind by a cancelled consumer; never touch the file alongside it.
+            try:
+                await asyncio.shield(previous)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Failed writing reviewer log batch: path=%s", self.path)
+        self._in_flight = asyncio.get_running_loop().run_in_executor(None, func, *args)
+        # Shielded: cancelling the consumer leaves the worker job running to completion.
+        await asyncio.shield(self._in_flight)
+
+    async def _consume(self) -> None:
+        """Drain the queue in batches, then exit; write_record restarts it on demand."""
+        queue = self._queue
+        try:
+            while not queue.empty():
+                batch: list[bytes] = []
+                taken = 0
+                close_requested = False
+                while len(batch) < self.max_batch and not queue.empty():
+                    line = queue.get_nowait()
+                    taken += 1
+                    if line is None:
+                        close_requested = True
+                        break
+                    batch.append(line)
+                try:
+                    if batch:
+                        await self._run_in_worker(self._write_lines, batch)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.exception("Failed writing reviewer log batch: path=%s", self.path)
+                finally:
+                    try:
+                        if close_requested:
+                            # Runs even if the write failed, so close() never leaks the fd.
+                            await self._close_in_worker()
+                    finally:
+                        for _ in range(taken):
+                            queue.task_done()
+        finally:
+            if self._consumer is asyncio.current_task():
+                self._consumer = None
+
+    def _ensure_consumer(self) -> None:
+        consumer = self._consumer
+        if consumer is None or consumer.done():
+            self._consumer = asyncio.create_task(self._consume())
+
+    async def write_record(self, payload: dict[str, object]) -> None:
+        await self.write_line((json.dumps(payload, separators=(",", ":")) + "\n").encode("utf-8"))
+
+    async def write_line(self, line: bytes) -> None:
+        """Enqueue an already-encoded JSONL line (must end with a newline)."""
+        self._ensure_consumer()
+        # Only suspends once max_queue lines are already waiting (backpressure).
+        await self._queue.put(line)
+
+    async def flush(self) -> None:
+        """Wait until every record enqueued so far has been written."""
+        if not self._queue.empty():
+            self._ensure_consumer()
+        await self._queue.join()
+
+    async def _close_in_worker(self) -> None:
+        try:
+            await self._run_in_worker(self._close_file)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Failed closing reviewer log: path=%s", self.path)
 
     async def close(self) -> None:
-        async with self._lock:
-            if self._file is not None and not self._file.closed:
-                self._file.close()
-            self._file = None
+        """Write everything queued so far, then close the file."""
+        self._ensure_consumer()
+        await self._queue.put(None)
+        await self._queue.join()
 
 
 @dataclass
@@ -165,15 +387,28 @@ class ReviewerPool:
     _project_scopes: dict[str, str | None] = field(default_factory=dict)
     _workspace_paths: dict[str, str] = field(default_factory=dict)
     _spawn_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
-    _last_spawn_time: float = 0.0
+    _terminations: dict[str, asyncio.Task[None]] = field(default_factory=dict)
+    _prompt_path: Path | None = None
+    _log_dir: Path | None = None
+    _last_spawn_time_ns: int = 0
+    _cooldown_ns: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._cooldown_ns = round(self.config.spawn_cooldown_seconds * 1_000_000_000)
 
     @property
     def active_count(self) -> int:
-        """Count running, non-draining reviewer subprocesses."""
+        """Count running, non-draining reviewer subprocesses.
+
+        Deliberately a scan rather than a maintained counter: a reviewer that
+        exits on its own flips ``returncode`` without passing through any pool
+        bookkeeping, and the pool is bounded by ``max_pool_size``.
+        """
+        draining = self._draining
         return sum(
             1
             for reviewer_id, proc in self._processes.items()
-            if proc.returncode is None and reviewer_id not in self._draining
+            if proc.returncode is None and reviewer_id not in draining
         )
 
     def is_draining(self, reviewer_id: str) -> bool:
@@ -284,11 +519,13 @@ class ReviewerPool:
         Unscoped reviewers are considered eligible for all non-empty projects.
         """
         target_scope = self._normalize_scope(project)
+        draining = self._draining
+        scopes = self._project_scopes
         count = 0
         for reviewer_id, proc in self._processes.items():
-            if proc.returncode is not None or reviewer_id in self._draining:
+            if proc.returncode is not None or reviewer_id in draining:
                 continue
-            reviewer_scope = self._normalize_scope(self._project_scopes.get(reviewer_id))
+            reviewer_scope = self._normalize_scope(scopes.get(reviewer_id))
             if target_scope == "":
                 if reviewer_scope == "":
                     count += 1
@@ -298,6 +535,16 @@ class ReviewerPool:
         return count
 
     def _resolve_prompt_template_path(self) -> Path:
+        """Resolve the prompt template once; later spawns reuse it while it exists."""
+        cached = self._prompt_path
+        if cached is not None:
+            return cached
+        path = self._find_prompt_template_path()
+        if path.exists():
+            self._prompt_path = path
+        return path
+
+    def _find_prompt_template_path(self) -> Path:
         path = Path(self.config.prompt_template_path).expanduser()
         if path.is_absolute():
             return path
@@ -323,13 +570,18 @@ class ReviewerPool:
         return candidates[0]
 
     def _resolve_reviewer_log_dir(self) -> Path:
-        override = os.environ.get(REVIEWER_LOG_DIR_ENV_VAR)
-        if override:
-            return Path(override).expanduser()
-        return _default_user_config_dir() / "reviewer-logs"
+        log_dir = self._log_dir
+        if log_dir is None:
+            override = os.environ.get(REVIEWER_LOG_DIR_ENV_VAR)
+            if override:
+                log_dir = Path(override).expanduser()
+            else:
+                log_dir = _default_user_config_dir() / "reviewer-logs"
+            self._log_dir = log_dir
+        return log_dir
 
     def _reviewer_log_path(self, reviewer_id: str) -> Path:
-        safe_reviewer_id = re.sub(r"[^A-Za-z0-9._-]", "_", reviewer_id)
+        safe_reviewer_id = _UNSAFE_LOG_NAME_CHARS.sub("_", reviewer_id)
         return self._resolve_reviewer_log_dir() / f"reviewer-{safe_reviewer_id}.jsonl"
 
     async def _write_reviewer_log(
@@ -371,19 +623,44 @@ class ReviewerPool:
         stream_name: str,
         stream: asyncio.StreamReader,
     ) -> None:
+        # Only the timestamp and message vary per line; the rest is encoded once.
+        prefix = _output_record_prefix(reviewer_id, self.session_token, stream_name, pid)
+
+        async def _emit(raw: bytes) -> None:
+            writer = self._log_writers.get(reviewer_id)
+            if writer is None:
+                return
+            message = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+            record = b"".join((
+                prefix,
+                _utc_timestamp().encode("ascii"),
+                b'","message":',
+                json.dumps(message).encode("utf-8"),
+                b"}\n",
+            ))
+            try:
+                await writer.write_line(record)
+            except Exception:
+                logger.exception(
+                    "Failed writing reviewer log record: reviewer_id=%s", reviewer_id
+                )
+
+        # Read whole pipe chunks and split lines here: one resume per chunk instead
+        # of per line, and no StreamReader line-length limit on long output lines.
+        buffer = bytearray()
         try:
             while True:
-                line = await stream.readline()
-                if not line:
+                chunk = await stream.read(_STREAM_READ_SIZE)
+                if not chunk:
                     break
-                message = line.decode("utf-8", errors="replace").rstrip("\r\n")
-                await self._write_reviewer_log(
-                    reviewer_id,
-                    event="reviewer_output",
-                    stream=stream_name,
-                    message=message,
-                    pid=pid,
-                )
+                buffer += chunk
+                start = 0
+                while (newline := buffer.find(b"\n", start)) >= 0:
+                    await _emit(bytes(buffer[start:newline]))
+                    start = newline + 1
+                del buffer[:start]
+            if buffer:
+                await _emit(bytes(buffer))
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -393,6 +670,19 @@ class ReviewerPool:
                 stream_name,
             )
 
+    @staticmethod
+    def _send_prompt(stdin: asyncio.StreamWriter, payload: bytes) -> None:
+        """Hand the prompt to the stdin transport and close it without awaiting drain().
+
+        The pipe transport keeps whatever the kernel didn't take yet and only closes
+        once its buffer is flushed, so nothing on the spawn path waits on the pipe.
+        A reviewer that exits early just breaks the pipe.
+        """
+        with contextlib.suppress(Exception):
+            stdin.write(payload)
+        with contextlib.suppress(Exception):
+            stdin.close()
+
     async def _cleanup_reviewer_logging(
         self,
         reviewer_id: str,
@@ -416,32 +706,93 @@ class ReviewerPool:
     async def spawn_reviewer(
         self,
         db: aiosqlite.Connection,
-        write_lock: asyncio.Lock,
+        write_lock: WriteBatcher,
         *,
         project: str | None = None,
         ignore_cooldown: bool = False,
     ) -> dict:
         """Spawn and persist a reviewer subprocess."""
-        now = time.monotonic()
-        elapsed = now - self._last_spawn_time
-        if not ignore_cooldown and elapsed < self.config.spawn_cooldown_seconds:
-            retry_after = round(self.config.spawn_cooldown_seconds - elapsed, 3)
+        results = await self.spawn_reviewers(
+            db,
+            write_lock,
+            [project],
+            ignore_cooldown=ignore_cooldown,
+        )
+        return results[0]
+
+    async def spawn_reviewers(
+        self,
+        db: aiosqlite.Connection,
+        write_lock: WriteBatcher,
+        projects: list[str | None],
+        *,
+        ignore_cooldown: bool = False,
+    ) -> list[dict]:
+        """Spawn one reviewer per entry in ``projects`` and persist them together.
+
+        Subprocesses are launched one at a time (each one counts against the pool
+        cap), then every reviewer row and spawn event is written in a single
+        transaction. If that insert fails, every reviewer launched by this call is
+        torn down. Returns one result dict per entry, in order, stopping early
+        after a cooldown or cap error.
+        """
+        elapsed_ns = time.monotonic_ns() - self._last_spawn_time_ns
+        if not ignore_cooldown and elapsed_ns < self._cooldown_ns:
+            retry_after = round((self._cooldown_ns - elapsed_ns) / 1_000_000_000, 3)
             logger.info("pool.spawn_reviewer -> blocked by cooldown (retry_after=%ss)", retry_after)
-            return {
-                "error": "Spawn cooldown active",
-                "retry_after_seconds": retry_after,
-            }
-        if self.active_count >= self.config.max_pool_size:
+            return [
+                {
+                    "error": "Spawn cooldown active",
+                    "retry_after_seconds": retry_after,
+                }
+            ]
+
+        results: list[dict] = []
+        launched: list[tuple[int, dict, asyncio.subprocess.Process]] = []
+        for project in projects:
+            if self.active_count >= self.config.max_pool_size:
+                logger.info(
+                    "pool.spawn_reviewer -> blocked by cap (active=%s max=%s)",
+                    self.active_count,
+                    self.config.max_pool_size,
+                )
+                results.append(
+                    {
+                        "error": "Reviewer pool cap reached",
+                        "max_pool_size": self.config.max_pool_size,
+                    }
+                )
+                break
+            result, process = await self._launch_reviewer(project)
+            if process is not None:
+                launched.append((len(results), result, process))
+            results.append(result)
+
+        if not launched:
+            return results
+        try:
+            await self._persist_spawned(db, write_lock, [(r, p) for _, r, p in launched])
+        except Exception as exc:
+            for index, result, process in launched:
+                results[index] = await self._abort_spawn(result["reviewer_id"], process, exc)
+            return results
+
+        for _, result, process in launched:
             logger.info(
-                "pool.spawn_reviewer -> blocked by cap (active=%s max=%s)",
-                self.active_count,
-                self.config.max_pool_size,
+                "pool.spawn_reviewer -> success reviewer_id=%s pid=%s",
+                result["reviewer_id"],
+                process.pid,
             )
-            return {
-                "error": "Reviewer pool cap reached",
-                "max_pool_size": self.config.max_pool_size,
-            }
+        return results
 
+    async def _launch_reviewer(
+        self,
+        project: str | None,
+    ) -> tuple[dict, asyncio.subprocess.Process | None]:
+        """Start a reviewer subprocess and register it in memory (no DB writes).
+
+        Returns the spawn result and the process, or an error result and None.
+        """
         self._counter += 1
         display_name = f"codex-r{self._counter}"
         reviewer_id = f"{display_name}-{self.session_token}"
@@ -507,7 +858,10 @@ class ReviewerPool:
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
+                limit=_PIPE_BUFFER_SIZE,
+                start_new_session=_USE_PROCESS_GROUPS,
             )
+            _widen_pipe_buffers(process)
             stream_tasks: list[asyncio.Task[None]] = []
             if process.stdout is not None:
                 stream_tasks.append(
@@ -531,141 +885,171 @@ class ReviewerPool:
                         )
                     )
                 )
-            self._stream_tasks[reviewer_id] = stream_tasks
             if process.stdin is not None:
-                process.stdin.write(prompt.encode("utf-8"))
-                await process.stdin.drain()
-                process.stdin.close()
+                self._send_prompt(process.stdin, prompt.encode("utf-8"))
+            self._stream_tasks[reviewer_id] = stream_tasks
             self._processes[reviewer_id] = process
             self._project_scopes[reviewer_id] = project_scope
             self._workspace_paths[reviewer_id] = workspace_path
-            self._last_spawn_time = time.monotonic()
+            self._last_spawn_time_ns = time.monotonic_ns()
             await self._write_reviewer_log(
                 reviewer_id,
                 event="reviewer_spawned",
                 pid=process.pid,
                 message=f"project={project_scope or '(any)'} workspace={workspace_path}",
             )
-
-            async with write_lock:
-                try:
-                    await db.execute("BEGIN IMMEDIATE")
-                    await db.execute(
-                        """INSERT INTO reviewers (
-                               id, display_name, session_token, status, pid,
-                               spawned_at, last_active_at
-                           ) VALUES (?, ?, ?, 'active', ?, datetime('now'), datetime('now'))""",
-                        (reviewer_id, display_name, self.session_token, process.pid),
-                    )
-                    await record_event(
-                        db,
-                        None,
-                        "reviewer_spawned",
-                        actor="pool-manager",
-                        new_status="active",
-                        metadata={
-                            "reviewer_id": reviewer_id,
-                            "display_name": display_name,
-                            "pid": process.pid,
-                            "project_scope": project_scope,
-                            "workspace_path": workspace_path,
-                        },
-                    )
-                    await db.execute("COMMIT")
-                except Exception:
-                    await _rollback_quietly(db)
-                    raise
         except Exception as exc:
-            if process is not None and process.returncode is None:
-                process.terminate()
-                with contextlib.suppress(Exception):
-                    await asyncio.wait_for(process.wait(), timeout=2.0)
-            await self._write_reviewer_log(
-                reviewer_id,
-                event="reviewer_spawn_failed",
-                pid=process.pid if process is not None else None,
-                message=str(exc),
-            )
-            await self._cleanup_reviewer_logging(reviewer_id, cancel_tasks=True)
-            self._processes.pop(reviewer_id, None)
-            self._project_scopes.pop(reviewer_id, None)
-            self._workspace_paths.pop(reviewer_id, None)
-            logger.warning("pool.spawn_reviewer -> failed reviewer_id=%s err=%s", reviewer_id, exc)
-            return {"error": f"Failed to spawn reviewer: {exc}"}
+            return await self._abort_spawn(reviewer_id, process, exc), None
 
-        logger.info(
-            "pool.spawn_reviewer -> success reviewer_id=%s pid=%s",
-            reviewer_id,
-            process.pid if process is not None else None,
-        )
         return {
             "reviewer_id": reviewer_id,
             "display_name": display_name,
-            "pid": process.pid if process is not None else None,
+            "pid": process.pid,
             "status": "active",
             "project_scope": project_scope,
             "workspace_path": workspace_path,
-        }
+        }, process
+
+    async def _persist_spawned(
+        self,
+        db: aiosqlite.Connection,
+        write_lock: WriteBatcher,
+        launched: list[tuple[dict, asyncio.subprocess.Process]],
+    ) -> None:
+        """Insert reviewer rows and spawn events for launched reviewers in one transaction."""
+        async with write_lock:
+            try:
+                await db.execute("BEGIN IMMEDIATE")
+                # The batched insert and every event are queued on the aiosqlite thread together.
+                await _pipelined(
+                    db.executemany(
+                        """INSERT INTO reviewers (
+                               id, display_name, session_token, status, pid,
+                               spawned_at, last_active_at
+                           ) VALUES (?, ?, ?, 'active', ?, datetime('now'),
+                                     datetime('now'))""",
+                        [
+                            (
+                                result["reviewer_id"],
+                                result["display_name"],
+                                self.session_token,
+                                process.pid,
+                            )
+                            for result, process in launched
+                        ],
+                    ),
+                    *(
+                        record_event(
+                            db,
+                            None,
+                            "reviewer_spawned",
+                            actor="pool-manager",
+                            new_status="active",
+                            metadata={
+                                "reviewer_id": result["reviewer_id"],
+                                "display_name": result["display_name"],
+                                "pid": process.pid,
+                                "project_scope": result["project_scope"],
+                                "workspace_path": result["workspace_path"],
+                            },
+                        )
+                        for result, process in launched
+                    ),
+                )
+                await db.execute("COMMIT")
+            except Exception:
+                await _rollback_quietly(db)
+                raise
+
+    async def _abort_spawn(
+        self,
+        reviewer_id: str,
+        process: asyncio.subprocess.Process | None,
+        exc: Exception,
+    ) -> dict:
+        """Tear down a reviewer whose spawn failed and return the error result."""
+        if process is not None and process.returncode is None:
+            _stop_reviewer_process(process)
+            with contextlib.suppress(Exception):
+                await asyncio.wait_for(process.wait(), timeout=2.0)
+        await self._write_reviewer_log(
+            reviewer_id,
+            event="reviewer_spawn_failed",
+            pid=process.pid if process is not None else None,
+            message=str(exc),
+        )
+        await self._cleanup_reviewer_logging(reviewer_id, cancel_tasks=True)
+        self._processes.pop(reviewer_id, None)
+        self._project_scopes.pop(reviewer_id, None)
+        self._workspace_paths.pop(reviewer_id, None)
+        logger.warning("pool.spawn_reviewer -> failed reviewer_id=%s err=%s", reviewer_id, exc)
+        return {"error": f"Failed to spawn reviewer: {exc}"}
 
     async def drain_reviewer(
         self,
         reviewer_id: str,
         db: aiosqlite.Connection,
-        write_lock: asyncio.Lock,
+        write_lock: WriteBatcher,
         reason: str = "manual",
     ) -> dict:
         """Mark reviewer as draining and terminate when no open attachments remain."""
         self._draining.add(reviewer_id)
-        remaining_open_reviews = 0
         async with write_lock:
             try:
                 await db.execute("BEGIN IMMEDIATE")
-                await db.execute(
-                    """UPDATE reviewers
-                       SET status = 'draining', last_active_at = datetime('now')
-                       WHERE id = ?""",
-                    (reviewer_id,),
-                )
-                await record_event(
-                    db,
-                    None,
-                    "reviewer_drain_start",
-                    actor="pool-manager",
-                    old_status="active",
-                    new_status="draining",
-                    metadata={"reviewer_id": reviewer_id, "reason": reason},
-                )
-                cursor = await db.execute(
-                    """SELECT COUNT(*) AS n
-                       FROM reviews
-                       WHERE status != 'closed' AND claimed_by = ?""",
-                    (reviewer_id,),
+                await _pipelined(
+                    db.execute(
+                        """UPDATE reviewers
+                           SET status = 'draining', last_active_at = datetime('now')
+                           WHERE id = ?""",
+                        (reviewer_id,),
+                    ),
+                    record_event(
+                        db,
+                        None,
+                        "reviewer_drain_start",
+                        actor="pool-manager",
+                        old_status="active",
+                        new_status="draining",
+                        metadata={"reviewer_id": reviewer_id, "reason": reason},
+                    ),
                 )
-                row = await cursor.fetchone()
-                remaining_open_reviews = int(row["n"]) if row is not None else 0
                 await db.execute("COMMIT")
             except Exception as exc:
                 await _rollback_quietly(db)
                 return {"error": f"Failed to drain reviewer: {exc}"}
 
-        terminated = False
-        if remaining_open_reviews == 0:
-            await self._terminate_reviewer(reviewer_id, db, write_lock)
-            terminated = True
+        # Read-only, so it runs after the write lock is released. A review
+        # attached after this point is handled by the draining-reviewer
+        # finalizer when it closes, same as one attached right after COMMIT.
+        cursor = await db.execute(
+            """SELECT COUNT(*) AS n
+               FROM reviews
+               WHERE status != 'closed' AND claimed_by = ?""",
+            (reviewer_id,),
+        )
+        row = await cursor.fetchone()
+        remaining_open_reviews = int(row["n"]) if row is not None else 0
+
+        terminating = remaining_open_reviews == 0
+        if terminating:
+            # Teardown waits up to 10s for the process to exit; don't hold the caller.
+            self.terminate_in_background(reviewer_id, db, write_lock)
         return {
             "reviewer_id": reviewer_id,
             "status": "draining",
             # Backward-compatible key retained for existing clients.
             "remaining_claims": remaining_open_reviews,
             "remaining_open_reviews": remaining_open_reviews,
-            "terminated": terminated,
+            "terminated": terminating and self.is_terminated(reviewer_id),
+            "terminating": terminating,
         }
 
     async def mark_dead_process_draining(
         self,
         reviewer_id: str,
         db: aiosqlite.Connection,
-        write_lock: asyncio.Lock,
+        write_lock: WriteBatcher,
         *,
         exit_code: int | None,
         open_reviews: int,
@@ -719,22 +1103,73 @@ class ReviewerPool:
             except Exception:
                 await _rollback_quietly(db)
 
+    def terminate_in_background(
+        self,
+        reviewer_id: str,
+        db: aiosqlite.Connection,
+        write_lock: WriteBatcher,
+    ) -> asyncio.Task[None]:
+        """Start reviewer teardown without waiting on it, or join one already running."""
+        task = self._terminations.get(reviewer_id)
+        if task is None or task.done():
+            task = asyncio.create_task(self._terminate_logged(reviewer_id, db, write_lock))
+            self._terminations[reviewer_id] = task
+            task.add_done_callback(
+                lambda done, rid=reviewer_id: self._forget_termination(rid, done)
+            )
+        return task
+
+    def _forget_termination(self, reviewer_id: str, task: asyncio.Task[None]) -> None:
+        if self._terminations.get(reviewer_id) is task:
+            del self._terminations[reviewer_id]
+
+    def is_terminated(self, reviewer_id: str) -> bool:
+        """Return True when no process or pending teardown remains for the reviewer."""
+        return reviewer_id not in self._processes and reviewer_id not in self._terminations
+
+    async def wait_for_termination(
+        self,
+        reviewer_id: str,
+        timeout: float | None = None,
+    ) -> bool:
+        """Wait for a background teardown; returns False if ``timeout`` elapsed first."""
+        task = self._terminations.get(reviewer_id)
+        if task is None:
+            return True
+        done, _ = await asyncio.wait({task}, timeout=timeout)
+        return bool(done)
+
+    async def _terminate_logged(
+        self,
+        reviewer_id: str,
+        db: aiosqlite.Connection,
+        write_lock: WriteBatcher,
+    ) -> None:
+        try:
+            await self._terminate_reviewer(reviewer_id, db, write_lock)
+        except Exception as exc:
+            logger.warning(
+                "pool.terminate_reviewer -> failed reviewer_id=%s err=%s",
+                reviewer_id,
+                exc,
+            )
+
     async def _terminate_reviewer(
         self,
         reviewer_id: str,
         db: aiosqlite.Connection,
-        write_lock: asyncio.Lock,
+        write_lock: WriteBatcher,
     ) -> None:
         """Terminate reviewer subprocess and persist lifecycle state."""
         proc = self._processes.get(reviewer_id)
         exit_code: int | None = None
         if proc is not None:
             if proc.returncode is None:
-                proc.terminate()
+                _stop_reviewer_process(proc)
                 try:
                     await asyncio.wait_for(proc.wait(), timeout=10.0)
                 except TimeoutError:
-                    proc.kill()
+                    _stop_reviewer_process(proc, kill=True)
                     await proc.wait()
             exit_code = proc.returncode
 
@@ -753,30 +1188,16 @@ class ReviewerPool:
         async with write_lock:
             try:
                 await db.execute("BEGIN IMMEDIATE")
-                cursor = await db.execute(
-                    "SELECT reviews_completed FROM reviewers WHERE id = ?",
-                    (reviewer_id,),
-                )
-                row = await cursor.fetchone()
-                reviews_completed = int(row["reviews_completed"]) if row is not None else 0
-                await db.execute(
-                    """UPDATE reviewers
-                       SET status = 'terminated', terminated_at = datetime('now')
-                       WHERE id = ?""",
-                    (reviewer_id,),
-                )
-                await record_event(
-                    db,
-                    None,
-                    "reviewer_terminated",
-                    actor="pool-manager",
-                    old_status="draining",
-                    new_status="terminated",
-                    metadata={
-                        "reviewer_id": reviewer_id,
-                        "exit_code": exit_code,
-                        "reviews_completed": reviews_completed,
-                    },
+                # The event reads reviews_completed in SQL, so both statements are
+                # queued together instead of waiting on a Python-side fetch in between.
+                await _pipelined(
+                    db.execute(
+                        """UPDATE reviewers
+                           SET status = 'terminated', terminated_at = datetime('now')
+                           WHERE id = ?""",
+                        (reviewer_id,),
+                    ),
+                    db.execute(_TERMINATED_EVENT_SQL, (reviewer_id, exit_code, reviewer_id)),
                 )
                 await db.execute("COMMIT")
             except Exception:
@@ -785,24 +1206,34 @@ class ReviewerPool:
     async def shutdown_all(
         self,
         db: aiosqlite.Connection,
-        write_lock: asyncio.Lock,
+        write_lock: WriteBatcher,
     ) -> None:
-        """Terminate all tracked reviewers."""
-        for reviewer_id in list(self._processes.keys()):
-            await self._terminate_reviewer(reviewer_id, db, write_lock)
+        """Terminate all tracked reviewers.
+
+        SIGTERM goes to every process up front so their exit waits overlap;
+        the per-reviewer DB updates still serialize through ``write_lock``.
+        Teardowns already running in the background are joined, not repeated.
+        """
+        for proc in self._processes.values():
+            if proc.returncode is None:
+                _stop_reviewer_process(proc)
+        for reviewer_id in list(self._processes):
+            self.terminate_in_background(reviewer_id, db, write_lock)
+        await asyncio.gather(*self._terminations.values())
 
     async def update_reviewer_stats(
         self,
         reviewer_id: str,
         db: aiosqlite.Connection,
-        write_lock: asyncio.Lock,
+        write_lock: WriteBatcher,
         verdict: str,
         review_duration_seconds: float,
     ) -> None:
         """Increment reviewer performance counters."""
+        # One UPDATE commits atomically in autocommit mode; write_lock only keeps it
+        # from landing inside another task's open transaction on the shared connection.
         async with write_lock:
-            try:
-                await db.execute("BEGIN IMMEDIATE")
+            with contextlib.suppress(Exception):
                 await db.execute(
                     """UPDATE reviewers
                        SET reviews_completed = reviews_completed + 1,
@@ -814,6 +1245,3 @@ class ReviewerPool:
                        WHERE id = ?""",
                     (review_duration_seconds, verdict, verdict, reviewer_id),
                 )
-                await db.execute("COMMIT")
-            except Exception:
-                await _rollback_quietly(db)
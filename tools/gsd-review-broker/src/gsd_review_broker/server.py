@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import argparse
 import contextvars
+import copy
 import json
 import logging
 import os
+import queue
 import sys
-from datetime import UTC, datetime
-from logging.handlers import RotatingFileHandler
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 from fastmcp import FastMCP
@@ -25,6 +27,7 @@ DEFAULT_BROKER_LOG_BACKUPS = 5
 _PERIODIC_SKIP_REASON = "reason=capacity_sufficient"
 _PERIODIC_SKIP_DECISION = "decision=skip"
 _PERIODIC_SCALE_PREFIX = "reactive_scale_check[periodic] ->"
+_LOG_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
 
 mcp = FastMCP(
     "gsd-review-broker",
@@ -60,7 +63,9 @@ class _JsonFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         payload: dict[str, object] = {
-            "ts": datetime.now(UTC).isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+            # msecs is precomputed on every LogRecord; only the seconds need formatting.
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
+            + f".{int(record.msecs):03d}Z",
             "level": record.levelname.lower(),
             "logger": record.name,
             "caller_tag": getattr(record, "caller_tag", caller_tag.get("broker")),
@@ -68,7 +73,43 @@ class _JsonFormatter(logging.Formatter):
         }
         if record.exc_info:
             payload["exception"] = self.formatException(record.exc_info)
-        return json.dumps(payload, separators=(",", ":"))
+        elif record.exc_text:
+            payload["exception"] = record.exc_text
+        return _LOG_JSON_ENCODER.encode(payload)
+
+
+class _FileQueueHandler(QueueHandler):
+    """Hand broker logfile records to a listener thread that owns the file handler.
+
+    The event loop only enqueues; JSON formatting, writes and rotation happen on
+    the listener thread. Closing the handler drains the queue and closes the file.
+    """
+
+    def __init__(self, file_handler: logging.Handler) -> None:
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        super().__init__(log_queue)
+        self.file_handler = file_handler
+        self.listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        self.listener.start()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve everything that depends on the emitting thread or context now;
+        # the record is copied because the console handler formats the original.
+        record = copy.copy(record)
+        record.caller_tag = caller_tag.get("broker")  # type: ignore[attr-defined]
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def close(self) -> None:
+        try:
+            self.listener.stop()
+            self.file_handler.close()
+        finally:
+            super().close()
 
 
 class _ConsoleNoiseFilter(logging.Filter):
@@ -174,10 +215,12 @@ def _configure_logging(*, verbose: bool = False) -> None:
             backupCount=log_backups,
             encoding="utf-8",
         )
-        file_handler._gsd_broker_file_handler = True  # type: ignore[attr-defined]
         file_handler.setLevel(logging.INFO)
         file_handler.setFormatter(_JsonFormatter())
-        logger.addHandler(file_handler)
+        queue_handler = _FileQueueHandler(file_handler)
+        queue_handler._gsd_broker_file_handler = True  # type: ignore[attr-defined]
+        queue_handler.setLevel(logging.INFO)
+        logger.addHandler(queue_handler)
 
 
 # Ensure broker logger is configured even when server is launched without calling main().
@@ -2,28 +2,67 @@
 
 from __future__ import annotations
 
-import asyncio
+import functools
 import json
 import logging
 import math
+import os
 import re
 import time
-import uuid
+from collections import deque
+from collections.abc import Callable
 from contextlib import suppress
+from typing import Any
 
+import aiosqlite
 from fastmcp import Context
 
 from gsd_review_broker.audit import record_event
 from gsd_review_broker.db import AppContext
-from gsd_review_broker.diff_utils import extract_affected_files, validate_diff
+from gsd_review_broker.diff_utils import (
+    extract_affected_files,
+    parse_affected_files,
+    validate_diff,
+)
 from gsd_review_broker.models import ReviewStatus
 from gsd_review_broker.notifications import QUEUE_TOPIC
+from gsd_review_broker.pool import _pipelined
 from gsd_review_broker.priority import infer_priority
 from gsd_review_broker.server import caller_tag, mcp
 from gsd_review_broker.state_machine import validate_transition
 
 logger = logging.getLogger("gsd_review_broker")
 
+_SESSION_SUFFIX_RE = re.compile(r"(.+)-[0-9a-fA-F]{8,}", re.DOTALL)
+_PROJECT_KEY_STRIP_RE = re.compile(r"[^a-z0-9]+")
+
+_LIST_REVIEWS_SELECT = (
+    "SELECT id, status, intent, agent_type, phase, priority, project, category, created_at "
+    "FROM reviews"
+)
+
+# managed_claim: the claimant is a registered (pool or manual) reviewer row.
+_VERDICT_GUARD_SELECT = (
+    "SELECT status, claim_generation, claimed_by, "
+    "EXISTS (SELECT 1 FROM reviewers WHERE id = reviews.claimed_by) AS managed_claim "
+    "FROM reviews WHERE id = ?"
+)
+
+_ID_BATCH = 256
+_id_pool: deque[str] = deque()
+
+
+def _new_id() -> str:
+    """Return a uuid4-format hex id, drawing randomness for 256 ids per urandom call."""
+    if not _id_pool:
+        raw = bytearray(os.urandom(16 * _ID_BATCH))
+        for offset in range(0, len(raw), 16):
+            raw[offset + 6] = (raw[offset + 6] & 0x0F) | 0x40  # version 4
+            raw[offset + 8] = (raw[offset + 8] & 0x3F) | 0x80  # RFC 4122 variant
+        hex_ids = raw.hex()
+        _id_pool.extend(hex_ids[i : i + 32] for i in range(0, len(hex_ids), 32))
+    return _id_pool.popleft()
+
 
 def mcp_tool(*args, **kwargs):
     """FastMCP tool decorator with legacy `.fn` compatibility for tests/internal calls."""
@@ -48,18 +87,35 @@ def mcp_tool(*args, **kwargs):
     return _decorate
 
 
+_CTX_ACCESSORS: tuple[Callable[[Any], AppContext], ...] = (
+    lambda ctx: ctx.lifespan_context,
+    lambda ctx: ctx.request_context.lifespan_context,
+    lambda ctx: ctx.fastmcp._lifespan_result,
+)
+_CTX_RESOLVERS: dict[type, Callable[[Any], AppContext]] = {}
+
+
 def _app_ctx(ctx: Context) -> AppContext:
-    """Resolve the broker AppContext from a FastMCP Context, across versions."""
+    """Resolve the broker AppContext from a FastMCP Context, across versions.
+
+    The accessor that worked last time for this context type is tried first;
+    the full probe only runs on the first call or if that accessor stops working.
+    """
     if ctx is None:
         raise RuntimeError("Missing MCP context")
-    if hasattr(ctx, "lifespan_context"):
-        return ctx.lifespan_context
-    rc = getattr(ctx, "request_context", None)
-    if rc is not None and hasattr(rc, "lifespan_context"):
-        return rc.lifespan_context
-    fm = getattr(ctx, "fastmcp", None)
-    if fm is not None and hasattr(fm, "_lifespan_result"):
-        return fm._lifespan_result
+    cached = _CTX_RESOLVERS.get(type(ctx))
+    if cached is not None:
+        try:
+            return cached(ctx)
+        except AttributeError:
+            pass
+    for accessor in _CTX_ACCESSORS:
+        try:
+            app = accessor(ctx)
+        except AttributeError:
+            continue
+        _CTX_RESOLVERS[type(ctx)] = accessor
+        return app
     raise RuntimeError("Unable to resolve broker lifespan context")
 
 
@@ -80,6 +136,27 @@ async def _rollback_quietly(app: AppContext) -> None:
         await app.db.execute("ROLLBACK")
 
 
+async def _fetchone(db: aiosqlite.Connection, sql: str, params: tuple = ()) -> aiosqlite.Row | None:
+    """Run a single-row read, fetching the row in the same aiosqlite round trip."""
+    rows = await db.execute_fetchall(sql, params)
+    return rows[0] if rows else None
+
+
+async def _begin_immediate(
+    app: AppContext, sql: str, params: tuple = ()
+) -> aiosqlite.Row | None:
+    """Open a write transaction and fetch its first single-row read in the same round trip.
+
+    Only pass a read: if BEGIN fails the statement still runs (in autocommit),
+    and the error is raised afterwards for the caller's rollback path.
+    """
+    _begin, rows = await _pipelined(
+        app.db.execute("BEGIN IMMEDIATE"),
+        app.db.execute_fetchall(sql, params),
+    )
+    return rows[0] if rows else None
+
+
 def _short(review_id: str | None) -> str:
     """Render compact review IDs in logs."""
     if not review_id:
@@ -99,18 +176,15 @@ def _missing(value: str | None) -> bool:
     return value is None or value.strip() == ""
 
 
+@functools.lru_cache(maxsize=1024)
 def _reviewer_tag(reviewer_id: str) -> str:
     """Extract short display name from reviewer_id by stripping session token suffix."""
     if not reviewer_id:
         return "reviewer"
     # reviewer_id format: "codex-r1-b6c93011" -> "codex-r1"
     # Only strip if last segment looks like a hex session token (>=8 hex chars)
-    idx = reviewer_id.rfind("-")
-    if idx > 0:
-        suffix = reviewer_id[idx + 1:]
-        if len(suffix) >= 8 and all(c in "0123456789abcdef" for c in suffix.lower()):
-            return reviewer_id[:idx]
-    return reviewer_id
+    match = _SESSION_SUFFIX_RE.fullmatch(reviewer_id)
+    return match.group(1) if match else reviewer_id
 
 
 def _resolve_caller(caller_id: str | None) -> str:
@@ -120,10 +194,11 @@ def _resolve_caller(caller_id: str | None) -> str:
     return _reviewer_tag(caller_id)
 
 
+@functools.lru_cache(maxsize=1024)
 def _normalize_project_key(project: str | None) -> str:
     if project is None:
         return ""
-    return re.sub(r"[^a-z0-9]+", "", project.strip().lower())
+    return _PROJECT_KEY_STRIP_RE.sub("", project.strip().lower())
 
 
 def _reviewer_project_scope(app: AppContext, reviewer_id: str | None) -> str | None:
@@ -146,13 +221,49 @@ def _resolve_project_workspace(app: AppContext, project: str | None) -> str | No
 
 
 async def _project_for_review(app: AppContext, review_id: str) -> str | None:
-    cursor = await app.db.execute("SELECT project FROM reviews WHERE id = ?", (review_id,))
-    row = await cursor.fetchone()
+    row = await _fetchone(app.db, "SELECT project FROM reviews WHERE id = ?", (review_id,))
     if row is None:
         return None
     return row["project"]
 
 
+def _decode_affected_entries(raw: str | None) -> list[dict[str, str | int]]:
+    if raw is None:
+        return []
+    try:
+        entries = json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return []
+    return entries if isinstance(entries, list) else []
+
+
+async def _insert_review_files(
+    app: AppContext,
+    review_id: str,
+    files: list[dict[str, str | int]],
+) -> None:
+    """Insert review_files rows for a review (caller holds the transaction)."""
+    if files:
+        await app.db.executemany(
+            """INSERT INTO review_files (review_id, path, operation, added, removed)
+               VALUES (?, ?, ?, ?, ?)""",
+            [
+                (review_id, f["path"], f["operation"], f["added"], f["removed"])
+                for f in files
+            ],
+        )
+
+
+async def _replace_review_files(
+    app: AppContext,
+    review_id: str,
+    files: list[dict[str, str | int]],
+) -> None:
+    """Rewrite the review_files rows for a review (caller holds the transaction)."""
+    await app.db.execute("DELETE FROM review_files WHERE review_id = ?", (review_id,))
+    await _insert_review_files(app, review_id, files)
+
+
 @mcp_tool
 async def create_review(
     intent: str,
@@ -194,6 +305,7 @@ async def create_review(
 
     # Compute affected_files from diff if provided
     affected_files: str | None = None
+    affected_entries: list[dict[str, str | int]] = []
     if diff is not None:
         validation_project = project
         if validation_project is None and review_id is not None:
@@ -211,19 +323,18 @@ async def create_review(
                     "error": "Diff validation failed on submission. Diff does not apply cleanly.",
                     "validation_error": error_detail,
                 }
-        affected_files = extract_affected_files(diff)
+        affected_files, affected_entries = parse_affected_files(diff)
 
     # --- Revision flow ---
     if review_id is not None:
         detached_reviewer_id: str | None = None
         async with app.write_lock:
             try:
-                await app.db.execute("BEGIN IMMEDIATE")
-                cursor = await app.db.execute(
+                row = await _begin_immediate(
+                    app,
                     "SELECT status, project, claimed_by FROM reviews WHERE id = ?",
                     (review_id,),
                 )
-                row = await cursor.fetchone()
                 if row is None:
                     await app.db.execute("ROLLBACK")
                     return {"error": f"Review not found: {review_id}"}
@@ -232,14 +343,14 @@ async def create_review(
                 detached_reviewer_id = row["claimed_by"]
                 allow_pending_revision = False
                 if current_status == ReviewStatus.PENDING:
-                    history_cursor = await app.db.execute(
+                    allow_pending_revision = await _fetchone(
+                        app.db,
                         """SELECT 1
                            FROM audit_events
                            WHERE review_id = ? AND new_status = ?
                            LIMIT 1""",
                         (review_id, str(ReviewStatus.CHANGES_REQUESTED)),
-                    )
-                    allow_pending_revision = await history_cursor.fetchone() is not None
+                    ) is not None
                 if not allow_pending_revision:
                     try:
                         validate_transition(current_status, ReviewStatus.PENDING)
@@ -270,6 +381,7 @@ async def create_review(
                         review_id,
                     ),
                 )
+                await _replace_review_files(app, review_id, affected_entries)
                 await record_event(
                     app.db, review_id, "review_revised",
                     actor=agent_type,
@@ -281,13 +393,15 @@ async def create_review(
             except Exception as exc:
                 await _rollback_quietly(app)
                 return _db_error("create_review", exc)
-        await _maybe_finalize_draining_reviewer(
-            app,
-            detached_reviewer_id,
-            trigger="review_revised",
-        )
-        app.notifications.notify(review_id)
-        app.notifications.notify(QUEUE_TOPIC)
+        if detached_reviewer_id is not None:
+            app.spawn_background(
+                _maybe_finalize_draining_reviewer(
+                    app,
+                    detached_reviewer_id,
+                    trigger="review_revised",
+                )
+            )
+        app.notifications.notify_many((review_id, QUEUE_TOPIC))
         logger.info(
             'create_review -> %s revised (phase=%s, project=%s, category=%s) "%s"',
             _short(review_id),
@@ -304,7 +418,7 @@ async def create_review(
         }
 
     # --- New review flow ---
-    new_review_id = str(uuid.uuid4())
+    new_review_id = _new_id()
     priority = infer_priority(agent_type, agent_role, phase, plan, task)
     async with app.write_lock:
         try:
@@ -335,6 +449,7 @@ async def create_review(
                     1 if skip_diff_validation else 0,
                 ),
             )
+            await _insert_review_files(app, new_review_id, affected_entries)
             await record_event(
                 app.db, new_review_id, "review_created",
                 actor=agent_type,
@@ -345,10 +460,9 @@ async def create_review(
         except Exception as exc:
             await _rollback_quietly(app)
             return _db_error("create_review", exc)
-    app.notifications.notify(new_review_id)
-    app.notifications.notify(QUEUE_TOPIC)
+    app.notifications.notify_many((new_review_id, QUEUE_TOPIC))
     if getattr(app, "pool", None) is not None:
-        asyncio.create_task(_reactive_scale_check(app, source="create_review"))
+        app.spawn_background(_reactive_scale_check(app, source="create_review"))
     logger.info(
         'create_review -> %s new (phase=%s, project=%s, category=%s) "%s"',
         _short(new_review_id),
@@ -366,6 +480,7 @@ async def list_reviews(
     category: str | None = None,
     project: str | None = None,
     projects: list[str] | None = None,
+    path: str | None = None,
     wait: bool = False,
     caller_id: str | None = None,
     ctx: Context = None,
@@ -380,6 +495,7 @@ async def list_reviews(
     Use project to scope to a specific project in a shared broker database.
     Use projects to scope to multiple projects.
     If project/projects are omitted, reviews from all projects are returned.
+    Use path to find reviews whose diff touches a file (e.g. 'src/app.py').
 
     If wait=True, blocks up to 25 seconds until a pending review exists.
     wait=True requires status='pending' to avoid ambiguous semantics.
@@ -426,38 +542,32 @@ async def list_reviews(
 
     project_filter_values = [project] if project is not None else projects
 
-    async def _query() -> list[dict]:
-        order_clause = (
-            "ORDER BY CASE COALESCE(priority, 'normal') "
-            "WHEN 'critical' THEN 0 WHEN 'normal' THEN 1 WHEN 'low' THEN 2 END, "
-            "created_at ASC"
-        )
-        conditions: list[str] = []
-        params: list[str] = []
-        if status is not None:
-            conditions.append("status = ?")
-            params.append(status)
-        if category is not None:
-            conditions.append("category = ?")
-            params.append(category)
-        if project_filter_values is not None:
-            if len(project_filter_values) == 1:
-                conditions.append("project = ?")
-                params.append(project_filter_values[0])
-            else:
-                placeholders = ", ".join("?" for _ in project_filter_values)
-                conditions.append(f"project IN ({placeholders})")
-                params.extend(project_filter_values)
-
-        where_clause = ""
-        if conditions:
-            where_clause = "WHERE " + " AND ".join(conditions)
+    # The filters are fixed for the whole call, so build the statement once rather
+    # than on every long-poll retry.
+    conditions: list[str] = []
+    params: list[str] = []
+    if status is not None:
+        conditions.append("status = ?")
+        params.append(status)
+    if category is not None:
+        conditions.append("category = ?")
+        params.append(category)
+    if project_filter_values is not None:
+        if len(project_filter_values) == 1:
+            conditions.append("project = ?")
+            params.append(project_filter_values[0])
+        else:
+            placeholders = ", ".join("?" for _ in project_filter_values)
+            conditions.append(f"project IN ({placeholders})")
+            params.extend(project_filter_values)
+    if path is not None:
+        conditions.append("id IN (SELECT review_id FROM review_files WHERE path = ?)")
+        params.append(path)
+    where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
+    sql = f"{_LIST_REVIEWS_SELECT} {where_clause} ORDER BY priority_rank, created_at ASC"
 
-        cursor = await app.db.execute(
-            "SELECT id, status, intent, agent_type, phase, priority, project, category, created_at "
-            f"FROM reviews {where_clause} {order_clause}",
-            params,
-        )
+    async def _query() -> list[dict]:
+        cursor = await app.reader.execute(sql, params)
         rows = await cursor.fetchall()
         return [
             {
@@ -517,6 +627,34 @@ async def list_reviews(
         )
 
 
+async def _prevalidate_claim_diff(
+    app: AppContext, review_id: str
+) -> tuple[str, str | None, tuple[bool, str]] | None:
+    """Validate a pending review's diff outside the write lock.
+
+    Returns ``(diff, project, validate_diff result)``, or None when there is
+    nothing to validate or the lookup fails (claim_review then validates inline).
+    """
+    try:
+        row = await _fetchone(
+            app.reader,
+            "SELECT status, diff, project, skip_diff_validation FROM reviews WHERE id = ?",
+            (review_id,),
+        )
+    except Exception:
+        return None
+    if (
+        row is None
+        or row["status"] != ReviewStatus.PENDING
+        or not row["diff"]
+        or row["skip_diff_validation"]
+    ):
+        return None
+    validation_cwd = _resolve_project_workspace(app, row["project"])
+    result = await validate_diff(row["diff"], cwd=validation_cwd)
+    return row["diff"], row["project"], result
+
+
 @mcp_tool
 async def claim_review(
     review_id: str,
@@ -526,7 +664,8 @@ async def claim_review(
     """Claim a pending review for evaluation. Only pending reviews can be claimed.
 
     If the review contains a unified diff, it is validated against the working tree
-    using git apply --check inside the write lock. If the diff does not apply cleanly,
+    using git apply --check before the write lock is taken (and again inside it if the
+    diff was revised in the meantime). If the diff does not apply cleanly,
     the review is auto-rejected with changes_requested status and validation error details.
 
     On successful claim, returns review metadata (intent, description, affected_files,
@@ -538,17 +677,24 @@ async def claim_review(
     diff_text: str | None = None
     response_generation: int | None = None
     row = None
+    # Run git apply --check before taking the write lock so a slow subprocess
+    # doesn't serialize every other write. The result is only trusted below if
+    # the diff and project are unchanged by the time the claim commits.
+    prevalidated = await _prevalidate_claim_diff(app, review_id)
     async with app.write_lock:
         try:
-            await app.db.execute("BEGIN IMMEDIATE")
-            cursor = await app.db.execute(
-                "SELECT status, diff, intent, description, affected_files, project, category, "
-                "claimed_by, "
-                "skip_diff_validation, claim_generation "
-                "FROM reviews WHERE id = ?",
-                (review_id,),
+            # Reviewer statuses ride along as scalar subqueries so the whole
+            # admission check costs one round trip inside the write lock.
+            row = await _begin_immediate(
+                app,
+                "SELECT r.status, r.diff, r.intent, r.description, r.affected_files, "
+                "r.project, r.category, r.claimed_by, r.skip_diff_validation, "
+                "r.claim_generation, "
+                "(SELECT status FROM reviewers WHERE id = r.claimed_by) AS reserved_status, "
+                "(SELECT status FROM reviewers WHERE id = ?) AS claimant_status "
+                "FROM reviews r WHERE r.id = ?",
+                (reviewer_id, review_id),
             )
-            row = await cursor.fetchone()
             if row is None:
                 await app.db.execute("ROLLBACK")
                 return {"error": f"Review not found: {review_id}"}
@@ -573,18 +719,14 @@ async def claim_review(
                 await app.db.execute("ROLLBACK")
                 return {"error": str(exc)}
             reserved_reviewer = row["claimed_by"] if current_status == ReviewStatus.PENDING else None
-            if (
+            release_reservation = (
                 current_status == ReviewStatus.PENDING
                 and not _missing(reserved_reviewer)
                 and reviewer_id != reserved_reviewer
-            ):
+            )
+            if release_reservation:
                 keep_reservation = False
-                reviewer_cursor = await app.db.execute(
-                    "SELECT status FROM reviewers WHERE id = ?",
-                    (reserved_reviewer,),
-                )
-                reviewer_row = await reviewer_cursor.fetchone()
-                if reviewer_row is not None and reviewer_row["status"] == "active":
+                if row["reserved_status"] == "active":
                     keep_reservation = True
                     pool = getattr(app, "pool", None)
                     if pool is not None:
@@ -593,26 +735,15 @@ async def claim_review(
                 if keep_reservation:
                     await app.db.execute("ROLLBACK")
                     return {"error": f"Review reserved for reviewer {reserved_reviewer}"}
-                await app.db.execute(
-                    """UPDATE reviews
-                       SET claimed_by = NULL, claimed_at = NULL, updated_at = datetime('now')
-                       WHERE id = ?""",
-                    (review_id,),
-                )
 
             # Backward-compat: reviewer rows are optional (manual reviewers).
-            if not _missing(reviewer_id):
-                reviewer_cursor = await app.db.execute(
-                    "SELECT status FROM reviewers WHERE id = ?",
-                    (reviewer_id,),
-                )
-                reviewer_row = await reviewer_cursor.fetchone()
-                if reviewer_row is not None and reviewer_row["status"] != "active":
-                    await app.db.execute("ROLLBACK")
-                    return {
-                        "error": f"Reviewer {reviewer_id} is {reviewer_row['status']}, "
-                        "cannot claim new reviews",
-                    }
+            claimant_status = row["claimant_status"]
+            if not _missing(reviewer_id) and claimant_status not in (None, "active"):
+                await app.db.execute("ROLLBACK")
+                return {
+                    "error": f"Reviewer {reviewer_id} is {claimant_status}, "
+                    "cannot claim new reviews",
+                }
 
             diff_text = row["diff"]
             skip_validation = (
@@ -621,30 +752,37 @@ async def claim_review(
                 else False
             )
             if diff_text and not skip_validation:
-                validation_cwd = _resolve_project_workspace(app, row["project"])
-                is_valid, error_detail = await validate_diff(diff_text, cwd=validation_cwd)
+                if prevalidated is not None and prevalidated[:2] == (diff_text, row["project"]):
+                    is_valid, error_detail = prevalidated[2]
+                else:
+                    validation_cwd = _resolve_project_workspace(app, row["project"])
+                    is_valid, error_detail = await validate_diff(diff_text, cwd=validation_cwd)
                 if not is_valid:
-                    await app.db.execute(
-                        """UPDATE reviews
-                           SET status = ?, verdict_reason = ?, claimed_by = ?,
-                               updated_at = datetime('now')
-                           WHERE id = ?""",
-                        (
-                            ReviewStatus.CHANGES_REQUESTED,
-                            f"Auto-rejected: diff does not apply cleanly.\n{error_detail}",
-                            "broker-validator",
+                    await _pipelined(
+                        app.db.execute(
+                            """UPDATE reviews
+                               SET status = ?, verdict_reason = ?, claimed_by = ?,
+                                   claimed_at = CASE WHEN ? THEN NULL ELSE claimed_at END,
+                                   updated_at = datetime('now')
+                               WHERE id = ?""",
+                            (
+                                ReviewStatus.CHANGES_REQUESTED,
+                                f"Auto-rejected: diff does not apply cleanly.\n{error_detail}",
+                                "broker-validator",
+                                release_reservation,
+                                review_id,
+                            ),
+                        ),
+                        record_event(
+                            app.db,
                             review_id,
+                            "review_auto_rejected",
+                            actor="broker-validator",
+                            old_status="pending",
+                            new_status="changes_requested",
+                            metadata={"reason": error_detail},
                         ),
                     )
-                    await record_event(
-                        app.db,
-                        review_id,
-                        "review_auto_rejected",
-                        actor="broker-validator",
-                        old_status="pending",
-                        new_status="changes_requested",
-                        metadata={"reason": error_detail},
-                    )
                     await app.db.execute("COMMIT")
                     auto_rejected_result = {
                         "review_id": review_id,
@@ -658,22 +796,24 @@ async def claim_review(
             if auto_rejected_result is None:
                 prior_generation = int(row["claim_generation"] or 0)
                 response_generation = prior_generation + 1
-                await app.db.execute(
-                    """UPDATE reviews
-                       SET status = ?, claimed_by = ?, claimed_at = datetime('now'),
-                           claim_generation = claim_generation + 1,
-                           updated_at = datetime('now')
-                       WHERE id = ?""",
-                    (ReviewStatus.CLAIMED, reviewer_id, review_id),
-                )
-                await record_event(
-                    app.db,
-                    review_id,
-                    "review_claimed",
-                    actor=reviewer_id,
-                    old_status="pending",
-                    new_status="claimed",
-                    metadata={"claim_generation": response_generation},
+                await _pipelined(
+                    app.db.execute(
+                        """UPDATE reviews
+                           SET status = ?, claimed_by = ?, claimed_at = datetime('now'),
+                               claim_generation = claim_generation + 1,
+                               updated_at = datetime('now')
+                           WHERE id = ?""",
+                        (ReviewStatus.CLAIMED, reviewer_id, review_id),
+                    ),
+                    record_event(
+                        app.db,
+                        review_id,
+                        "review_claimed",
+                        actor=reviewer_id,
+                        old_status="pending",
+                        new_status="claimed",
+                        metadata={"claim_generation": response_generation},
+                    ),
                 )
                 await app.db.execute("COMMIT")
         except Exception as exc:
@@ -752,11 +892,11 @@ async def submit_verdict(
             return {
                 "error": "Counter-patches only allowed with changes_requested or comment verdicts"
             }
-        review_cursor = await app.db.execute(
+        review_row = await _fetchone(
+            app.reader,
             "SELECT project FROM reviews WHERE id = ?",
             (review_id,),
         )
-        review_row = await review_cursor.fetchone()
         if review_row is None:
             return {"error": f"Review not found: {review_id}"}
         review_project = review_row["project"]
@@ -813,12 +953,11 @@ async def submit_verdict(
     if verdict == "comment":
         async with app.write_lock:
             try:
-                await app.db.execute("BEGIN IMMEDIATE")
-                cursor = await app.db.execute(
-                    "SELECT status, claim_generation, claimed_by FROM reviews WHERE id = ?",
+                row = await _begin_immediate(
+                    app,
+                    _VERDICT_GUARD_SELECT,
                     (review_id,),
                 )
-                row = await cursor.fetchone()
                 if row is None:
                     await app.db.execute("ROLLBACK")
                     return {"error": f"Review not found: {review_id}"}
@@ -831,13 +970,9 @@ async def submit_verdict(
                             "Comments are only valid on claimed or in_review reviews."
                         )
                     }
-                managed_claim = False
-                if current_status == ReviewStatus.CLAIMED and row["claimed_by"] is not None:
-                    reviewer_cursor = await app.db.execute(
-                        "SELECT 1 FROM reviewers WHERE id = ?",
-                        (row["claimed_by"],),
-                    )
-                    managed_claim = await reviewer_cursor.fetchone() is not None
+                managed_claim = current_status == ReviewStatus.CLAIMED and bool(
+                    row["managed_claim"]
+                )
 
                 guard_error = _guard_claimed_verdict(
                     current_status,
@@ -850,7 +985,7 @@ async def submit_verdict(
                     return guard_error
 
                 if counter_patch is not None:
-                    await app.db.execute(
+                    update = app.db.execute(
                         """UPDATE reviews SET verdict_reason = ?,
                                counter_patch = ?, counter_patch_affected_files = ?,
                                counter_patch_status = 'pending',
@@ -859,24 +994,27 @@ async def submit_verdict(
                         (normalized_reason, counter_patch, counter_affected, review_id),
                     )
                 else:
-                    await app.db.execute(
+                    update = app.db.execute(
                         """UPDATE reviews SET verdict_reason = ?, updated_at = datetime('now')
                            WHERE id = ?""",
                         (normalized_reason, review_id),
                     )
-                await record_event(
-                    app.db,
-                    review_id,
-                    "verdict_comment",
-                    actor="reviewer",
-                    old_status=str(current_status),
-                    new_status=str(current_status),
-                    metadata={
-                        "reason": normalized_reason,
-                        "has_counter_patch": counter_patch is not None,
-                        "reviewer_id": reviewer_id,
-                        "claim_generation": claim_generation,
-                    },
+                await _pipelined(
+                    update,
+                    record_event(
+                        app.db,
+                        review_id,
+                        "verdict_comment",
+                        actor="reviewer",
+                        old_status=str(current_status),
+                        new_status=str(current_status),
+                        metadata={
+                            "reason": normalized_reason,
+                            "has_counter_patch": counter_patch is not None,
+                            "reviewer_id": reviewer_id,
+                            "claim_generation": claim_generation,
+                        },
+                    ),
                 )
                 await app.db.execute("COMMIT")
             except Exception as exc:
@@ -915,24 +1053,17 @@ async def submit_verdict(
     row_claimed_by: str | None = None
     async with app.write_lock:
         try:
-            await app.db.execute("BEGIN IMMEDIATE")
-            cursor = await app.db.execute(
-                "SELECT status, claim_generation, claimed_by FROM reviews WHERE id = ?",
+            row = await _begin_immediate(
+                app,
+                _VERDICT_GUARD_SELECT,
                 (review_id,),
             )
-            row = await cursor.fetchone()
             if row is None:
                 await app.db.execute("ROLLBACK")
                 return {"error": f"Review not found: {review_id}"}
             current_status = ReviewStatus(row["status"])
             row_claimed_by = row["claimed_by"]
-            managed_claim = False
-            if current_status == ReviewStatus.CLAIMED and row_claimed_by is not None:
-                reviewer_cursor = await app.db.execute(
-                    "SELECT 1 FROM reviewers WHERE id = ?",
-                    (row_claimed_by,),
-                )
-                managed_claim = await reviewer_cursor.fetchone() is not None
+            managed_claim = current_status == ReviewStatus.CLAIMED and bool(row["managed_claim"])
             guard_error = _guard_claimed_verdict(
                 current_status,
                 int(row["claim_generation"] or 0),
@@ -948,7 +1079,7 @@ async def submit_verdict(
                 await app.db.execute("ROLLBACK")
                 return {"error": str(exc)}
             if counter_patch is not None:
-                await app.db.execute(
+                update = app.db.execute(
                     """UPDATE reviews SET status = ?, verdict_reason = ?,
                            counter_patch = ?, counter_patch_affected_files = ?,
                            counter_patch_status = 'pending',
@@ -957,23 +1088,26 @@ async def submit_verdict(
                     (target_status, normalized_reason, counter_patch, counter_affected, review_id),
                 )
             else:
-                await app.db.execute(
+                update = app.db.execute(
                     """UPDATE reviews SET status = ?, verdict_reason = ?,
                            updated_at = datetime('now')
                        WHERE id = ?""",
                     (target_status, normalized_reason, review_id),
                 )
-            await record_event(
-                app.db, review_id, "verdict_submitted",
-                actor="reviewer",
-                old_status=str(current_status),
-                new_status=str(target_status),
-                metadata={
-                    "verdict": verdict,
-                    "has_counter_patch": counter_patch is not None,
-                    "reviewer_id": reviewer_id,
-                    "claim_generation": claim_generation,
-                },
+            await _pipelined(
+                update,
+                record_event(
+                    app.db, review_id, "verdict_submitted",
+                    actor="reviewer",
+                    old_status=str(current_status),
+                    new_status=str(target_status),
+                    metadata={
+                        "verdict": verdict,
+                        "has_counter_patch": counter_patch is not None,
+                        "reviewer_id": reviewer_id,
+                        "claim_generation": claim_generation,
+                    },
+                ),
             )
             await app.db.execute("COMMIT")
         except Exception as exc:
@@ -1009,23 +1143,22 @@ async def _maybe_finalize_draining_reviewer(
     terminate_via_pool = False
     async with app.write_lock:
         try:
-            await app.db.execute("BEGIN IMMEDIATE")
-            cursor = await app.db.execute(
+            row = await _begin_immediate(
+                app,
                 "SELECT status FROM reviewers WHERE id = ?",
                 (reviewer_id,),
             )
-            row = await cursor.fetchone()
             if row is None or row["status"] != "draining":
                 await app.db.execute("ROLLBACK")
                 return
 
-            cursor = await app.db.execute(
+            claims_row = await _fetchone(
+                app.db,
                 """SELECT COUNT(*) AS n
                    FROM reviews
                    WHERE status != 'closed' AND claimed_by = ?""",
                 (reviewer_id,),
             )
-            claims_row = await cursor.fetchone()
             remaining = int(claims_row["n"]) if claims_row is not None else 0
             if remaining > 0:
                 await app.db.execute("ROLLBACK")
@@ -1059,13 +1192,8 @@ async def _maybe_finalize_draining_reviewer(
             return
 
     if terminate_via_pool and pool is not None:
-        try:
-            await pool._terminate_reviewer(reviewer_id, app.db, app.write_lock)
-        except Exception:
-            logger.exception(
-                "Failed to terminate draining reviewer subprocess: reviewer_id=%s",
-                reviewer_id,
-            )
+        # Runs in the background so the verdict/close call isn't held by the process exit.
+        pool.terminate_in_background(reviewer_id, app.db, app.write_lock)
 
 
 async def reclaim_review(
@@ -1078,12 +1206,11 @@ async def reclaim_review(
     new_generation: int | None = None
     async with app.write_lock:
         try:
-            await app.db.execute("BEGIN IMMEDIATE")
-            cursor = await app.db.execute(
+            row = await _begin_immediate(
+                app,
                 "SELECT status, claimed_by, claim_generation FROM reviews WHERE id = ?",
                 (review_id,),
             )
-            row = await cursor.fetchone()
             if row is None:
                 await app.db.execute("ROLLBACK")
                 return {"error": f"Review not found: {review_id}"}
@@ -1097,28 +1224,30 @@ async def reclaim_review(
 
             old_claimed_by = row["claimed_by"]
             new_generation = int(row["claim_generation"] or 0) + 1
-            await app.db.execute(
-                """UPDATE reviews
-                   SET status = 'pending',
-                       claimed_by = NULL,
-                       claimed_at = NULL,
-                       claim_generation = claim_generation + 1,
-                       updated_at = datetime('now')
-                   WHERE id = ?""",
-                (review_id,),
-            )
-            await record_event(
-                app.db,
-                review_id,
-                "review_reclaimed",
-                actor="pool-manager",
-                old_status="claimed",
-                new_status="pending",
-                metadata={
-                    "old_reviewer": old_claimed_by,
-                    "reason": reason,
-                    "claim_generation": new_generation,
-                },
+            await _pipelined(
+                app.db.execute(
+                    """UPDATE reviews
+                       SET status = 'pending',
+                           claimed_by = NULL,
+                           claimed_at = NULL,
+                           claim_generation = claim_generation + 1,
+                           updated_at = datetime('now')
+                       WHERE id = ?""",
+                    (review_id,),
+                ),
+                record_event(
+                    app.db,
+                    review_id,
+                    "review_reclaimed",
+                    actor="pool-manager",
+                    old_status="claimed",
+                    new_status="pending",
+                    metadata={
+                        "old_reviewer": old_claimed_by,
+                        "reason": reason,
+                        "claim_generation": new_generation,
+                    },
+                ),
             )
             await app.db.execute("COMMIT")
         except Exception as exc:
@@ -1126,8 +1255,7 @@ async def reclaim_review(
             return _db_error("reclaim_review", exc)
 
     await _maybe_finalize_draining_reviewer(app, old_claimed_by, trigger="reclaim")
-    app.notifications.notify(review_id)
-    app.notifications.notify(QUEUE_TOPIC)
+    app.notifications.notify_many((review_id, QUEUE_TOPIC))
     return {
         "review_id": review_id,
         "status": ReviewStatus.PENDING,
@@ -1187,37 +1315,40 @@ async def _reactive_scale_check(app: AppContext, source: str = "unspecified") ->
                 reason,
             )
             if should_spawn:
+                projects = [
+                    project_value
+                    for project_value, project_spawns in spawn_plan
+                    for _ in range(project_spawns)
+                ][:spawn_needed]
+                # One batch so every new reviewer row is inserted in a single transaction.
+                results = await pool.spawn_reviewers(
+                    app.db,
+                    app.write_lock,
+                    projects,
+                    ignore_cooldown=True,
+                )
                 spawned = 0
-                for project_value, project_spawns in spawn_plan:
-                    for _ in range(project_spawns):
-                        result = await pool.spawn_reviewer(
-                            app.db,
-                            app.write_lock,
-                            project=project_value,
-                            ignore_cooldown=True,
-                        )
-                        if "error" in result:
-                            logger.warning(
-                                "reactive_scale_check[%s] -> spawn failed after %s/%s (project=%s): %s",
-                                source,
-                                spawned,
-                                spawn_needed,
-                                project_value or "(any)",
-                                result["error"],
-                            )
-                            break
-                        spawned += 1
-                        logger.info(
-                            "reactive_scale_check[%s] -> spawn succeeded reviewer_id=%s pid=%s project=%s progress=%s/%s",
+                for project_value, result in zip(projects, results, strict=False):
+                    if "error" in result:
+                        logger.warning(
+                            "reactive_scale_check[%s] -> spawn failed after %s/%s (project=%s): %s",
                             source,
-                            result.get("reviewer_id"),
-                            result.get("pid"),
-                            result.get("project_scope") or "(any)",
                             spawned,
                             spawn_needed,
+                            project_value or "(any)",
+                            result["error"],
                         )
-                    if spawned >= spawn_needed:
-                        break
+                        continue
+                    spawned += 1
+                    logger.info(
+                        "reactive_scale_check[%s] -> spawn succeeded reviewer_id=%s pid=%s project=%s progress=%s/%s",
+                        source,
+                        result.get("reviewer_id"),
+                        result.get("pid"),
+                        result.get("project_scope") or "(any)",
+                        spawned,
+                        spawn_needed,
+                    )
                 logger.info(
                     "reactive_scale_check[%s] -> spawn summary requested=%s spawned=%s active_now=%s",
                     source,
@@ -1321,12 +1452,11 @@ async def close_review(
     claimed_by: str | None = None
     async with app.write_lock:
         try:
-            await app.db.execute("BEGIN IMMEDIATE")
-            cursor = await app.db.execute(
+            row = await _begin_immediate(
+                app,
                 "SELECT status, claimed_by FROM reviews WHERE id = ?",
                 (review_id,),
             )
-            row = await cursor.fetchone()
             if row is None:
                 await app.db.execute("ROLLBACK")
                 return {"error": f"Review not found: {review_id}"}
@@ -1337,16 +1467,18 @@ async def close_review(
             except ValueError as exc:
                 await app.db.execute("ROLLBACK")
                 return {"error": str(exc)}
-            await app.db.execute(
-                """UPDATE reviews SET status = ?, updated_at = datetime('now')
-                   WHERE id = ?""",
-                (ReviewStatus.CLOSED, review_id),
-            )
-            await record_event(
-                app.db, review_id, "review_closed",
-                actor=closer_role,
-                old_status=str(current_status),
-                new_status="closed",
+            await _pipelined(
+                app.db.execute(
+                    """UPDATE reviews SET status = ?, updated_at = datetime('now')
+                       WHERE id = ?""",
+                    (ReviewStatus.CLOSED, review_id),
+                ),
+                record_event(
+                    app.db, review_id, "review_closed",
+                    actor=closer_role,
+                    old_status=str(current_status),
+                    new_status="closed",
+                ),
             )
             await app.db.execute("COMMIT")
         except Exception as exc:
@@ -1374,14 +1506,13 @@ async def accept_counter_patch(
     app: AppContext = _app_ctx(ctx)
     async with app.write_lock:
         try:
-            await app.db.execute("BEGIN IMMEDIATE")
-            cursor = await app.db.execute(
+            row = await _begin_immediate(
+                app,
                 """SELECT status, counter_patch, counter_patch_affected_files, project,
                           counter_patch_status
                    FROM reviews WHERE id = ?""",
                 (review_id,),
             )
-            row = await cursor.fetchone()
             if row is None:
                 await app.db.execute("ROLLBACK")
                 return {"error": f"Review not found: {review_id}"}
@@ -1401,18 +1532,23 @@ async def accept_counter_patch(
                     "validation_error": error_detail,
                 }
 
-            await app.db.execute(
-                """UPDATE reviews
-                   SET diff = counter_patch,
-                       affected_files = counter_patch_affected_files,
-                       counter_patch = NULL,
-                       counter_patch_affected_files = NULL,
-                       counter_patch_status = 'accepted',
-                       updated_at = datetime('now')
-                   WHERE id = ?""",
-                (review_id,),
+            await _pipelined(
+                app.db.execute(
+                    """UPDATE reviews
+                       SET diff = counter_patch,
+                           affected_files = counter_patch_affected_files,
+                           counter_patch = NULL,
+                           counter_patch_affected_files = NULL,
+                           counter_patch_status = 'accepted',
+                           updated_at = datetime('now')
+                       WHERE id = ?""",
+                    (review_id,),
+                ),
+                _replace_review_files(
+                    app, review_id, _decode_affected_entries(row["counter_patch_affected_files"])
+                ),
+                record_event(app.db, review_id, "counter_patch_accepted", actor="proposer"),
             )
-            await record_event(app.db, review_id, "counter_patch_accepted", actor="proposer")
             await app.db.execute("COMMIT")
         except Exception as exc:
             await _rollback_quietly(app)
@@ -1437,28 +1573,29 @@ async def reject_counter_patch(
     app: AppContext = _app_ctx(ctx)
     async with app.write_lock:
         try:
-            await app.db.execute("BEGIN IMMEDIATE")
-            cursor = await app.db.execute(
+            row = await _begin_immediate(
+                app,
                 "SELECT counter_patch_status FROM reviews WHERE id = ?",
                 (review_id,),
             )
-            row = await cursor.fetchone()
             if row is None:
                 await app.db.execute("ROLLBACK")
                 return {"error": f"Review not found: {review_id}"}
             if row["counter_patch_status"] != "pending":
                 await app.db.execute("ROLLBACK")
                 return {"error": "No pending counter-patch to reject"}
-            await app.db.execute(
-                """UPDATE reviews
-                   SET counter_patch = NULL,
-                       counter_patch_affected_files = NULL,
-                       counter_patch_status = 'rejected',
-                       updated_at = datetime('now')
-                   WHERE id = ?""",
-                (review_id,),
+            await _pipelined(
+                app.db.execute(
+                    """UPDATE reviews
+                       SET counter_patch = NULL,
+                           counter_patch_affected_files = NULL,
+                           counter_patch_status = 'rejected',
+                           updated_at = datetime('now')
+                       WHERE id = ?""",
+                    (review_id,),
+                ),
+                record_event(app.db, review_id, "counter_patch_rejected", actor="proposer"),
             )
-            await record_event(app.db, review_id, "counter_patch_rejected", actor="proposer")
             await app.db.execute("COMMIT")
         except Exception as exc:
             await _rollback_quietly(app)
@@ -1492,14 +1629,14 @@ async def get_review_status(
     if wait:
         await app.notifications.wait_for_change(review_id, timeout=25.0)
 
-    cursor = await app.db.execute(
+    row = await _fetchone(
+        app.db,
         """SELECT id, status, intent, agent_type, agent_role, phase, plan, task,
                   project, claimed_by, verdict_reason, priority, current_round, category,
                   updated_at
            FROM reviews WHERE id = ?""",
         (review_id,),
     )
-    row = await cursor.fetchone()
     if row is None:
         logger.info("get_review_status -> %s not found", _short(review_id))
         return {"error": f"Review {review_id} not found"}
@@ -1542,13 +1679,13 @@ async def get_proposal(
     """
     caller_tag.set(_resolve_caller(caller_id))
     app: AppContext = _app_ctx(ctx)
-    cursor = await app.db.execute(
+    row = await _fetchone(
+        app.db,
         """SELECT id, status, intent, description, diff, affected_files, project, category,
                   counter_patch, counter_patch_affected_files, counter_patch_status
            FROM reviews WHERE id = ?""",
         (review_id,),
     )
-    row = await cursor.fetchone()
     if row is None:
         logger.info("get_proposal -> %s not found", _short(review_id))
         return {"error": f"Review {review_id} not found"}
@@ -1610,20 +1747,18 @@ async def add_message(
         return {"error": f"Invalid sender_role: {sender_role!r}. Must be 'proposer' or 'reviewer'."}
 
     app: AppContext = _app_ctx(ctx)
-    msg_id = str(uuid.uuid4())
+    msg_id = _new_id()
     requeued_for_followup = False
     detached_reviewer_id: str | None = None
 
     async with app.write_lock:
         try:
-            await app.db.execute("BEGIN IMMEDIATE")
-
             # Verify review exists and is in a valid state for messaging
-            cursor = await app.db.execute(
+            row = await _begin_immediate(
+                app,
                 "SELECT status, current_round, claimed_by FROM reviews WHERE id = ?",
                 (review_id,),
             )
-            row = await cursor.fetchone()
             if row is None:
                 await app.db.execute("ROLLBACK")
                 return {"error": f"Review not found: {review_id}"}
@@ -1648,12 +1783,12 @@ async def add_message(
             original_claimed_by = row["claimed_by"]
 
             # Turn enforcement: check last message sender
-            cursor = await app.db.execute(
+            last_msg = await _fetchone(
+                app.db,
                 "SELECT sender_role FROM messages WHERE review_id = ? "
                 "ORDER BY rowid DESC LIMIT 1",
                 (review_id,),
             )
-            last_msg = await cursor.fetchone()
             if last_msg is not None and last_msg["sender_role"] == sender_role:
                 await app.db.execute("ROLLBACK")
                 return {
@@ -1683,11 +1818,11 @@ async def add_message(
                 reserved_reviewer = original_claimed_by
                 keep_reservation = False
                 if not _missing(reserved_reviewer):
-                    reviewer_cursor = await app.db.execute(
+                    reviewer_row = await _fetchone(
+                        app.db,
                         "SELECT status FROM reviewers WHERE id = ?",
                         (reserved_reviewer,),
                     )
-                    reviewer_row = await reviewer_cursor.fetchone()
                     if reviewer_row is not None and reviewer_row["status"] == "active":
                         keep_reservation = True
                         pool = getattr(app, "pool", None)
@@ -1723,17 +1858,20 @@ async def add_message(
             return _db_error("add_message", exc)
 
     # Fire notification outside write_lock
-    app.notifications.notify(review_id)
     if requeued_for_followup:
-        app.notifications.notify(QUEUE_TOPIC)
+        app.notifications.notify_many((review_id, QUEUE_TOPIC))
         if getattr(app, "pool", None) is not None:
-            asyncio.create_task(_reactive_scale_check(app, source="add_message"))
+            app.spawn_background(_reactive_scale_check(app, source="add_message"))
         if detached_reviewer_id is not None:
-            await _maybe_finalize_draining_reviewer(
-                app,
-                detached_reviewer_id,
-                trigger="proposer_followup_requeue",
+            app.spawn_background(
+                _maybe_finalize_draining_reviewer(
+                    app,
+                    detached_reviewer_id,
+                    trigger="proposer_followup_requeue",
+                )
             )
+    else:
+        app.notifications.notify(review_id)
 
     logger.info(
         "add_message -> %s by %s (round=%s, requeued=%s)",
@@ -1761,10 +1899,7 @@ async def get_discussion(
     app: AppContext = _app_ctx(ctx)
 
     # Verify review exists
-    cursor = await app.db.execute(
-        "SELECT id FROM reviews WHERE id = ?", (review_id,)
-    )
-    if await cursor.fetchone() is None:
+    if await _fetchone(app.db, "SELECT id FROM reviews WHERE id = ?", (review_id,)) is None:
         logger.info("get_discussion -> %s not found", _short(review_id))
         return {"error": f"Review not found: {review_id}"}
 
@@ -1911,10 +2046,7 @@ async def get_audit_log(
 
     if review_id is not None:
         # Verify review exists
-        cursor = await app.db.execute(
-            "SELECT id FROM reviews WHERE id = ?", (review_id,)
-        )
-        if await cursor.fetchone() is None:
+        if await _fetchone(app.db, "SELECT id FROM reviews WHERE id = ?", (review_id,)) is None:
             logger.info("get_audit_log -> %s not found", _short(review_id))
             return {"error": f"Review not found: {review_id}"}
 
@@ -2165,11 +2297,11 @@ async def get_review_timeline(
     app: AppContext = _app_ctx(ctx)
 
     # Verify review exists
-    cursor = await app.db.execute(
+    row = await _fetchone(
+        app.db,
         "SELECT id, intent, status, project, category FROM reviews WHERE id = ?",
         (review_id,),
     )
-    row = await cursor.fetchone()
     if row is None:
         logger.info("get_review_timeline -> %s not found", _short(review_id))
         return {"error": f"Review not found: {review_id}"}
@@ -0,0 +1,187 @@
+"""Fair FIFO write serialization with group commit for the GSD Review Broker.
+
+All broker writes go through a single SQLite connection, so writers must be
+serialized. ``WriteBatcher`` provides two entry points:
+
+- ``async with batcher:`` -- a strictly FIFO lock for callers that manage their
+  own ``BEGIN IMMEDIATE``/``COMMIT`` block (drop-in for ``asyncio.Lock``).
+- ``await batcher.submit(callback)`` -- queue a write callback; a single worker
+  drains up to ``max_batch_size`` queued callbacks and runs them inside one
+  transaction, so back-to-back writes share one commit instead of paying one
+  each. Every callback runs under its own SAVEPOINT, so a failing callback is
+  rolled back and reported to its submitter without affecting the others.
+
+``submit`` must not be called by a task that holds the lock (including from a
+callback): the worker would queue behind its own submitter forever, so that case
+raises ``RuntimeError`` instead. When fewer than ``max_batch_size`` callbacks are
+queued the worker waits ``max_wait_ms`` for company, which is the latency a lone
+submit pays for batching.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import aiosqlite
+
+WriteCallback = Callable[[aiosqlite.Connection], Awaitable[Any]]
+
+_SAVEPOINT = "write_batch"
+
+
+async def _rollback_quietly(db: aiosqlite.Connection) -> None:
+    with contextlib.suppress(Exception):
+        await db.execute("ROLLBACK")
+
+
+class WriteBatcher:
+    """FIFO write lock plus group-commit queue bound to one SQLite connection."""
+
+    def __init__(
+        self,
+        db: aiosqlite.Connection,
+        *,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 2.0,
+    ) -> None:
+        self.db = db
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._locked = False
+        self._owner: asyncio.Task[Any] | None = None
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._pending: deque[tuple[WriteCallback, asyncio.Future[Any]]] = deque()
+        self._worker: asyncio.Task[None] | None = None
+
+    # -- FIFO lock ---------------------------------------------------------
+
+    def locked(self) -> bool:
+        """Return True when a writer currently holds the lock."""
+        return self._locked
+
+    async def acquire(self) -> None:
+        """Acquire the lock, queueing behind earlier waiters (no barging)."""
+        if not self._locked and not self._waiters:
+            self._locked = True
+            self._owner = asyncio.current_task()
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Ownership was handed over just as we were cancelled; pass it on.
+                self._wake_next()
+            else:
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(waiter)
+            raise
+        self._owner = asyncio.current_task()
+
+    def release(self) -> None:
+        """Release the lock, handing ownership directly to the oldest waiter."""
+        if not self._locked:
+            raise RuntimeError("WriteBatcher is not acquired")
+        self._wake_next()
+
+    def _wake_next(self) -> None:
+        self._owner = None
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # Ownership transfers without unlocking, so late arrivals cannot barge.
+                waiter.set_result(None)
+                return
+        self._locked = False
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.release()
+
+    # -- Group commit ------------------------------------------------------
+
+    async def submit(self, callback: WriteCallback) -> Any:
+        """Run ``callback(db)`` inside a batched write transaction and return its result.
+
+        The callback must not issue BEGIN/COMMIT/ROLLBACK itself. Exceptions raised
+        by the callback are re-raised here after its SAVEPOINT is rolled back.
+        """
+        if self._locked and self._owner is asyncio.current_task():
+            raise RuntimeError("WriteBatcher.submit() called while holding the write lock")
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._pending.append((callback, future))
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+        return await future
+
+    async def aclose(self) -> None:
+        """Wait for already-submitted callbacks to commit (used on shutdown)."""
+        worker = self._worker
+        if worker is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+
+    async def _run(self) -> None:
+        try:
+            while self._pending:
+                if len(self._pending) < self.max_batch_size and self.max_wait_ms > 0:
+                    await asyncio.sleep(self.max_wait_ms / 1000.0)
+                batch_size = min(len(self._pending), self.max_batch_size)
+                batch = [self._pending.popleft() for _ in range(batch_size)]
+                async with self:
+                    await self._commit_batch(batch)
+        except asyncio.CancelledError:
+            while self._pending:
+                _, future = self._pending.popleft()
+                future.cancel()
+            raise
+        finally:
+            self._worker = None
+
+    async def _commit_batch(self, batch: list[tuple[WriteCallback, asyncio.Future[Any]]]) -> None:
+        db = self.db
+        outcomes: list[tuple[asyncio.Future[Any], Any, BaseException | None]] = []
+        try:
+            await db.execute("BEGIN IMMEDIATE")
+            for callback, future in batch:
+                if future.done():
+                    continue  # submitter was cancelled before its turn
+                await db.execute(f"SAVEPOINT {_SAVEPOINT}")
+                try:
+                    result = await callback(db)
+                except Exception as exc:
+                    await db.execute(f"ROLLBACK TO {_SAVEPOINT}")
+                    await db.execute(f"RELEASE {_SAVEPOINT}")
+                    outcomes.append((future, None, exc))
+                    continue
+                await db.execute(f"RELEASE {_SAVEPOINT}")
+                outcomes.append((future, result, None))
+            await db.execute("COMMIT")
+        except BaseException as exc:
+            await _rollback_quietly(db)
+            cancelled = isinstance(exc, asyncio.CancelledError)
+            for _, future in batch:
+                if future.done():
+                    continue
+                if cancelled:
+                    future.cancel()
+                else:
+                    future.set_exception(exc)
+            if cancelled:
+                raise
+            return
+
+        for future, result, error in outcomes:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
@@ -8,7 +8,7 @@ import uuid
 
 import aiosqlite
 
-from gsd_review_broker.audit import record_event
+from gsd_review_broker.audit import record_event, record_events_batch
 
 
 async def _insert_review(db: aiosqlite.Connection, review_id: str | None = None) -> str:
@@ -113,3 +113,22 @@ async def test_record_event_multiple_events_same_review(db: aiosqlite.Connection
     ids = [row["id"] for row in rows]
     assert ids[1] == ids[0] + 1
     assert ids[2] == ids[1] + 1
+
+
+async def test_record_events_batch_shares_metadata(db: aiosqlite.Connection) -> None:
+    """record_events_batch writes one row per review with identical metadata."""
+    rids = [await _insert_review(db) for _ in range(3)]
+    meta = {"reason": "reviewer_process_exit", "reviewer_id": "r1"}
+
+    await db.execute("BEGIN IMMEDIATE")
+    await record_events_batch(db, rids, "review_detached", actor="pool-manager", metadata=meta)
+    await db.execute("COMMIT")
+
+    cursor = await db.execute(
+        "SELECT review_id, actor, metadata FROM audit_events WHERE event_type = ?",
+        ("review_detached",),
+    )
+    rows = await cursor.fetchall()
+    assert sorted(row["review_id"] for row in rows) == sorted(rids)
+    assert all(row["actor"] == "pool-manager" for row in rows)
+    assert all(json.loads(row["metadata"]) == meta for row in rows)
@@ -280,6 +280,11 @@ class TestAcceptCounterPatch:
         assert row["affected_files"] is not None
         assert row["counter_patch"] is None
         assert row["counter_patch_status"] == "accepted"
+        cursor = await db.execute(
+            "SELECT path, added, removed FROM review_files WHERE review_id = ?", (review_id,)
+        )
+        files = [tuple(r) for r in await cursor.fetchall()]
+        assert files == [("hello.txt", 1, 1)]
 
     async def test_accept_with_stale_diff(self, ctx: MockContext) -> None:
         """Accepting stale counter-patch returns error; review state unchanged."""
@@ -576,22 +581,21 @@ class TestNotificationPolling:
         result = await _create_review(ctx)
         review_id = result["review_id"]
 
-        # Monkeypatch wait_for_change to return False immediately (timeout simulation)
-        original_wait = ctx.lifespan_context.notifications.wait_for_change
+        # Patch wait_for_change to return False immediately (timeout simulation).
+        # NotificationBus uses __slots__, so patch the class rather than the instance.
         wait_was_called = False
 
-        async def fast_timeout(rid, timeout=25.0):
+        async def fast_timeout(bus, rid, timeout=25.0):
             nonlocal wait_was_called
             wait_was_called = True
             return False
 
-        ctx.lifespan_context.notifications.wait_for_change = fast_timeout
-        try:
+        with patch.object(
+            type(ctx.lifespan_context.notifications), "wait_for_change", fast_timeout
+        ):
             status_result = await get_review_status.fn(
                 review_id=review_id, wait=True, ctx=ctx
             )
-        finally:
-            ctx.lifespan_context.notifications.wait_for_change = original_wait
 
         assert "error" not in status_result
         assert status_result["id"] == review_id
@@ -60,6 +60,40 @@ async def test_claimed_at_column_exists(db: aiosqlite.Connection) -> None:
     assert row["claimed_at"] is None
 
 
+async def test_claimed_by_lookup_uses_index(db: aiosqlite.Connection) -> None:
+    cursor = await db.execute(
+        """EXPLAIN QUERY PLAN
+           SELECT COUNT(*) FROM reviews WHERE status != 'closed' AND claimed_by = ?""",
+        ("codex-r1-a7f3b2e1",),
+    )
+    plan = " ".join(str(row["detail"]) for row in await cursor.fetchall())
+    assert "idx_reviews_claimed_by" in plan
+
+
+async def test_pending_queue_order_uses_index(db: aiosqlite.Connection) -> None:
+    cursor = await db.execute(
+        """EXPLAIN QUERY PLAN
+           SELECT id FROM reviews WHERE status = ?
+           ORDER BY priority_rank, created_at ASC""",
+        ("pending",),
+    )
+    plan = " ".join(str(row["detail"]) for row in await cursor.fetchall())
+    assert "idx_reviews_queue" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+async def test_project_queue_order_uses_index(db: aiosqlite.Connection) -> None:
+    cursor = await db.execute(
+        """EXPLAIN QUERY PLAN
+           SELECT id FROM reviews WHERE status = ? AND project = ?
+           ORDER BY priority_rank, created_at ASC""",
+        ("pending", "gsd-tandem"),
+    )
+    plan = " ".join(str(row["detail"]) for row in await cursor.fetchall())
+    assert "idx_reviews_project_queue" in plan
+    assert "TEMP B-TREE" not in plan
+
+
 async def test_audit_events_review_id_migrates_to_nullable() -> None:
     conn = await aiosqlite.connect(":memory:", isolation_level=None)
     conn.row_factory = aiosqlite.Row
@@ -173,7 +207,7 @@ class TestSchemaMigration:
         monkeypatch.setattr(
             db_module,
             "SCHEMA_MIGRATIONS",
-            ["ALTER TABLE reviews THIS IS INVALID SQL"],
+            [(1, "ALTER TABLE reviews THIS IS INVALID SQL")],
         )
 
         with pytest.raises(aiosqlite.OperationalError):
@@ -181,6 +215,52 @@ class TestSchemaMigration:
 
         await conn.close()
 
+    async def test_applied_migrations_are_recorded(self, db: aiosqlite.Connection) -> None:
+        cursor = await db.execute("SELECT version FROM schema_migrations ORDER BY version")
+        versions = [row["version"] for row in await cursor.fetchall()]
+        assert versions == [version for version, _ in db_module.SCHEMA_MIGRATIONS]
+
+    async def test_rerun_skips_applied_migrations(self, db: aiosqlite.Connection) -> None:
+        statements: list[str] = []
+        await db.set_trace_callback(statements.append)
+        await ensure_schema(db)
+        await db.set_trace_callback(None)
+        assert not any(statement.startswith("ALTER TABLE") for statement in statements)
+
+    async def test_legacy_database_without_version_table_is_backfilled(self) -> None:
+        """Columns added before schema_migrations existed are recorded, not re-failed."""
+        conn = await aiosqlite.connect(":memory:", isolation_level=None)
+        conn.row_factory = aiosqlite.Row
+        await ensure_schema(conn)
+        await conn.execute("DROP TABLE schema_migrations")
+
+        await ensure_schema(conn)
+
+        cursor = await conn.execute("SELECT COUNT(*) AS n FROM schema_migrations")
+        row = await cursor.fetchone()
+        assert row["n"] == len(db_module.SCHEMA_MIGRATIONS)
+        await conn.close()
+
+    async def test_review_files_backfilled_from_affected_files(self) -> None:
+        """Existing reviews get review_files rows when the side table is introduced."""
+        conn = await aiosqlite.connect(":memory:", isolation_level=None)
+        conn.row_factory = aiosqlite.Row
+        await ensure_schema(conn)
+        await conn.execute(
+            """INSERT INTO reviews (id, intent, agent_type, agent_role, phase, affected_files)
+               VALUES ('r1', 'fix', 'gsd-executor', 'proposer', '1', ?)""",
+            ('[{"path": "a.py", "operation": "modify", "added": 2, "removed": 1}]',),
+        )
+        await conn.execute("DROP TABLE review_files")
+        await conn.execute("DELETE FROM schema_migrations WHERE version >= 20")
+
+        await ensure_schema(conn)
+        await ensure_schema(conn)
+
+        cursor = await conn.execute("SELECT review_id, path, added, removed FROM review_files")
+        assert [tuple(row) for row in await cursor.fetchall()] == [("r1", "a.py", 2, 1)]
+        await conn.close()
+
 
 def _winerror_10054_connection_reset() -> ConnectionResetError:
     exc = ConnectionResetError(10054, "An existing connection was forcibly closed")
@@ -198,6 +278,41 @@ def test_is_windows_proactor_reset_noise_detects_known_callback() -> None:
     assert db_module._is_windows_proactor_reset_noise(context) is True
 
 
+class _ProactorBasePipeTransport:
+    """Stand-in whose bound method qualname matches the real proactor transport."""
+
+    def _call_connection_lost(self) -> None:
+        return None
+
+    def _call_other(self) -> None:
+        return None
+
+
+async def test_is_windows_proactor_reset_noise_matches_handle_callback() -> None:
+    loop = asyncio.get_running_loop()
+    transport = _ProactorBasePipeTransport()
+    matching = {
+        "exception": _winerror_10054_connection_reset(),
+        "handle": asyncio.Handle(transport._call_connection_lost, (), loop),
+    }
+    assert db_module._is_windows_proactor_reset_noise(matching) is True
+
+    nonmatching = {
+        "exception": _winerror_10054_connection_reset(),
+        "handle": asyncio.Handle(transport._call_other, (), loop),
+    }
+    assert db_module._is_windows_proactor_reset_noise(nonmatching) is False
+
+
+def test_is_windows_proactor_reset_noise_ignores_non_handle_objects() -> None:
+    class _Opaque:
+        def __repr__(self) -> str:
+            return "_ProactorBasePipeTransport._call_connection_lost"
+
+    context = {"exception": _winerror_10054_connection_reset(), "handle": _Opaque()}
+    assert db_module._is_windows_proactor_reset_noise(context) is False
+
+
 def test_is_windows_proactor_reset_noise_ignores_nonmatching_context() -> None:
     nonmatching_message = {
         "message": "Exception in callback another_handler()",
@@ -294,7 +409,7 @@ def test_resolve_db_path_uses_home_config_fallback(monkeypatch) -> None:
     monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
     monkeypatch.setattr(db_module.os, "name", "posix")
     monkeypatch.setattr(db_module.sys, "platform", "linux")
-    monkeypatch.setattr(db_module.Path, "home", staticmethod(lambda: Path("/home/tester")))
+    monkeypatch.setenv("HOME", "/home/tester")
 
     path = db_module.resolve_db_path(repo_root=None)
     assert path == Path("/home/tester/.config/gsd-review-broker/codex_review_broker.sqlite3")
@@ -311,3 +426,52 @@ def test_repo_config_path_honors_env_override(monkeypatch) -> None:
     monkeypatch.setenv(db_module.CONFIG_PATH_ENV_VAR, custom_config)
     path = db_module._repo_config_path("/ignored/repo")
     assert path == Path(custom_config).expanduser()
+
+
+async def test_discover_repo_root_walks_up_to_git_dir(tmp_path: Path, monkeypatch) -> None:
+    (tmp_path / ".git").mkdir()
+    nested = tmp_path / "src" / "pkg"
+    nested.mkdir(parents=True)
+    monkeypatch.chdir(nested)
+
+    async def _no_subprocess(*_args, **_kwargs):
+        raise AssertionError("git should not be spawned when .git is found")
+
+    monkeypatch.setattr(db_module.asyncio, "create_subprocess_exec", _no_subprocess)
+    assert await db_module.discover_repo_root() == str(tmp_path)
+
+
+def test_find_repo_root_accepts_git_file(tmp_path: Path) -> None:
+    worktree = tmp_path / "worktree"
+    worktree.mkdir()
+    (worktree / ".git").write_text("gitdir: /elsewhere/.git/worktrees/wt\n")
+    assert db_module._find_repo_root(str(worktree)) == str(worktree)
+
+
+async def test_broker_lifespan_reads_committed_writes_through_reader(
+    tmp_path: Path, monkeypatch
+) -> None:
+    (tmp_path / ".git").mkdir()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(db_module.REPO_ROOT_ENV_VAR, raising=False)
+    monkeypatch.setenv(db_module.DB_PATH_ENV_VAR, str(tmp_path / "broker.sqlite3"))
+    monkeypatch.setenv(db_module.CONFIG_PATH_ENV_VAR, str(tmp_path / "missing.json"))
+    # The lifespan publishes its context to the dashboard; don't leak it past this test.
+    monkeypatch.setattr("gsd_review_broker.dashboard._app_ctx", None)
+
+    async with db_module.broker_lifespan(None) as ctx:
+        assert ctx.reader is not ctx.db
+        async with ctx.write_lock:
+            await ctx.db.execute("BEGIN IMMEDIATE")
+            await ctx.db.execute(
+                """INSERT INTO reviews (id, status, intent, agent_type, agent_role, phase)
+                   VALUES ('r-read', 'pending', 'intent', 'gsd-executor', 'proposer', '1')"""
+            )
+            cursor = await ctx.reader.execute("SELECT COUNT(*) FROM reviews")
+            assert (await cursor.fetchone())[0] == 0
+            await ctx.db.execute("COMMIT")
+
+        cursor = await ctx.reader.execute("SELECT id FROM reviews")
+        assert [row["id"] for row in await cursor.fetchall()] == ["r-read"]
+        with pytest.raises(aiosqlite.OperationalError):
+            await ctx.reader.execute("DELETE FROM reviews")
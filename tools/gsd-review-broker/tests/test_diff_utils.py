@@ -7,7 +7,11 @@ import subprocess
 
 import pytest
 
-from gsd_review_broker.diff_utils import extract_affected_files, validate_diff
+from gsd_review_broker.diff_utils import (
+    extract_affected_files,
+    parse_affected_files,
+    validate_diff,
+)
 
 # -- Realistic unified diff test data --
 
@@ -96,6 +100,14 @@ class TestExtractAffectedFiles:
         result = extract_affected_files("this is not a diff at all\nrandom garbage")
         assert result == "[]"
 
+    def test_parse_returns_json_and_entries(self) -> None:
+        blob, entries = parse_affected_files(MULTI_FILE_DIFF)
+        assert json.loads(blob) == entries
+        assert [e["path"] for e in entries] == ["alpha.py", "beta.py"]
+
+    def test_parse_failure_returns_empty_pair(self) -> None:
+        assert parse_affected_files("") == ("[]", [])
+
 
 class TestValidateDiff:
     """Tests for validate_diff using real temporary git repos."""
@@ -137,6 +149,23 @@ class TestValidateDiff:
         assert ok is True
         assert err == ""
 
+    async def test_text_without_patch_headers_fails_without_git(
+        self, git_repo, monkeypatch
+    ) -> None:
+        text = "just some prose\nnot a patch\n"
+        real = subprocess.run(
+            ["git", "apply", "--check"],
+            cwd=str(git_repo), input=text.encode(), capture_output=True,
+        )
+
+        async def _no_subprocess(*args, **kwargs):
+            raise AssertionError("git should not be spawned")
+
+        monkeypatch.setattr("asyncio.create_subprocess_exec", _no_subprocess)
+        ok, err = await validate_diff(text, cwd=str(git_repo))
+        assert ok is False
+        assert err == real.stderr.decode().strip()
+
     async def test_diff_references_nonexistent_file(self, git_repo) -> None:
         diff = (
             '--- a/nonexistent.py\n'
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import asyncio
 
+import pytest
+
 from gsd_review_broker.notifications import NotificationBus
 
 
@@ -12,7 +14,8 @@ class TestNotificationBus:
         """Notify on a review_id with no waiter should not raise."""
         bus = NotificationBus()
         bus.notify("no-waiter-review")
-        # No exception = pass
+        # Nobody is subscribed, so no slot is allocated.
+        assert "no-waiter-review" not in bus._slots
 
     async def test_notify_before_waiter_is_not_lost(self) -> None:
         """A pre-existing notify is observed when waiting from an older baseline."""
@@ -49,11 +52,11 @@ class TestNotificationBus:
     async def test_cleanup_removes_event(self) -> None:
         """cleanup removes the event entry for a review_id."""
         bus = NotificationBus()
-        # Create an event by calling _get_event
-        bus._get_event("cleanup-review")
-        assert "cleanup-review" in bus._events
+        # Create a slot by calling _slot
+        bus._slot("cleanup-review")
+        assert "cleanup-review" in bus._slots
         bus.cleanup("cleanup-review")
-        assert "cleanup-review" not in bus._events
+        assert "cleanup-review" not in bus._slots
 
     async def test_cleanup_nonexistent_is_noop(self) -> None:
         """cleanup on non-existent review_id does not raise."""
@@ -96,3 +99,95 @@ class TestNotificationBus:
         assert result_a is True
         assert result_b is False
         await task
+
+    async def test_notify_many_bumps_only_subscribed_reviews(self) -> None:
+        """notify_many wakes every subscribed review and skips unknown ids."""
+        bus = NotificationBus()
+        baseline_a = bus.current_version("review-a")
+        baseline_b = bus.current_version("review-b")
+
+        bus.notify_many(["review-a", "review-b", "review-unknown"])
+
+        assert bus.current_version("review-a") > baseline_a
+        assert bus.current_version("review-b") > baseline_b
+        assert "review-unknown" not in bus._slots
+
+    async def test_versions_stay_monotonic_without_a_slot(self) -> None:
+        """notify() on a slot-less review still advances versions seen by later slots."""
+        bus = NotificationBus()
+        baseline = bus.current_version("other-review")
+        bus.notify("slotless-review")
+        assert "slotless-review" not in bus._slots
+        assert bus.current_version("slotless-review") > baseline
+
+    async def test_waiters_exist_only_while_waiting(self) -> None:
+        """A slot parks waiters only while someone is waiting on it."""
+        bus = NotificationBus()
+        review_id = "lazy-waiter-review"
+        bus.current_version(review_id)
+        assert bus._slots[review_id].waiters is None
+
+        waiter = asyncio.create_task(bus.wait_for_change(review_id, timeout=5.0))
+        await asyncio.sleep(0)
+        assert len(bus._slots[review_id].waiters) == 1
+
+        bus.notify(review_id)
+        assert await waiter is True
+        assert bus._slots[review_id].waiters is None
+
+    async def test_cancelled_waiter_is_unparked(self) -> None:
+        """Cancelling a long-poll removes its waiter from the slot."""
+        bus = NotificationBus()
+        review_id = "cancelled-waiter-review"
+        waiter = asyncio.create_task(bus.wait_for_change(review_id, timeout=5.0))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert bus._slots[review_id].waiters is None
+
+    async def test_idle_slots_are_evicted_lru_first(self) -> None:
+        """Past max_slots, the least recently used idle slot is dropped."""
+        bus = NotificationBus(max_slots=2)
+        bus.current_version("old")
+        bus.current_version("middle")
+        bus.current_version("old")  # refresh: "middle" is now least recent
+
+        bus.current_version("new")
+
+        assert list(bus._slots) == ["old", "new"]
+
+    async def test_eviction_between_baseline_and_wait_keeps_the_change(self) -> None:
+        """A notify landing while a baselined slot is evicted still wakes the waiter."""
+        bus = NotificationBus(max_slots=2)
+        baseline = bus.current_version("queue")
+        bus.current_version("a")
+        bus.current_version("b")
+        assert "queue" not in bus._slots
+
+        bus.notify("queue")
+        assert await bus.wait_for_change("queue", timeout=0.05, since_version=baseline) is True
+
+    async def test_notify_refreshes_lru_order(self) -> None:
+        """A notified slot moves to the most recently used end."""
+        bus = NotificationBus(max_slots=2)
+        bus.current_version("old")
+        bus.current_version("middle")
+        bus.notify("old")
+
+        bus.current_version("new")
+
+        assert list(bus._slots) == ["old", "new"]
+
+    async def test_eviction_skips_slots_with_waiters(self) -> None:
+        """A slot with a parked waiter is never evicted."""
+        bus = NotificationBus(max_slots=1)
+        waiter = asyncio.create_task(bus.wait_for_change("parked", timeout=5.0))
+        await asyncio.sleep(0)
+
+        bus.current_version("other")
+        assert list(bus._slots) == ["parked", "other"]
+
+        bus.notify("parked")
+        assert await waiter is True
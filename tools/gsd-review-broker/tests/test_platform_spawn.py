@@ -11,6 +11,14 @@ from gsd_review_broker.config_schema import SpawnConfig
 from gsd_review_broker.platform_spawn import build_codex_argv, detect_platform, load_prompt_template
 
 
+@pytest.fixture(autouse=True)
+def _reset_platform_cache():
+    """Tests patch os.name, so drop the memoized platform around each test."""
+    detect_platform.cache_clear()
+    yield
+    detect_platform.cache_clear()
+
+
 def _config(tmp_path: Path, **overrides) -> SpawnConfig:
     base = {
         "workspace_path": str(tmp_path),
@@ -112,6 +120,24 @@ def test_load_prompt_template(tmp_path: Path) -> None:
     assert "codex-r1-abc" in loaded
 
 
+def test_load_prompt_template_normalizes_crlf(tmp_path: Path) -> None:
+    template = tmp_path / "reviewer_prompt.md"
+    template.write_bytes(b'You are "{reviewer_id}"\r\n{claim_generation_note}\r\n')
+    loaded = load_prompt_template(template, "codex-r1-abc")
+    assert "\r" not in loaded
+    assert loaded.startswith('You are "codex-r1-abc"\n')
+
+
+def test_load_prompt_template_rereads_changed_file(tmp_path: Path) -> None:
+    template = tmp_path / "reviewer_prompt.md"
+    template.write_text("first {reviewer_id}\n", encoding="utf-8")
+    assert load_prompt_template(template, "r1") == "first r1\n"
+    assert load_prompt_template(template, "r2") == "first r2\n"
+
+    template.write_text("second edit {reviewer_id}\n", encoding="utf-8")
+    assert load_prompt_template(template, "r3") == "second edit r3\n"
+
+
 def test_load_prompt_template_no_unresolved_placeholders(tmp_path: Path) -> None:
     template = tmp_path / "reviewer_prompt.md"
     template.write_text(
@@ -4,14 +4,26 @@ from __future__ import annotations
 
 import asyncio
 import json
+import sys
+import time
+from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import AsyncMock
 
 import aiosqlite
 import pytest
 
+from gsd_review_broker import pool as pool_module
 from gsd_review_broker.config_schema import SpawnConfig
-from gsd_review_broker.pool import ReviewerPool
+from gsd_review_broker.pool import (
+    _PIPE_BUFFER_SIZE,
+    ReviewerPool,
+    _JsonlRotatingWriter,
+    _pipelined,
+    _stop_reviewer_process,
+    _utc_timestamp,
+    _widen_pipe_buffers,
+)
 
 
 class _FakeStdin:
@@ -30,13 +42,15 @@ class _FakeStdin:
 
 
 class _FakeStream:
-    def __init__(self, lines: list[str] | None = None) -> None:
+    def __init__(
+        self, lines: list[str] | None = None, *, chunks: list[bytes] | None = None
+    ) -> None:
         payloads = lines or []
-        self._lines = [f"{line}\n".encode() for line in payloads]
+        self._chunks = chunks or [f"{line}\n".encode() for line in payloads]
 
-    async def readline(self) -> bytes:
-        if self._lines:
-            return self._lines.pop(0)
+    async def read(self, n: int = -1) -> bytes:
+        if self._chunks:
+            return self._chunks.pop(0)
         return b""
 
 
@@ -157,6 +171,33 @@ def test_resolve_prompt_honors_env_override(
     assert pool._resolve_prompt_template_path() == forced_prompt
 
 
+def test_resolved_prompt_path_is_cached_while_it_exists(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    cfg = SpawnConfig(
+        workspace_path=str(workspace),
+        prompt_template_path="reviewer_prompt.md",
+        spawn_cooldown_seconds=1.0,
+        max_pool_size=3,
+        model="o4-mini",
+    )
+    pool = ReviewerPool(session_token="abcd1234", config=cfg)
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    monkeypatch.chdir(tmp_path)
+
+    # Nothing exists yet: the fallback is returned but not cached.
+    assert pool._resolve_prompt_template_path() == workspace / "reviewer_prompt.md"
+    cwd_prompt = tmp_path / "reviewer_prompt.md"
+    cwd_prompt.write_text("cwd", encoding="utf-8")
+    assert pool._resolve_prompt_template_path() == cwd_prompt
+
+    # Once found, later lookups skip the candidate scan.
+    (workspace / "reviewer_prompt.md").write_text("workspace", encoding="utf-8")
+    assert pool._resolve_prompt_template_path() == cwd_prompt
+
+
 def test_resolve_workspace_prefers_matching_project_child(tmp_path: Path) -> None:
     projects_root = tmp_path / "Projects"
     projects_root.mkdir()
@@ -344,8 +385,10 @@ async def test_spawn_reviewer_applies_project_local_overrides(
 async def test_spawn_reviewer_rate_limited(
     pool: ReviewerPool, db: aiosqlite.Connection, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    pool._last_spawn_time = asyncio.get_running_loop().time()
-    monkeypatch.setattr("gsd_review_broker.pool.time.monotonic", lambda: pool._last_spawn_time)
+    pool._last_spawn_time_ns = time.monotonic_ns()
+    monkeypatch.setattr(
+        "gsd_review_broker.pool.time.monotonic_ns", lambda: pool._last_spawn_time_ns
+    )
     result = await pool.spawn_reviewer(db, asyncio.Lock())
     assert "error" in result
     assert "cooldown" in result["error"].lower()
@@ -379,6 +422,79 @@ async def test_spawn_reviewer_ids_contain_session_token(
     assert result["reviewer_id"].endswith("-abcd1234")
 
 
+async def test_spawn_reviewers_persists_batch_up_to_cap(
+    pool: ReviewerPool, db: aiosqlite.Connection, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    procs = [_FakeProcess(pid=5000 + i) for i in range(4)]
+    monkeypatch.setattr(
+        "gsd_review_broker.pool.asyncio.create_subprocess_exec", AsyncMock(side_effect=procs)
+    )
+    monkeypatch.setattr("gsd_review_broker.pool.build_codex_argv", lambda _cfg: ["codex", "-"])
+    monkeypatch.setattr(
+        "gsd_review_broker.pool.load_prompt_template",
+        lambda _path, reviewer_id: reviewer_id,
+    )
+
+    results = await pool.spawn_reviewers(db, asyncio.Lock(), [None, "a", "b", "c"])
+
+    assert [result.get("pid") for result in results[:3]] == [5000, 5001, 5002]
+    assert "cap" in results[3]["error"].lower()
+    cursor = await db.execute("SELECT pid FROM reviewers ORDER BY pid")
+    assert [row["pid"] for row in await cursor.fetchall()] == [5000, 5001, 5002]
+    cursor = await db.execute(
+        "SELECT COUNT(*) AS n FROM audit_events WHERE event_type = 'reviewer_spawned'"
+    )
+    assert (await cursor.fetchone())["n"] == 3
+
+
+async def test_spawn_reviewers_tears_down_batch_when_insert_fails(
+    pool: ReviewerPool, db: aiosqlite.Connection, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    procs = [_FakeProcess(pid=5000 + i) for i in range(2)]
+    monkeypatch.setattr(
+        "gsd_review_broker.pool.asyncio.create_subprocess_exec", AsyncMock(side_effect=procs)
+    )
+    monkeypatch.setattr("gsd_review_broker.pool.build_codex_argv", lambda _cfg: ["codex", "-"])
+    monkeypatch.setattr(
+        "gsd_review_broker.pool.load_prompt_template",
+        lambda _path, reviewer_id: reviewer_id,
+    )
+    # Collides with the second reviewer's primary key.
+    await db.execute(
+        """INSERT INTO reviewers (id, display_name, session_token, status)
+           VALUES ('codex-r2-abcd1234', 'codex-r2', 'abcd1234', 'terminated')"""
+    )
+
+    results = await pool.spawn_reviewers(db, asyncio.Lock(), [None, None])
+
+    assert all("error" in result for result in results)
+    assert all(proc.terminated for proc in procs)
+    assert pool._processes == {}
+    cursor = await db.execute("SELECT COUNT(*) AS n FROM reviewers")
+    assert (await cursor.fetchone())["n"] == 1
+
+
+async def test_update_reviewer_stats_increments_counters(
+    pool: ReviewerPool, db: aiosqlite.Connection
+) -> None:
+    await db.execute(
+        """INSERT INTO reviewers (id, display_name, session_token, status)
+           VALUES ('codex-r1-abcd1234', 'codex-r1', 'abcd1234', 'active')"""
+    )
+    await pool.update_reviewer_stats("codex-r1-abcd1234", db, asyncio.Lock(), "approved", 2.5)
+    await pool.update_reviewer_stats(
+        "codex-r1-abcd1234", db, asyncio.Lock(), "changes_requested", 1.5
+    )
+
+    cursor = await db.execute(
+        """SELECT reviews_completed, total_review_seconds, approvals, rejections
+           FROM reviewers WHERE id = 'codex-r1-abcd1234'"""
+    )
+    row = await cursor.fetchone()
+    assert tuple(row) == (2, 4.0, 1, 1)
+    assert not db.in_transaction
+
+
 async def test_drain_reviewer_marks_draining(
     pool: ReviewerPool, db: aiosqlite.Connection, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -398,6 +514,44 @@ async def test_drain_reviewer_marks_draining(
     assert result["status"] == "draining"
 
 
+async def test_drain_reviewer_returns_before_process_exits(
+    pool: ReviewerPool, db: aiosqlite.Connection, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    exited = asyncio.Event()
+
+    class _SlowExitProcess(_FakeProcess):
+        def terminate(self) -> None:
+            self.terminated = True
+
+        async def wait(self) -> int | None:
+            await exited.wait()
+            self.returncode = -15
+            return self.returncode
+
+    proc = _SlowExitProcess()
+    monkeypatch.setattr(
+        "gsd_review_broker.pool.asyncio.create_subprocess_exec", AsyncMock(return_value=proc)
+    )
+    monkeypatch.setattr("gsd_review_broker.pool.build_codex_argv", lambda _cfg: ["codex", "-"])
+    monkeypatch.setattr(
+        "gsd_review_broker.pool.load_prompt_template",
+        lambda _path, reviewer_id: reviewer_id,
+    )
+    reviewer_id = (await pool.spawn_reviewer(db, asyncio.Lock()))["reviewer_id"]
+
+    result = await pool.drain_reviewer(reviewer_id, db, asyncio.Lock(), reason="manual")
+    assert result["terminating"] is True
+    assert result["terminated"] is False
+    assert await pool.wait_for_termination(reviewer_id, timeout=0.05) is False
+    assert proc.terminated is True
+
+    exited.set()
+    assert await pool.wait_for_termination(reviewer_id, timeout=1.0) is True
+    assert pool.is_terminated(reviewer_id)
+    cursor = await db.execute("SELECT status FROM reviewers WHERE id = ?", (reviewer_id,))
+    assert (await cursor.fetchone())["status"] == "terminated"
+
+
 async def test_terminate_reviewer_kills_process(
     pool: ReviewerPool, db: aiosqlite.Connection, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -418,6 +572,93 @@ async def test_terminate_reviewer_kills_process(
     assert fake_proc.terminated is True
 
 
+async def test_terminate_reviewer_records_reviews_completed(
+    pool: ReviewerPool, db: aiosqlite.Connection
+) -> None:
+    await db.execute(
+        """INSERT INTO reviewers (id, display_name, session_token, status, reviews_completed)
+           VALUES ('r-done', 'r-done', 'abcd1234', 'draining', 3)"""
+    )
+    await pool._terminate_reviewer("r-done", db, asyncio.Lock())
+
+    cursor = await db.execute("SELECT status FROM reviewers WHERE id = 'r-done'")
+    assert (await cursor.fetchone())["status"] == "terminated"
+    cursor = await db.execute(
+        "SELECT metadata FROM audit_events WHERE event_type = 'reviewer_terminated'"
+    )
+    assert json.loads((await cursor.fetchone())["metadata"]) == {
+        "reviewer_id": "r-done",
+        "exit_code": None,
+        "reviews_completed": 3,
+    }
+
+
+async def test_spawn_feeds_prompt_to_stdin(
+    pool: ReviewerPool, db: aiosqlite.Connection, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fake_proc = _FakeProcess()
+    monkeypatch.setattr(
+        "gsd_review_broker.pool.asyncio.create_subprocess_exec",
+        AsyncMock(return_value=fake_proc),
+    )
+    monkeypatch.setattr("gsd_review_broker.pool.build_codex_argv", lambda _cfg: ["codex", "-"])
+    monkeypatch.setattr(
+        "gsd_review_broker.pool.load_prompt_template",
+        lambda _path, reviewer_id: f"prompt for {reviewer_id}",
+    )
+    spawned = await pool.spawn_reviewer(db, asyncio.Lock())
+    await asyncio.gather(*pool._stream_tasks[spawned["reviewer_id"]])
+
+    assert fake_proc.stdin.writes == [f"prompt for {spawned['reviewer_id']}".encode()]
+    assert fake_proc.stdin.closed is True
+
+
+async def test_send_prompt_delivers_large_prompt_without_drain() -> None:
+    payload = b"x" * (1024 * 1024) + b"\n"
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-c",
+        "import sys; print(len(sys.stdin.buffer.read()))",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+    )
+    ReviewerPool._send_prompt(process.stdin, payload)
+    stdout, _ = await asyncio.wait_for(process.communicate(), timeout=10.0)
+    assert int(stdout) == len(payload)
+
+
+def _pid_gone(pid: int) -> bool:
+    try:
+        with open(f"/proc/{pid}/stat", encoding="ascii") as handle:
+            return handle.read().rsplit(")", 1)[1].split()[0] == "Z"
+    except FileNotFoundError:
+        return True
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="uses /proc")
+async def test_stop_reviewer_process_signals_whole_process_group() -> None:
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-c",
+        "import subprocess, sys, time\n"
+        "child = subprocess.Popen(['sleep', '30'])\n"
+        "print(child.pid, flush=True)\n"
+        "time.sleep(30)\n",
+        stdout=asyncio.subprocess.PIPE,
+        start_new_session=True,
+    )
+    grandchild_pid = int(await asyncio.wait_for(process.stdout.readline(), timeout=10.0))
+
+    _stop_reviewer_process(process)
+    await asyncio.wait_for(process.wait(), timeout=10.0)
+
+    for _ in range(100):
+        if _pid_gone(grandchild_pid):
+            break
+        await asyncio.sleep(0.02)
+    assert _pid_gone(grandchild_pid)
+
+
 async def test_shutdown_all(
     pool: ReviewerPool, db: aiosqlite.Connection, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -431,13 +672,46 @@ async def test_shutdown_all(
     )
     await pool.spawn_reviewer(db, asyncio.Lock())
     # bypass cooldown for second spawn
-    pool._last_spawn_time = 0.0
+    pool._last_spawn_time_ns = 0
     await pool.spawn_reviewer(db, asyncio.Lock())
     await pool.shutdown_all(db, asyncio.Lock())
     assert pool._processes == {}
     assert all(proc.terminated for proc in procs)
 
 
+async def test_shutdown_all_waits_for_processes_concurrently(
+    pool: ReviewerPool, db: aiosqlite.Connection, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class _SlowExitProcess(_FakeProcess):
+        def terminate(self) -> None:
+            self.terminated = True
+
+        async def wait(self) -> int | None:
+            await asyncio.sleep(0.1)
+            self.returncode = -15
+            return self.returncode
+
+    procs = [_SlowExitProcess(pid=2000 + i) for i in range(3)]
+    monkeypatch.setattr(
+        "gsd_review_broker.pool.asyncio.create_subprocess_exec", AsyncMock(side_effect=procs)
+    )
+    monkeypatch.setattr("gsd_review_broker.pool.build_codex_argv", lambda _cfg: ["codex", "-"])
+    monkeypatch.setattr(
+        "gsd_review_broker.pool.load_prompt_template",
+        lambda _path, reviewer_id: reviewer_id,
+    )
+    for _ in procs:
+        await pool.spawn_reviewer(db, asyncio.Lock(), ignore_cooldown=True)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await pool.shutdown_all(db, asyncio.Lock())
+
+    assert loop.time() - started < 0.25
+    assert pool._processes == {}
+    assert all(proc.returncode == -15 for proc in procs)
+
+
 async def test_spawn_records_audit_event(
     pool: ReviewerPool, db: aiosqlite.Connection, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -550,6 +824,29 @@ async def test_spawn_writes_structured_reviewer_logs(
     assert '"event":"reviewer_output"' in payload
     assert '"stream":"stdout"' in payload
     assert '"stream":"stderr"' in payload
+    output = [
+        record
+        for record in map(json.loads, payload.splitlines())
+        if record["event"] == "reviewer_output"
+    ]
+    assert output and all(r["session_token"] == pool.session_token for r in output)
+    assert all(r["ts"].endswith("Z") and "message" in r for r in output)
+
+
+async def test_drain_splits_chunked_output_into_lines(
+    pool: ReviewerPool, tmp_path: Path
+) -> None:
+    path = tmp_path / "chunked.jsonl"
+    writer = _JsonlRotatingWriter(path, max_bytes=1024 * 1024, backups=1)
+    pool._log_writers["r-chunks"] = writer
+    stream = _FakeStream(chunks=[b"first\r\nsec", b"ond\n\nthi", b"rd"])
+
+    await pool._drain_reviewer_stream("r-chunks", 99, "stdout", stream)
+    await writer.close()
+
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [r["message"] for r in records] == ["first", "second", "", "third"]
+    assert {(r["stream"], r["pid"]) for r in records} == {("stdout", 99)}
 
 
 async def test_spawn_rotates_reviewer_logs(
@@ -608,3 +905,218 @@ async def test_spawn_db_failure_terminates_orphan(
     assert "error" in result
     assert fake_proc.terminated is True
     assert pool._processes == {}
+
+
+async def test_jsonl_writer_batches_queued_records(tmp_path: Path) -> None:
+    path = tmp_path / "batched.jsonl"
+    writer = _JsonlRotatingWriter(path, max_bytes=1024 * 1024, backups=1, max_batch=2)
+    batch_sizes: list[int] = []
+    write_lines = writer._write_lines
+
+    def _recording_write(lines: list[bytes]) -> None:
+        batch_sizes.append(len(lines))
+        write_lines(lines)
+
+    writer._write_lines = _recording_write
+    for i in range(5):
+        await writer.write_record({"n": i})
+    await writer.flush()
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["n"] for line in lines] == [0, 1, 2, 3, 4]
+    assert batch_sizes == [2, 2, 1]
+    await writer.close()
+
+
+async def test_jsonl_writer_flushes_records_queued_during_write(tmp_path: Path) -> None:
+    path = tmp_path / "late.jsonl"
+    writer = _JsonlRotatingWriter(path, max_bytes=1024 * 1024, backups=1)
+    write_lines = writer._write_lines
+    in_flight = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    def _slow_write(lines: list[bytes]) -> None:
+        loop.call_soon_threadsafe(in_flight.set)
+        time.sleep(0.05)
+        write_lines(lines)
+
+    writer._write_lines = _slow_write
+    await writer.write_record({"n": 0})
+    await in_flight.wait()
+    await writer.write_record({"n": 1})
+
+    await asyncio.sleep(0.2)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["n"] for line in lines] == [0, 1]
+    await writer.close()
+
+
+async def test_jsonl_writer_logs_failed_write_and_keeps_consuming(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    path = tmp_path / "flaky.jsonl"
+    writer = _JsonlRotatingWriter(path, max_bytes=1024, backups=1)
+    write_lines = writer._write_lines
+    failures = [OSError("disk full")]
+
+    def _flaky_write(lines: list[bytes]) -> None:
+        if failures:
+            raise failures.pop()
+        write_lines(lines)
+
+    writer._write_lines = _flaky_write
+    await writer.write_record({"n": 0})
+    await writer.flush()
+    await writer.write_record({"n": 1})
+    await asyncio.wait_for(writer.close(), timeout=1.0)
+
+    assert "Failed writing reviewer log batch" in caplog.text
+    assert [json.loads(line)["n"] for line in path.read_text().splitlines()] == [1]
+
+
+async def test_jsonl_writer_consumer_exits_when_idle(tmp_path: Path) -> None:
+    writer = _JsonlRotatingWriter(tmp_path / "idle.jsonl", max_bytes=1024, backups=1)
+    await writer.write_record({"n": 0})
+    await writer.flush()
+    await asyncio.sleep(0)
+    assert writer._consumer is None
+    await writer.close()
+
+
+async def test_jsonl_writer_restarts_dead_consumer(tmp_path: Path) -> None:
+    path = tmp_path / "restart.jsonl"
+    writer = _JsonlRotatingWriter(path, max_bytes=1024, backups=1)
+    await writer.write_record({"n": 0})
+    writer._consumer.cancel()
+    await asyncio.sleep(0)
+    assert writer._consumer.done()
+
+    await writer.write_record({"n": 1})
+    await asyncio.wait_for(writer.close(), timeout=1.0)
+
+    assert [json.loads(line)["n"] for line in path.read_text().splitlines()] == [0, 1]
+
+
+async def test_jsonl_writer_close_waits_for_in_flight_flush(tmp_path: Path) -> None:
+    path = tmp_path / "closing.jsonl"
+    writer = _JsonlRotatingWriter(path, max_bytes=1024 * 1024, backups=1)
+    write_lines = writer._write_lines
+    in_flight = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    active = 0
+    max_active = 0
+
+    def _slow_write(lines: list[bytes]) -> None:
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        loop.call_soon_threadsafe(in_flight.set)
+        time.sleep(0.05)
+        write_lines(lines)
+        active -= 1
+
+    writer._write_lines = _slow_write
+    await writer.write_record({"n": 0})
+    await in_flight.wait()
+    await writer.write_record({"n": 1})
+    await writer.close()
+
+    assert max_active == 1
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["n"] for line in lines] == [0, 1]
+
+
+async def test_jsonl_writer_restarted_consumer_waits_for_orphaned_write(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "orphaned.jsonl"
+    writer = _JsonlRotatingWriter(path, max_bytes=1024 * 1024, backups=1)
+    write_lines = writer._write_lines
+    in_flight = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    active = 0
+    max_active = 0
+
+    def _slow_write(lines: list[bytes]) -> None:
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        loop.call_soon_threadsafe(in_flight.set)
+        time.sleep(0.05)
+        write_lines(lines)
+        active -= 1
+
+    writer._write_lines = _slow_write
+    await writer.write_record({"n": 0})
+    await in_flight.wait()
+    writer._consumer.cancel()
+    await asyncio.sleep(0)
+    await writer.write_record({"n": 1})
+    await asyncio.wait_for(writer.close(), timeout=1.0)
+
+    assert max_active == 1
+    assert writer._fd is None
+    assert [json.loads(line)["n"] for line in path.read_text().splitlines()] == [0, 1]
+
+
+async def test_jsonl_writer_close_drains_and_rotates_per_line(tmp_path: Path) -> None:
+    path = tmp_path / "rotating.jsonl"
+    writer = _JsonlRotatingWriter(path, max_bytes=64, backups=3)
+    for i in range(3):
+        await writer.write_record({"n": i, "pad": "x" * 40})
+    await writer.close()
+
+    assert json.loads(path.read_text(encoding="utf-8"))["n"] == 2
+    assert json.loads(Path(f"{path}.1").read_text(encoding="utf-8"))["n"] == 1
+    assert json.loads(Path(f"{path}.2").read_text(encoding="utf-8"))["n"] == 0
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="F_SETPIPE_SZ is Linux-only")
+async def test_widen_pipe_buffers_grows_stdout_and_stderr_pipes() -> None:
+    import fcntl
+
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-c",
+        "import sys; sys.stdin.read()",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        _widen_pipe_buffers(process)
+        for fd in (1, 2):
+            pipe = process._transport.get_pipe_transport(fd).get_extra_info("pipe")
+            assert fcntl.fcntl(pipe.fileno(), fcntl.F_GETPIPE_SZ) == _PIPE_BUFFER_SIZE
+    finally:
+        process.stdin.close()
+        await process.wait()
+
+
+def test_utc_timestamp_matches_isoformat(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pool_module, "_timestamp_prefix_cache", (-1, ""))
+    for now_ns in (
+        1_700_000_000_123_456_789,
+        1_700_000_000_999_000_000,
+        1_700_000_001_000_000_000,
+    ):
+        monkeypatch.setattr(pool_module.time, "time_ns", lambda now_ns=now_ns: now_ns)
+        expected = datetime.fromtimestamp(now_ns // 1_000_000 / 1000, UTC).isoformat(
+            timespec="milliseconds"
+        ).replace("+00:00", "Z")
+        assert _utc_timestamp() == expected
+
+
+async def test_pipelined_runs_every_statement_in_order_then_raises(
+    db: aiosqlite.Connection,
+) -> None:
+    statements: list[str] = []
+    await db.set_trace_callback(statements.append)
+    with pytest.raises(aiosqlite.OperationalError):
+        await _pipelined(
+            db.execute("SELECT 1"),
+            db.execute("SELECT * FROM missing_table"),
+            db.execute("SELECT 2"),
+        )
+    await db.set_trace_callback(None)
+    assert statements == ["SELECT 1", "SELECT 2"]
@@ -19,6 +19,7 @@ from gsd_review_broker.tools import (
     close_review,
     create_review,
     get_proposal,
+    list_reviews,
     submit_verdict,
 )
 
@@ -150,6 +151,25 @@ class TestCreateReviewWithProposal:
         assert ops["new_file.py"] == "create"
         assert ops["existing.py"] == "modify"
 
+    async def test_create_review_indexes_affected_paths(self, ctx: MockContext) -> None:
+        """Each affected file gets a review_files row for indexed path lookups."""
+        result = await _create_review(ctx, diff=SAMPLE_MULTI_FILE_DIFF)
+        review_id = result["review_id"]
+
+        cursor = await ctx.lifespan_context.db.execute(
+            "SELECT review_id, operation FROM review_files WHERE path = ?", ("new_file.py",)
+        )
+        rows = await cursor.fetchall()
+        assert [(r["review_id"], r["operation"]) for r in rows] == [(review_id, "create")]
+
+    async def test_list_reviews_filters_by_affected_path(self, ctx: MockContext) -> None:
+        """list_reviews(path=...) returns only reviews whose diff touches that file."""
+        touching = await _create_review(ctx, diff=SAMPLE_MULTI_FILE_DIFF)
+        await _create_review(ctx, diff=SAMPLE_DIFF)
+
+        result = await list_reviews.fn(path="existing.py", ctx=ctx)
+        assert [r["id"] for r in result["reviews"]] == [touching["review_id"]]
+
     async def test_create_review_validates_diff_on_submission(
         self, ctx: MockContext
     ) -> None:
@@ -249,6 +269,10 @@ class TestRevisionFlow:
         # affected_files should reflect the new diff
         files = json.loads(row["affected_files"])
         assert len(files) == 2
+        cursor = await ctx.lifespan_context.db.execute(
+            "SELECT path FROM review_files WHERE review_id = ? ORDER BY path", (review_id,)
+        )
+        assert [r["path"] for r in await cursor.fetchall()] == ["existing.py", "new_file.py"]
 
     async def test_revision_with_invalid_diff_is_rejected(self, ctx: MockContext) -> None:
         """Revision fails when new diff does not apply; prior review state stays intact."""
@@ -473,6 +497,51 @@ class TestClaimWithDiffValidation:
             SAMPLE_DIFF, cwd=ctx.lifespan_context.repo_root
         )
 
+    async def test_claim_review_validates_diff_outside_write_lock(
+        self, ctx: MockContext
+    ) -> None:
+        created = await _create_review(ctx, diff=SAMPLE_DIFF)
+        app = ctx.lifespan_context
+        lock_held: list[bool] = []
+
+        async def _validate(diff: str, cwd: str | None = None) -> tuple[bool, str]:
+            lock_held.append(app.write_lock.locked())
+            return True, ""
+
+        with patch("gsd_review_broker.tools.validate_diff", side_effect=_validate):
+            result = await claim_review.fn(
+                review_id=created["review_id"], reviewer_id="reviewer-1", ctx=ctx
+            )
+
+        assert result["status"] == "claimed"
+        assert lock_held == [False]
+
+    async def test_claim_review_revalidates_diff_revised_during_validation(
+        self, ctx: MockContext
+    ) -> None:
+        created = await _create_review(ctx, diff=SAMPLE_DIFF)
+        app = ctx.lifespan_context
+        revised_diff = SAMPLE_DIFF.replace("TWO modified", "2 modified")
+        seen: list[str] = []
+
+        async def _validate(diff: str, cwd: str | None = None) -> tuple[bool, str]:
+            seen.append(diff)
+            if len(seen) == 1:
+                await app.db.execute(
+                    "UPDATE reviews SET diff = ? WHERE id = ?",
+                    (revised_diff, created["review_id"]),
+                )
+                return True, ""
+            return False, "error: patch does not apply"
+
+        with patch("gsd_review_broker.tools.validate_diff", side_effect=_validate):
+            result = await claim_review.fn(
+                review_id=created["review_id"], reviewer_id="reviewer-1", ctx=ctx
+            )
+
+        assert seen == [SAMPLE_DIFF, revised_diff]
+        assert result["auto_rejected"] is True
+
 
 # ---- TestGetProposal ----
 
@@ -287,6 +287,31 @@ async def test_claim_review_rejects_terminated_reviewer(ctx: MockContext) -> Non
     assert "cannot claim new reviews" in result["error"]
 
 
+async def test_claim_review_releases_reservation_of_terminated_reviewer(
+    ctx: MockContext,
+) -> None:
+    await _insert_reviewer(ctx, "reviewer-gone", status="terminated")
+    await _insert_reviewer(ctx, "reviewer-b")
+    created = await _create_review(ctx)
+    await ctx.lifespan_context.db.execute(
+        "UPDATE reviews SET claimed_by = 'reviewer-gone', claimed_at = datetime('now') "
+        "WHERE id = ?",
+        (created["review_id"],),
+    )
+    result = await claim_review.fn(
+        review_id=created["review_id"],
+        reviewer_id="reviewer-b",
+        ctx=ctx,
+    )
+    assert result["claimed_by"] == "reviewer-b"
+    cursor = await ctx.lifespan_context.db.execute(
+        "SELECT claimed_by, status FROM reviews WHERE id = ?",
+        (created["review_id"],),
+    )
+    row = await cursor.fetchone()
+    assert (row["claimed_by"], row["status"]) == ("reviewer-b", "claimed")
+
+
 async def test_drain_finalization_after_terminal_verdict(ctx: MockContext) -> None:
     await _insert_reviewer(ctx, "reviewer-a", status="active")
     created = await _create_review(ctx)
@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from gsd_review_broker import db as db_module
 from gsd_review_broker.config_schema import SpawnConfig
 from gsd_review_broker.db import (
     _check_claim_timeouts,
@@ -16,9 +17,8 @@ from gsd_review_broker.db import (
     _check_idle_timeouts,
     _check_reactive_scaling,
     _check_ttl_expiry,
-    _startup_ownership_sweep,
     _startup_reactive_scale_check,
-    _startup_terminate_stale_reviewers,
+    _startup_recover_stale_session,
 )
 from gsd_review_broker.pool import ReviewerPool
 from gsd_review_broker.tools import (
@@ -53,7 +53,7 @@ class _FakeStdin:
 
 
 class _FakeStream:
-    async def readline(self) -> bytes:
+    async def read(self, n: int = -1) -> bytes:
         return b""
 
 
@@ -157,7 +157,7 @@ async def test_kill_reviewer_tool(
 ) -> None:
     pool, _ = await _attach_pool(ctx, tmp_path, monkeypatch)
     spawned = await spawn_reviewer.fn(ctx=ctx)
-    pool._last_spawn_time = 0.0
+    pool._last_spawn_time_ns = 0
     killed = await kill_reviewer.fn(spawned["reviewer_id"], ctx=ctx)
     assert "error" not in killed
     assert killed["status"] == "draining"
@@ -181,17 +181,8 @@ async def test_reactive_scaling_cold_start(
     ctx: MockContext, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     pool, spawn_mock = await _attach_pool(ctx, tmp_path, monkeypatch)
-    real_create_task = asyncio.create_task
-    scheduled: list[asyncio.Task] = []
-
-    def _track_task(coro):  # noqa: ANN001
-        task = real_create_task(coro)
-        scheduled.append(task)
-        return task
-
-    monkeypatch.setattr("gsd_review_broker.tools.asyncio.create_task", _track_task)
     await _create_review(ctx, intent="cold-start")
-    await asyncio.gather(*scheduled)
+    await asyncio.gather(*ctx.lifespan_context.background_tasks)
     assert spawn_mock.await_count >= 1
     assert pool.active_count >= 1
 
@@ -225,17 +216,22 @@ async def test_reactive_scaling_scopes_spawns_by_project(
     pool, _ = await _attach_pool(ctx, tmp_path, monkeypatch)
     spawned_projects: list[str | None] = []
 
-    async def _fake_spawn(_db, _lock, *, project=None, ignore_cooldown=False):  # noqa: ANN001
+    async def _fake_spawn(_db, _lock, projects, *, ignore_cooldown=False):  # noqa: ANN001
         del ignore_cooldown
-        spawned_projects.append(project)
-        return {
-            "reviewer_id": f"r-{len(spawned_projects)}",
-            "pid": 1000 + len(spawned_projects),
-            "status": "active",
-            "project_scope": project,
-        }
-
-    pool.spawn_reviewer = AsyncMock(side_effect=_fake_spawn)  # type: ignore[method-assign]
+        results = []
+        for project in projects:
+            spawned_projects.append(project)
+            results.append(
+                {
+                    "reviewer_id": f"r-{len(spawned_projects)}",
+                    "pid": 1000 + len(spawned_projects),
+                    "status": "active",
+                    "project_scope": project,
+                }
+            )
+        return results
+
+    pool.spawn_reviewers = AsyncMock(side_effect=_fake_spawn)  # type: ignore[method-assign]
 
     await ctx.lifespan_context.db.execute(
         """INSERT INTO reviews (id, status, intent, agent_type, agent_role, phase, project)
@@ -255,19 +251,10 @@ async def test_proposer_followup_requeue_triggers_reactive_scaling(
     ctx: MockContext, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     pool, spawn_mock = await _attach_pool(ctx, tmp_path, monkeypatch)
-    real_create_task = asyncio.create_task
-    scheduled: list[asyncio.Task] = []
-
-    def _track_task(coro):  # noqa: ANN001
-        task = real_create_task(coro)
-        scheduled.append(task)
-        return task
-
-    monkeypatch.setattr("gsd_review_broker.tools.asyncio.create_task", _track_task)
+    background_tasks = ctx.lifespan_context.background_tasks
 
     created = await _create_review(ctx, intent="followup-scale")
-    await asyncio.gather(*scheduled)
-    scheduled.clear()
+    await asyncio.gather(*background_tasks)
     spawn_mock.reset_mock()
 
     claim = await claim_review.fn(
@@ -291,7 +278,7 @@ async def test_proposer_followup_requeue_triggers_reactive_scaling(
         body="Can you clarify this blocker?",
         ctx=ctx,
     )
-    await asyncio.gather(*scheduled)
+    await asyncio.gather(*background_tasks)
     assert spawn_mock.await_count >= 1
 
 
@@ -508,12 +495,43 @@ async def test_stale_session_recovery_on_startup(ctx: MockContext) -> None:
         "UPDATE reviews SET status='claimed', claimed_by='foreign-r1' WHERE id = ?",
         (created["review_id"],),
     )
-    terminated = await _startup_terminate_stale_reviewers(ctx.lifespan_context)
-    reclaimed = await _startup_ownership_sweep(ctx.lifespan_context)
+    terminated, reclaimed = await _startup_recover_stale_session(ctx.lifespan_context)
     assert terminated >= 1
     assert reclaimed >= 1
 
 
+async def test_startup_recover_stale_session_uses_one_transaction(ctx: MockContext) -> None:
+    ctx.lifespan_context.pool = ReviewerPool(
+        session_token="current-session",
+        config=SpawnConfig(workspace_path=".", model="o4-mini", prompt_template_path="x"),
+    )
+    await _insert_reviewer(ctx, "foreign-r1", session_token="foreign-session", status="active")
+    created = await _create_review(ctx)
+    db = ctx.lifespan_context.db
+    await db.execute(
+        "UPDATE reviews SET status='claimed', claimed_by='foreign-r1' WHERE id = ?",
+        (created["review_id"],),
+    )
+    statements: list[str] = []
+    await db.set_trace_callback(statements.append)
+    result = await _startup_recover_stale_session(ctx.lifespan_context)
+    await db.set_trace_callback(None)
+
+    assert result == (1, 1)
+    assert statements.count("COMMIT") == 1
+    cursor = await db.execute(
+        "SELECT status, claimed_by, claim_generation FROM reviews WHERE id = ?",
+        (created["review_id"],),
+    )
+    row = await cursor.fetchone()
+    assert (row["status"], row["claimed_by"], row["claim_generation"]) == ("pending", None, 1)
+    cursor = await db.execute(
+        "SELECT COUNT(*) AS n FROM audit_events WHERE review_id = ? AND event_type = ?",
+        (created["review_id"], "review_reclaimed"),
+    )
+    assert (await cursor.fetchone())["n"] == 1
+
+
 async def test_startup_reactive_scale_check_spawns_for_pending(
     ctx: MockContext, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -591,9 +609,14 @@ async def test_dead_process_reclaims_claimed_review_then_terminates(
     assert reviewer_id not in pool._processes
 
 
+@pytest.mark.parametrize("has_returning", [True, False])
 async def test_dead_process_with_open_changes_requested_detaches_and_terminates(
-    ctx: MockContext, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ctx: MockContext,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    has_returning: bool,
 ) -> None:
+    monkeypatch.setattr(db_module, "_SQLITE_HAS_RETURNING", has_returning)
     pool, _ = await _attach_pool(ctx, tmp_path, monkeypatch)
     reviewer_id = "dead-r3"
     await _insert_reviewer(ctx, reviewer_id, session_token=pool.session_token, status="active")
@@ -701,6 +724,7 @@ async def test_terminal_verdict_terminates_live_draining_process(
     assert spawned["reviewer_id"] in pool._processes
 
     await close_review.fn(review_id=created["review_id"], closer_role="proposer", ctx=ctx)
+    assert await pool.wait_for_termination(spawned["reviewer_id"], timeout=1.0)
     assert proc.terminated is True
     assert spawned["reviewer_id"] not in pool._processes
 
@@ -741,6 +765,7 @@ async def test_revise_changes_requested_finalizes_draining_reviewer(ctx: MockCon
         ctx=ctx,
     )
     assert revised.get("revised") is True
+    await asyncio.gather(*ctx.lifespan_context.background_tasks)
 
     cursor = await ctx.lifespan_context.db.execute(
         "SELECT status, terminated_at FROM reviewers WHERE id='r-drain'",
@@ -779,7 +804,7 @@ async def test_startup_reclaims_claimed_review_with_missing_reviewer_row(ctx: Mo
         "UPDATE reviews SET status='claimed', claimed_by='missing-row' WHERE id = ?",
         (created["review_id"],),
     )
-    reclaimed = await _startup_ownership_sweep(ctx.lifespan_context)
+    _, reclaimed = await _startup_recover_stale_session(ctx.lifespan_context)
     assert reclaimed == 1
 
 
@@ -794,7 +819,7 @@ async def test_startup_reclaims_claimed_review_from_foreign_session(ctx: MockCon
         "UPDATE reviews SET status='claimed', claimed_by='foreign-r1' WHERE id = ?",
         (created["review_id"],),
     )
-    reclaimed = await _startup_ownership_sweep(ctx.lifespan_context)
+    _, reclaimed = await _startup_recover_stale_session(ctx.lifespan_context)
     assert reclaimed == 1
 
 
@@ -811,7 +836,7 @@ async def test_startup_preserves_claimed_review_from_live_current_session_review
         "UPDATE reviews SET status='claimed', claimed_by='live-r1' WHERE id = ?",
         (created["review_id"],),
     )
-    reclaimed = await _startup_ownership_sweep(ctx.lifespan_context)
+    _, reclaimed = await _startup_recover_stale_session(ctx.lifespan_context)
     assert reclaimed == 0
 
 
@@ -51,6 +51,34 @@ def test_configure_logging_writes_structured_broker_log(
     assert payload["level"] == "info"
 
 
+def test_broker_log_keeps_caller_tag_and_exception_from_emitting_context(
+    monkeypatch,
+    tmp_path: Path,
+) -> None:
+    _reset_broker_logger_handlers()
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+
+    server._configure_logging()
+    logger = logging.getLogger("gsd_review_broker")
+    token = server.caller_tag.set("reviewer-7")
+    try:
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            logger.exception("failed %s", "step")
+    finally:
+        server.caller_tag.reset(token)
+    # Closing the handlers drains the listener thread before the file is read.
+    _reset_broker_logger_handlers()
+
+    log_path = tmp_path / "xdg" / "gsd-review-broker" / "broker-logs" / "broker.jsonl"
+    payload = json.loads(log_path.read_text(encoding="utf-8").splitlines()[-1])
+    assert payload["message"] == "failed step"
+    assert payload["caller_tag"] == "reviewer-7"
+    assert payload["level"] == "error"
+    assert "RuntimeError: boom" in payload["exception"]
+
+
 def test_configure_logging_rotates_broker_log(
     monkeypatch,
     tmp_path: Path,
@@ -125,3 +153,11 @@ def test_periodic_skip_noise_visible_on_console_with_verbose(
 
     assert noisy in stream.getvalue()
     _reset_broker_logger_handlers()
+
+
+def test_json_formatter_timestamp_matches_record_creation_time() -> None:
+    record = logging.LogRecord("gsd_review_broker", logging.INFO, __file__, 1, "hi", None, None)
+    record.created = 1_700_000_000.987654
+    record.msecs = 987.0
+    payload = json.loads(server._JsonFormatter().format(record))
+    assert payload["ts"] == "2023-11-14T22:13:20.987Z"
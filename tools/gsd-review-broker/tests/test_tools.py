@@ -3,9 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import uuid
 from typing import TYPE_CHECKING
 
+import pytest
+
 from gsd_review_broker.tools import (
+    _app_ctx,
+    _begin_immediate,
+    _new_id,
+    _normalize_project_key,
+    _reviewer_tag,
     claim_review,
     close_review,
     create_review,
@@ -452,6 +460,69 @@ class TestCloseReview:
         assert "not found" in result["error"]
 
 
+# ---- Caller helpers ----
+
+
+class TestCallerHelpers:
+    @pytest.mark.parametrize(
+        ("reviewer_id", "expected"),
+        [
+            ("codex-r1-b6c93011", "codex-r1"),
+            ("codex-r1-B6C93011DEAD", "codex-r1"),
+            ("codex-r1-b6c9301", "codex-r1-b6c9301"),
+            ("codex-r1-b6c9301z", "codex-r1-b6c9301z"),
+            ("-b6c93011", "-b6c93011"),
+            ("reviewer-agent", "reviewer-agent"),
+            ("", "reviewer"),
+        ],
+    )
+    def test_reviewer_tag_strips_session_suffix(self, reviewer_id: str, expected: str) -> None:
+        assert _reviewer_tag(reviewer_id) == expected
+
+    def test_app_ctx_resolves_each_context_shape(self) -> None:
+        class _Direct:
+            def __init__(self, app: object) -> None:
+                self.lifespan_context = app
+
+        class _Request:
+            def __init__(self, app: object | None) -> None:
+                if app is not None:
+                    self.request_context = _Direct(app)
+
+        app = object()
+        assert _app_ctx(_Direct(app)) is app
+        assert _app_ctx(_Request(app)) is app
+        with pytest.raises(RuntimeError, match="Unable to resolve"):
+            _app_ctx(_Request(None))
+
+    async def test_begin_immediate_opens_transaction_with_first_read(
+        self, ctx: MockContext
+    ) -> None:
+        created = await _create_review(ctx)
+        app = ctx.lifespan_context
+        row = await _begin_immediate(
+            app, "SELECT status FROM reviews WHERE id = ?", (created["review_id"],)
+        )
+        try:
+            assert app.db.in_transaction
+            assert row["status"] == "pending"
+        finally:
+            await app.db.execute("ROLLBACK")
+
+    def test_new_id_yields_unique_uuid4_hex(self) -> None:
+        ids = [_new_id() for _ in range(600)]
+        assert len(set(ids)) == len(ids)
+        for value in ids:
+            parsed = uuid.UUID(hex=value)
+            assert parsed.hex == value
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+
+    def test_normalize_project_key(self) -> None:
+        assert _normalize_project_key("  GSD_Tandem-2 ") == "gsdtandem2"
+        assert _normalize_project_key(None) == ""
+
+
 # ---- Full lifecycle test ----
 
 
@@ -0,0 +1,139 @@
+"""Tests for the FIFO write lock and group-commit batcher."""
+
+from __future__ import annotations
+
+import asyncio
+
+import aiosqlite
+import pytest
+
+from gsd_review_broker.write_batcher import WriteBatcher
+
+
+async def _insert_reviewer(db: aiosqlite.Connection, reviewer_id: str) -> str:
+    await db.execute(
+        """INSERT INTO reviewers (id, display_name, session_token, status)
+           VALUES (?, ?, 'tok', 'active')""",
+        (reviewer_id, reviewer_id),
+    )
+    return reviewer_id
+
+
+async def _reviewer_ids(db: aiosqlite.Connection) -> list[str]:
+    cursor = await db.execute("SELECT id FROM reviewers ORDER BY id")
+    return [row["id"] for row in await cursor.fetchall()]
+
+
+class TestGroupCommit:
+    async def test_submit_returns_callback_result(self, db: aiosqlite.Connection) -> None:
+        batcher = WriteBatcher(db)
+        result = await batcher.submit(lambda conn: _insert_reviewer(conn, "r1"))
+        assert result == "r1"
+        assert await _reviewer_ids(db) == ["r1"]
+
+    async def test_concurrent_submits_share_one_transaction(
+        self, db: aiosqlite.Connection
+    ) -> None:
+        batcher = WriteBatcher(db, max_batch_size=16, max_wait_ms=5.0)
+        statements: list[str] = []
+        await db.set_trace_callback(statements.append)
+
+        await asyncio.gather(
+            *(batcher.submit(lambda conn, i=i: _insert_reviewer(conn, f"r{i}")) for i in range(5))
+        )
+
+        await db.set_trace_callback(None)
+        assert await _reviewer_ids(db) == [f"r{i}" for i in range(5)]
+        assert statements.count("BEGIN IMMEDIATE") == 1
+        assert statements.count("COMMIT") == 1
+
+    async def test_batch_size_is_bounded(self, db: aiosqlite.Connection) -> None:
+        batcher = WriteBatcher(db, max_batch_size=2, max_wait_ms=5.0)
+        statements: list[str] = []
+        await db.set_trace_callback(statements.append)
+
+        await asyncio.gather(
+            *(batcher.submit(lambda conn, i=i: _insert_reviewer(conn, f"r{i}")) for i in range(5))
+        )
+
+        await db.set_trace_callback(None)
+        assert statements.count("COMMIT") == 3
+
+    async def test_failing_callback_is_isolated(self, db: aiosqlite.Connection) -> None:
+        batcher = WriteBatcher(db, max_wait_ms=5.0)
+
+        async def _fail(conn: aiosqlite.Connection) -> None:
+            await _insert_reviewer(conn, "doomed")
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            batcher.submit(lambda conn: _insert_reviewer(conn, "before")),
+            batcher.submit(_fail),
+            batcher.submit(lambda conn: _insert_reviewer(conn, "after")),
+            return_exceptions=True,
+        )
+
+        assert results[0] == "before"
+        assert isinstance(results[1], ValueError)
+        assert results[2] == "after"
+        assert await _reviewer_ids(db) == ["after", "before"]
+
+    async def test_submit_while_holding_lock_raises(self, db: aiosqlite.Connection) -> None:
+        batcher = WriteBatcher(db)
+        async with batcher:
+            with pytest.raises(RuntimeError):
+                await batcher.submit(lambda conn: _insert_reviewer(conn, "r1"))
+
+    async def test_aclose_waits_for_pending_submits(self, db: aiosqlite.Connection) -> None:
+        batcher = WriteBatcher(db, max_wait_ms=5.0)
+        task = asyncio.create_task(batcher.submit(lambda conn: _insert_reviewer(conn, "r1")))
+        await asyncio.sleep(0)
+        await batcher.aclose()
+        assert task.done()
+        assert await _reviewer_ids(db) == ["r1"]
+
+
+class TestFifoLock:
+    async def test_context_manager_serializes_in_arrival_order(
+        self, db: aiosqlite.Connection
+    ) -> None:
+        batcher = WriteBatcher(db)
+        order: list[int] = []
+
+        async def _writer(index: int) -> None:
+            async with batcher:
+                order.append(index)
+                await asyncio.sleep(0)
+
+        await batcher.acquire()
+        tasks = [asyncio.create_task(_writer(i)) for i in range(4)]
+        await asyncio.sleep(0)
+        batcher.release()
+        await asyncio.gather(*tasks)
+
+        assert order == [0, 1, 2, 3]
+        assert not batcher.locked()
+
+    async def test_cancelled_waiter_does_not_block_queue(
+        self, db: aiosqlite.Connection
+    ) -> None:
+        batcher = WriteBatcher(db)
+        await batcher.acquire()
+        cancelled = asyncio.create_task(batcher.acquire())
+        follower = asyncio.create_task(batcher.acquire())
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        batcher.release()
+        await asyncio.wait_for(follower, timeout=1.0)
+
+        assert batcher.locked()
+        batcher.release()
+        assert not batcher.locked()
+
+    async def test_release_without_acquire_raises(self, db: aiosqlite.Connection) -> None:
+        batcher = WriteBatcher(db)
+        with pytest.raises(RuntimeError):
+            batcher.release()